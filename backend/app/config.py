@@ -32,6 +32,9 @@ class Settings(BaseSettings):
     jwt_secret_key: str = "change_this_secret_key"
     jwt_algorithm: str = "HS256"
     jwt_expiration_minutes: int = 60
+    weather_cache_ttl_seconds: int = 600
+    max_concurrent_requests: int = 32
+    gemini_cache_ttl_seconds: int = 900
     
     # Logging
     log_level: str = "INFO"
@@ -1,4 +1,5 @@
 """FastAPI application entry point"""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.routers import weather, analytics, gemini, auth,geolocation
@@ -27,10 +28,22 @@ config_dict = {
 }
 log_startup_configuration(config_dict)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release shared service resources on shutdown"""
+    yield
+    # Only close a collector that was actually created; calling the cached
+    # provider here would build one just to close it
+    if weather.get_data_collector.cache_info().currsize:
+        await weather.get_data_collector().api_client.aclose()
+
+
 app = FastAPI(
     title="Weather Prediction System API",
     description="ML-powered weather forecasting with real-time analytics",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -1,7 +1,7 @@
 """Core data models for the Weather Prediction System"""
 from dataclasses import dataclass
 from datetime import datetime, date
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 
@@ -13,6 +13,7 @@ class Location(BaseModel):
     longitude: float = Field(..., ge=-180, le=180, description="Longitude coordinate")
     city: str = Field(..., min_length=1, max_length=255, description="City name")
     country: str = Field(..., min_length=1, max_length=100, description="Country name")
+    city_id: Optional[int] = Field(None, description="OpenWeatherMap city ID, enables batched collection")
 
     class Config:
         json_schema_extra = {
@@ -163,7 +164,7 @@ class WeatherWarning(BaseModel):
     severity: str = Field(..., description="Severity level: low, moderate, high, severe")
     title: str = Field(..., min_length=1, max_length=255, description="Warning title")
     description: str = Field(..., min_length=1, description="Warning description")
-    safety_recommendations: List[str] = Field(..., min_length=1, description="Safety recommendations")
+    safety_recommendations: Sequence[str] = Field(..., min_length=1, description="Safety recommendations")
     start_time: datetime
     end_time: datetime
     issued_at: datetime
@@ -247,6 +248,13 @@ class ChartData(BaseModel):
     labels: List[str] = Field(..., description="X-axis labels")
     datasets: List[dict] = Field(..., description="Data series for chart")
 
+    def fast_dump(self) -> dict:
+        """Dump to a plain dict without re-walking the validated fields
+
+        The labels and datasets lists are shared with the model, not copied.
+        """
+        return {"labels": self.labels, "datasets": self.datasets}
+
     class Config:
         json_schema_extra = {
             "example": {
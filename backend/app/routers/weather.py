@@ -1,5 +1,7 @@
 """Weather and forecast API endpoints"""
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from collections import Counter
+from functools import lru_cache
 from typing import List, Optional
 from datetime import datetime, date
 import httpx
@@ -17,10 +19,24 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["weather"])
 
-# Initialize services (in production, use dependency injection)
-predictor = WeatherPredictor()
-data_collector = WeatherDataCollector()
-warning_generator = WarningGenerator()
+
+# Services are created lazily on first use and shared for the process lifetime
+@lru_cache(maxsize=1)
+def get_predictor() -> WeatherPredictor:
+    """Return the shared predictor instance"""
+    return WeatherPredictor()
+
+
+@lru_cache(maxsize=1)
+def get_data_collector() -> WeatherDataCollector:
+    """Return the shared data collector instance"""
+    return WeatherDataCollector()
+
+
+@lru_cache(maxsize=1)
+def get_warning_generator() -> WarningGenerator:
+    """Return the shared warning generator instance"""
+    return WarningGenerator()
 
 
 def normalize_country_name(value: str) -> Optional[str]:
@@ -79,7 +95,7 @@ async def geocode_city(city: str, country: Optional[str] = None) -> Optional[dic
             
             # Handle 404 specifically
             if response.status_code == 404:
-                logger.info(f"Location not found: {city}")
+                logger.info("Location not found: %s", city)
                 return None
             
             response.raise_for_status()
@@ -93,12 +109,12 @@ async def geocode_city(city: str, country: Optional[str] = None) -> Optional[dic
                 lon = location_data.get("lon")
                 
                 if lat is None or lon is None:
-                    logger.warning(f"Location '{city}' has no coordinates")
+                    logger.warning("Location '%s' has no coordinates", city)
                     return None
                 
                 # Ensure coordinates are valid ranges
                 if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
-                    logger.warning(f"Invalid coordinates for '{city}': lat={lat}, lon={lon}")
+                    logger.warning("Invalid coordinates for '%s': lat=%s, lon=%s", city, lat, lon)
                     return None
                 
                 return {
@@ -109,17 +125,17 @@ async def geocode_city(city: str, country: Optional[str] = None) -> Optional[dic
                 }
             
             # Empty result array means location not found
-            logger.info(f"No results found for location: {city}")
+            logger.info("No results found for location: %s", city)
             return None
             
     except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error during geocoding: {e.response.status_code} - {e}")
+        logger.error("HTTP error during geocoding: %s - %s", e.response.status_code, e)
         return None
     except httpx.TimeoutException:
-        logger.error(f"Timeout while geocoding: {city}")
+        logger.error("Timeout while geocoding: %s", city)
         return None
     except Exception as e:
-        logger.error(f"Geocoding error for '{city}': {e}")
+        logger.error("Geocoding error for '%s': %s", city, e)
         return None
 
 
@@ -150,7 +166,7 @@ async def fetch_current_weather_from_api(lat: float, lon: float) -> Optional[dic
             
             # Handle 404 specifically
             if response.status_code == 404:
-                logger.warning(f"Weather not found for coordinates: {lat}, {lon}")
+                logger.warning("Weather not found for coordinates: %s, %s", lat, lon)
                 return None
             
             response.raise_for_status()
@@ -160,17 +176,17 @@ async def fetch_current_weather_from_api(lat: float, lon: float) -> Optional[dic
             if "coord" in data and "lat" in data["coord"] and "lon" in data["coord"]:
                 return data
             else:
-                logger.warning(f"Weather data missing coordinates for {lat}, {lon}")
+                logger.warning("Weather data missing coordinates for %s, %s", lat, lon)
                 return None
                 
     except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error fetching weather: {e.response.status_code} - {e}")
+        logger.error("HTTP error fetching weather: %s - %s", e.response.status_code, e)
         return None
     except httpx.TimeoutException:
-        logger.error(f"Timeout fetching weather for {lat}, {lon}")
+        logger.error("Timeout fetching weather for %s, %s", lat, lon)
         return None
     except Exception as e:
-        logger.error(f"Weather API error: {e}")
+        logger.error("Weather API error: %s", e)
         return None
 
 
@@ -201,7 +217,7 @@ async def fetch_forecast_from_api(lat: float, lon: float) -> Optional[dict]:
             response.raise_for_status()
             return response.json()
     except Exception as e:
-        logger.error(f"Forecast API error: {e}")
+        logger.error("Forecast API error: %s", e)
         return None
 
 
@@ -219,41 +235,40 @@ def parse_forecast_data(api_data: dict, location: Location, days: int) -> List[F
     forecasts = []
     daily_data = {}
     
-    # Group forecast data by date
+    # Group forecast data by date, keeping running aggregates per day
     for item in api_data.get("list", []):
-        dt = datetime.fromtimestamp(item["dt"])
-        date_key = dt.date()
-        
-        if date_key not in daily_data:
-            daily_data[date_key] = {
-                "temps": [],
-                "conditions": [],
-                "precipitation_probs": [],
-                "timestamps": []
+        date_key = datetime.fromtimestamp(item["dt"]).date()
+        
+        day = daily_data.get(date_key)
+        if day is None:
+            day = daily_data[date_key] = {
+                "tmax": float("-inf"),
+                "tmin": float("inf"),
+                "psum": 0.0,
+                "pcnt": 0,
+                "cond": Counter()
             }
         
-        daily_data[date_key]["temps"].append(item["main"]["temp"])
-        daily_data[date_key]["conditions"].append(item["weather"][0]["main"])
-        daily_data[date_key]["precipitation_probs"].append(item.get("pop", 0))
-        daily_data[date_key]["timestamps"].append(dt)
+        temp = item["main"]["temp"]
+        if temp > day["tmax"]:
+            day["tmax"] = temp
+        if temp < day["tmin"]:
+            day["tmin"] = temp
+        day["psum"] += item.get("pop", 0)
+        day["pcnt"] += 1
+        day["cond"][item["weather"][0]["main"]] += 1
     
     # Create Forecast objects for each day
     for forecast_date in sorted(daily_data.keys())[:days]:
-        day_data = daily_data[forecast_date]
-        temps = day_data["temps"]
-        conditions = day_data["conditions"]
-        probs = day_data["precipitation_probs"]
-        
-        # Get most common condition
-        most_common_condition = max(set(conditions), key=conditions.count)
+        day = daily_data[forecast_date]
         
         forecast = Forecast(
             location=location,
             forecast_date=forecast_date,
-            predicted_temperature_high=max(temps),
-            predicted_temperature_low=min(temps),
-            precipitation_probability=sum(probs) / len(probs) if probs else 0,
-            weather_condition=most_common_condition,
+            predicted_temperature_high=day["tmax"],
+            predicted_temperature_low=day["tmin"],
+            precipitation_probability=day["psum"] / day["pcnt"] if day["pcnt"] else 0,
+            weather_condition=day["cond"].most_common(1)[0][0],
             confidence_score=0.85,  # Default confidence
             generated_at=datetime.now()
         )
@@ -266,7 +281,8 @@ def parse_forecast_data(api_data: dict, location: Location, days: int) -> List[F
 async def get_forecast(
     city: str,
     country: Optional[str] = Query(None, description="Country name"),
-    days: int = Query(7, ge=1, le=14, description="Number of days to forecast")
+    days: int = Query(7, ge=1, le=14, description="Number of days to forecast"),
+    predictor: WeatherPredictor = Depends(get_predictor)
 ):
     """
     Get weather forecast for a location
@@ -313,7 +329,7 @@ async def get_forecast(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error generating forecast: {e}")
+        logger.error("Error generating forecast: %s", e)
         raise HTTPException(status_code=500, detail=f"Error generating forecast: {str(e)}")
 
 
@@ -380,14 +396,16 @@ async def get_current_weather(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching current weather: {e}")
+        logger.error("Error fetching current weather: %s", e)
         raise HTTPException(status_code=500, detail=f"Error fetching current weather: {str(e)}")
 
 
 @router.get("/warnings/{city}", response_model=List[WeatherWarning])
 async def get_weather_warnings(
     city: str,
-    country: Optional[str] = Query(None, description="Country name")
+    country: Optional[str] = Query(None, description="Country name"),
+    predictor: WeatherPredictor = Depends(get_predictor),
+    warning_generator: WarningGenerator = Depends(get_warning_generator)
 ):
     """
     Get active weather warnings for a location
@@ -419,17 +437,12 @@ async def get_weather_warnings(
         forecasts = predictor.predict(location, days=7)
         
         # Generate warnings from forecasts
-        warnings = []
-        for forecast in forecasts:
-            forecast_warnings = warning_generator.analyze_forecast([forecast])
-            warnings.extend(forecast_warnings)
-        
-        return warnings
+        return warning_generator.analyze_forecasts_batch(forecasts)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching warnings: {e}")
+        logger.error("Error fetching warnings: %s", e)
         raise HTTPException(status_code=500, detail=f"Error fetching warnings: {str(e)}")
 
 
@@ -437,7 +450,8 @@ async def get_weather_warnings(
 async def get_forecast_by_coordinates(
     lat: float = Query(..., ge=-90, le=90, description="Latitude"),
     lon: float = Query(..., ge=-180, le=180, description="Longitude"),
-    days: int = Query(7, ge=1, le=14, description="Number of days to forecast")
+    days: int = Query(7, ge=1, le=14, description="Number of days to forecast"),
+    predictor: WeatherPredictor = Depends(get_predictor)
 ):
     """
     Get weather forecast by coordinates
@@ -469,7 +483,7 @@ async def get_forecast_by_coordinates(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error generating forecast: {e}")
+        logger.error("Error generating forecast: %s", e)
         raise HTTPException(status_code=500, detail=f"Error generating forecast: {str(e)}")
 
 
@@ -568,5 +582,5 @@ async def get_hourly_forecast(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching hourly forecast: {e}")
+        logger.error("Error fetching hourly forecast: %s", e)
         raise HTTPException(status_code=500, detail=f"Error fetching hourly forecast: {str(e)}")
@@ -1,16 +1,114 @@
 """Accuracy tracking system for validating weather predictions"""
+import bisect
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from datetime import datetime, timedelta, date
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
-from statistics import mean
 import math
+import numpy as np
 from app.models import WeatherData, Forecast, AccuracyMetrics, Location
 
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; fall back to Python/NumPy kernels
+    numba = None
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _jit(func):
+    """Compile a scalar kernel with Numba when available"""
+    if NUMBA_AVAILABLE:
+        return numba.njit(cache=True)(func)
+    return func
+
+
+@_jit
+def _temperature_accuracy(predicted: float, actual: float) -> Tuple[float, float]:
+    """Temperature accuracy kernel: linear from 100% at 0°C to 0% at 10°C error"""
+    absolute_error = abs(predicted - actual)
+    return max(0.0, 1.0 - (absolute_error / 10.0)), absolute_error
+
+
+@_jit
+def _precipitation_accuracy(predicted_prob: float, actual_precip: float) -> Tuple[float, float]:
+    """Precipitation accuracy kernel: 10mm+ of rain counts as 100% probability"""
+    actual_prob = min(1.0, actual_precip / 10.0)
+    probability_error = abs(predicted_prob - actual_prob)
+    return max(0.0, 1.0 - probability_error), probability_error
+
+
+@_jit
+def _overall_accuracy(temperature_acc: float, precipitation_acc: float, condition_acc: float,
+                      temperature_weight: float, precipitation_weight: float,
+                      condition_weight: float) -> float:
+    """Weighted overall accuracy kernel"""
+    return (temperature_acc * temperature_weight +
+            precipitation_acc * precipitation_weight +
+            condition_acc * condition_weight)
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, parallel=True)
+    def _accuracy_batch(predicted_temps, actual_temps, predicted_probs, actual_precips,
+                        condition_acc, temperature_weight, precipitation_weight, condition_weight):
+        """Fused per-element accuracy kernel over aligned arrays"""
+        n = predicted_temps.shape[0]
+        accuracy = np.empty(n)
+        temperature_error = np.empty(n)
+        precipitation_error = np.empty(n)
+        for i in numba.prange(n):
+            temperature_acc, temp_err = _temperature_accuracy(predicted_temps[i], actual_temps[i])
+            precipitation_acc, precip_err = _precipitation_accuracy(predicted_probs[i], actual_precips[i])
+            temperature_error[i] = temp_err
+            precipitation_error[i] = precip_err
+            accuracy[i] = _overall_accuracy(
+                temperature_acc, precipitation_acc, condition_acc[i],
+                temperature_weight, precipitation_weight, condition_weight
+            )
+        return accuracy, temperature_error, precipitation_error
+else:
+    def _accuracy_batch(predicted_temps, actual_temps, predicted_probs, actual_precips,
+                        condition_acc, temperature_weight, precipitation_weight, condition_weight):
+        """Per-element accuracy over aligned arrays using NumPy"""
+        temperature_error = np.abs(predicted_temps - actual_temps)
+        temperature_acc = np.maximum(0.0, 1.0 - temperature_error / 10.0)
+        actual_probs = np.minimum(1.0, actual_precips / 10.0)
+        precipitation_error = np.abs(predicted_probs - actual_probs)
+        precipitation_acc = np.maximum(0.0, 1.0 - precipitation_error)
+        accuracy = (temperature_acc * temperature_weight +
+                    precipitation_acc * precipitation_weight +
+                    condition_acc * condition_weight)
+        return accuracy, temperature_error, precipitation_error
+
+
+# Weather condition -> group id; conditions in the same group count as a partial match
+_COND_TO_GROUP: Mapping[str, int] = MappingProxyType({
+    'clear': 0, 'sunny': 0,
+    'cloudy': 1, 'partly cloudy': 1, 'overcast': 1,
+    'rainy': 2, 'drizzle': 2, 'showers': 2,
+    'stormy': 3, 'thunderstorm': 3, 'severe': 3,
+    'snowy': 4, 'snow': 4, 'blizzard': 4
+})
+
+
+def _location_key(latitude: float, longitude: float) -> int:
+    """Pack a coordinate pair into a single integer key (1e-5 degree resolution)
+    
+    Args:
+        latitude: Latitude coordinate
+        longitude: Longitude coordinate
+        
+    Returns:
+        Integer key identifying the location
+    """
+    return (round(latitude * 1e5) << 32) | (round(longitude * 1e5) & 0xFFFFFFFF)
+
+
+@dataclass(slots=True, frozen=True)
 class PredictionOutcome:
     """Represents a prediction and its actual outcome for accuracy calculation"""
     forecast: Forecast
@@ -21,6 +119,487 @@ class PredictionOutcome:
     condition_match: bool
 
 
+def _outcome_time(outcome: PredictionOutcome) -> float:
+    """Return the POSIX timestamp of an outcome's actual observation"""
+    return outcome.actual_weather.timestamp.timestamp()
+
+
+@dataclass
+class _StatsAccumulator:
+    """Running sums over a group of prediction outcomes"""
+    count: int = 0
+    sum_accuracy: float = 0.0
+    sum_temperature_error: float = 0.0
+    sum_temperature_error_sq: float = 0.0
+    sum_precipitation_error: float = 0.0
+    sum_condition_match: int = 0
+
+    def add(self, accuracy: float, temperature_error: float,
+            precipitation_error: float, condition_match: bool) -> None:
+        """Accumulate a single outcome"""
+        self.count += 1
+        self.sum_accuracy += accuracy
+        self.sum_temperature_error += temperature_error
+        self.sum_temperature_error_sq += temperature_error * temperature_error
+        self.sum_precipitation_error += precipitation_error
+        self.sum_condition_match += bool(condition_match)
+
+    def remove(self, accuracy: float, temperature_error: float,
+               precipitation_error: float, condition_match: bool) -> None:
+        """Remove a single previously accumulated outcome"""
+        self.count -= 1
+        self.sum_accuracy -= accuracy
+        self.sum_temperature_error -= temperature_error
+        self.sum_temperature_error_sq -= temperature_error * temperature_error
+        self.sum_precipitation_error -= precipitation_error
+        self.sum_condition_match -= bool(condition_match)
+
+    def add_arrays(self, accuracy: np.ndarray, temperature_error: np.ndarray,
+                   precipitation_error: np.ndarray, condition_match: np.ndarray) -> None:
+        """Accumulate a batch of outcomes given as aligned arrays"""
+        self.count += len(accuracy)
+        self.sum_accuracy += float(accuracy.sum())
+        self.sum_temperature_error += float(temperature_error.sum())
+        self.sum_temperature_error_sq += float(np.dot(temperature_error, temperature_error))
+        self.sum_precipitation_error += float(precipitation_error.sum())
+        self.sum_condition_match += int(np.count_nonzero(condition_match))
+
+    @property
+    def precipitation_accuracy(self) -> float:
+        """Mean precipitation accuracy, derived as 1 - mean error from the running sum"""
+        if self.count == 0:
+            return 0.0
+        # Clamp both ends: subtracting expired rows can leave the sum slightly negative
+        return min(1.0, max(0.0, 1.0 - self.sum_precipitation_error / self.count))
+
+    def merge(self, other: '_StatsAccumulator') -> None:
+        """Fold another accumulator into this one"""
+        self.count += other.count
+        self.sum_accuracy += other.sum_accuracy
+        self.sum_temperature_error += other.sum_temperature_error
+        self.sum_temperature_error_sq += other.sum_temperature_error_sq
+        self.sum_precipitation_error += other.sum_precipitation_error
+        self.sum_condition_match += other.sum_condition_match
+
+
+class _LocationRows:
+    """Growable, time-ordered arrays of the rows recorded for one location"""
+    
+    def __init__(self, capacity: int = 16):
+        """Initialize empty buffers
+        
+        Args:
+            capacity: Initial number of rows to allocate
+        """
+        self._seqs = np.empty(capacity, dtype=np.int64)
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        """Number of live rows"""
+        return self._end - self._start
+
+    @property
+    def seqs(self) -> np.ndarray:
+        """Sequence numbers of the live rows"""
+        return self._seqs[self._start:self._end]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Observation timestamps of the live rows"""
+        return self._timestamps[self._start:self._end]
+
+    def append(self, seq: int, timestamp: float) -> None:
+        """Append a row, compacting or doubling the buffers when full"""
+        if self._end == len(self._seqs):
+            self._reserve()
+        
+        self._seqs[self._end] = seq
+        self._timestamps[self._end] = timestamp
+        self._end += 1
+
+    def insert(self, seq: int, timestamp: float) -> None:
+        """Insert a row at its sequence position, shifting later rows up one slot"""
+        offset = int(np.searchsorted(self.seqs, seq, side='left'))
+        if offset == len(self):
+            self.append(seq, timestamp)
+            return
+        if self._end == len(self._seqs):
+            self._reserve()
+        
+        i = self._start + offset
+        self._seqs[i + 1:self._end + 1] = self._seqs[i:self._end]
+        self._timestamps[i + 1:self._end + 1] = self._timestamps[i:self._end]
+        self._seqs[i] = seq
+        self._timestamps[i] = timestamp
+        self._end += 1
+
+    def shift_from(self, seq: int) -> None:
+        """Renumber rows at or after seq one sequence number later"""
+        offset = int(np.searchsorted(self.seqs, seq, side='left'))
+        self._seqs[self._start + offset:self._end] += 1
+
+    def _reserve(self) -> None:
+        """Make room for one more row, compacting before doubling"""
+        live = len(self)
+        capacity = len(self._seqs) if self._start >= live else 2 * len(self._seqs)
+        seqs = np.empty(capacity, dtype=np.int64)
+        timestamps = np.empty(capacity, dtype=np.float64)
+        seqs[:live] = self.seqs
+        timestamps[:live] = self.timestamps
+        self._seqs, self._timestamps = seqs, timestamps
+        self._start, self._end = 0, live
+
+    def drop_before(self, seq: int) -> None:
+        """Drop rows whose sequence number is below seq"""
+        self._start += int(np.searchsorted(self.seqs, seq, side='left'))
+
+
+class _OutcomeList(list):
+    """List of prediction outcomes that counts its own mutations
+    
+    The tracker compares the count with the one its columnar store was built
+    at, so any direct edit to the list, including replacing an item in place,
+    triggers a rebuild on the next read.
+    """
+    
+    def __init__(self, outcomes=()):
+        super().__init__(outcomes)
+        self.mutations = 0
+
+    def append(self, outcome):
+        self.mutations += 1
+        super().append(outcome)
+
+    def extend(self, outcomes):
+        self.mutations += 1
+        super().extend(outcomes)
+
+    def insert(self, index, outcome):
+        self.mutations += 1
+        super().insert(index, outcome)
+
+    def pop(self, index=-1):
+        self.mutations += 1
+        return super().pop(index)
+
+    def remove(self, outcome):
+        self.mutations += 1
+        super().remove(outcome)
+
+    def clear(self):
+        self.mutations += 1
+        super().clear()
+
+    def sort(self, *, key=None, reverse=False):
+        self.mutations += 1
+        super().sort(key=key, reverse=reverse)
+
+    def reverse(self):
+        self.mutations += 1
+        super().reverse()
+
+    def __setitem__(self, index, value):
+        self.mutations += 1
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self.mutations += 1
+        super().__delitem__(index)
+
+    def __iadd__(self, outcomes):
+        self.mutations += 1
+        return super().__iadd__(outcomes)
+
+    def __imul__(self, count):
+        self.mutations += 1
+        return super().__imul__(count)
+
+
+class _OutcomeColumns:
+    """Structure-of-arrays store mirroring a chronologically sorted list of outcomes
+    
+    Each outcome field lives in its own contiguous NumPy buffer so that window
+    filters and aggregates run as array operations, and time cutoffs are found
+    with a binary search over the sorted timestamps. Buffers grow geometrically.
+    Running sums are also kept per (location, local day) so that window metrics
+    only have to merge daily buckets plus the rows of the partial boundary day.
+    
+    Rows are addressed internally by a monotonically increasing sequence number.
+    Dropping expired rows only advances the head sequence and touches the
+    dropped rows; the buffers are compacted once dead rows outnumber live ones.
+    """
+    
+    FIELDS = (
+        ('timestamp', np.float64),   # POSIX seconds of the actual observation
+        ('day', np.int32),           # Local calendar day ordinal of the observation
+        ('latitude', np.float64),
+        ('longitude', np.float64),
+        ('accuracy', np.float64),
+        ('temperature_error', np.float64),
+        ('precipitation_error', np.float64),
+        ('condition_match', np.bool_),
+    )
+    
+    def __init__(self, capacity: int = 64):
+        """Initialize empty column buffers
+        
+        Args:
+            capacity: Initial number of rows to allocate
+        """
+        self._buffers: Dict[str, np.ndarray] = {
+            name: np.empty(max(1, capacity), dtype=dtype) for name, dtype in self.FIELDS
+        }
+        self._base = 0   # Sequence number stored at buffer position 0
+        self._head = 0   # Sequence number of the oldest live row
+        self._tail = 0   # Sequence number the next appended row will get
+        # Packed location key -> that location's rows in time order
+        self.location_index: Dict[int, _LocationRows] = {}
+        # Packed location key (None for all locations) -> day ordinal -> running sums,
+        # with days kept in chronological order
+        self.daily_stats: Dict[Optional[int], Dict[int, _StatsAccumulator]] = {None: {}}
+
+    @classmethod
+    def from_outcomes(cls, outcomes: List[PredictionOutcome]) -> '_OutcomeColumns':
+        """Build column buffers from a list of outcomes
+        
+        Args:
+            outcomes: Prediction outcomes to copy into columns, in chronological order
+            
+        Returns:
+            Populated _OutcomeColumns instance
+        """
+        columns = cls(capacity=max(64, len(outcomes)))
+        for outcome in outcomes:
+            columns.append(outcome)
+        return columns
+
+    @property
+    def size(self) -> int:
+        """Number of live rows"""
+        return self._tail - self._head
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Return a view of the live rows of a column"""
+        return self._buffers[name][self._head - self._base:self._tail - self._base]
+
+    def append(self, outcome: PredictionOutcome) -> None:
+        """Append one outcome, making room in the buffers when full
+        
+        The outcome must not be older than the last stored row.
+        
+        Args:
+            outcome: Prediction outcome to append
+        """
+        if self._tail - self._base == len(self._buffers['timestamp']):
+            self._reserve()
+        
+        self._write_row(self._tail - self._base, outcome)
+        self._index_row(self._tail)
+        self._tail += 1
+
+    def insert(self, outcome: PredictionOutcome) -> None:
+        """Insert one outcome at its chronological position
+        
+        Later rows move up one buffer slot and one sequence number, so the
+        cost is a shift of the newer rows rather than a rebuild of the store.
+        An outcome sharing a timestamp with stored rows goes after them.
+        
+        Args:
+            outcome: Prediction outcome to insert
+        """
+        position = int(np.searchsorted(self['timestamp'], _outcome_time(outcome), side='right'))
+        if position == self.size:
+            self.append(outcome)
+            return
+        if self._tail - self._base == len(self._buffers['timestamp']):
+            self._reserve()
+        
+        i = self._head - self._base + position
+        end = self._tail - self._base
+        for buffer in self._buffers.values():
+            buffer[i + 1:end + 1] = buffer[i:end]
+        self._write_row(i, outcome)
+        
+        seq = self._head + position
+        for rows in self.location_index.values():
+            rows.shift_from(seq)
+        self._tail += 1
+        self._index_row(seq)
+
+    def _write_row(self, i: int, outcome: PredictionOutcome) -> None:
+        """Write an outcome's fields into buffer position i"""
+        location = outcome.forecast.location
+        timestamp = _outcome_time(outcome)
+        buffers = self._buffers
+        buffers['timestamp'][i] = timestamp
+        buffers['day'][i] = date.fromtimestamp(timestamp).toordinal()
+        buffers['latitude'][i] = location.latitude
+        buffers['longitude'][i] = location.longitude
+        buffers['accuracy'][i] = outcome.accuracy_score
+        buffers['temperature_error'][i] = outcome.temperature_error
+        buffers['precipitation_error'][i] = outcome.precipitation_error
+        buffers['condition_match'][i] = outcome.condition_match
+
+    def _row(self, seq: int) -> Tuple[int, int, Tuple[float, float, float, bool]]:
+        """Return (location key, day ordinal, accumulator values) for a row"""
+        buffers = self._buffers
+        i = seq - self._base
+        key = _location_key(float(buffers['latitude'][i]), float(buffers['longitude'][i]))
+        values = (
+            float(buffers['accuracy'][i]),
+            float(buffers['temperature_error'][i]),
+            float(buffers['precipitation_error'][i]),
+            bool(buffers['condition_match'][i])
+        )
+        return key, int(buffers['day'][i]), values
+
+    def _index_row(self, seq: int) -> None:
+        """Record a row in the location index and daily accumulators"""
+        key, day, values = self._row(seq)
+        
+        rows = self.location_index.get(key)
+        if rows is None:
+            rows = self.location_index[key] = _LocationRows()
+        rows.insert(seq, float(self._buffers['timestamp'][seq - self._base]))
+        for stats_key in (None, key):
+            by_day = self.daily_stats.setdefault(stats_key, {})
+            accumulator = by_day.get(day)
+            if accumulator is None:
+                accumulator = _StatsAccumulator()
+                if by_day and day < next(reversed(by_day)):
+                    # A late row opened an earlier day; keep the days in order
+                    by_day[day] = accumulator
+                    by_day = self.daily_stats[stats_key] = dict(sorted(by_day.items()))
+                else:
+                    by_day[day] = accumulator
+            accumulator.add(*values)
+
+    def window_stats(self, cutoff: float, location_key: Optional[int] = None) -> _StatsAccumulator:
+        """Aggregate outcomes observed at or after a cutoff
+        
+        Whole days after the cutoff day come from the daily accumulators; only
+        the rows of the cutoff day itself are inspected individually.
+        
+        Args:
+            cutoff: Earliest POSIX timestamp to include
+            location_key: Optional packed location key filter
+            
+        Returns:
+            _StatsAccumulator for the window
+        """
+        boundary_day = date.fromtimestamp(cutoff).toordinal()
+        total = _StatsAccumulator()
+        
+        for day, accumulator in self.daily_stats.get(location_key, {}).items():
+            if day > boundary_day:
+                total.merge(accumulator)
+        
+        # Rows are time-ordered, so the cutoff day's rows at or after the cutoff
+        # form one contiguous run located by binary search
+        next_day = datetime.combine(date.fromordinal(boundary_day + 1), datetime.min.time()).timestamp()
+        if location_key is None:
+            timestamps = self['timestamp']
+            start = int(np.searchsorted(timestamps, cutoff, side='left'))
+            end = int(np.searchsorted(timestamps, next_day, side='left'))
+            rows = slice(start, max(start, end))
+        else:
+            location_rows = self.location_index.get(location_key)
+            if location_rows is None:
+                return total
+            timestamps = location_rows.timestamps
+            start = int(np.searchsorted(timestamps, cutoff, side='left'))
+            end = int(np.searchsorted(timestamps, next_day, side='left'))
+            rows = location_rows.seqs[start:max(start, end)] - self._head
+        
+        total.add_arrays(
+            self['accuracy'][rows],
+            self['temperature_error'][rows],
+            self['precipitation_error'][rows],
+            self['condition_match'][rows]
+        )
+        return total
+
+    def count_before(self, cutoff: float) -> int:
+        """Return the number of rows observed before a cutoff
+        
+        Args:
+            cutoff: POSIX timestamp
+            
+        Returns:
+            Number of leading rows older than the cutoff
+        """
+        return int(np.searchsorted(self['timestamp'], cutoff, side='left'))
+
+    def drop_head(self, count: int) -> None:
+        """Drop the oldest rows, preserving order
+        
+        Work is proportional to the number of dropped rows (plus one check per
+        known location); buffer compaction is amortized over later drops.
+        
+        Args:
+            count: Number of leading rows to drop
+        """
+        new_head = self._head + count
+        if new_head >= self._tail:
+            self.location_index = {}
+            self.daily_stats = {None: {}}
+            self._base = self._head = self._tail
+            return
+        
+        # Remove dropped rows from the accumulators: whole expired days are
+        # deleted below, dropped rows sharing a day with kept rows are subtracted
+        first_kept_day = int(self._buffers['day'][new_head - self._base])
+        for seq in range(new_head - 1, self._head - 1, -1):
+            key, day, values = self._row(seq)
+            if day != first_kept_day:
+                break
+            for stats_key in (None, key):
+                by_day = self.daily_stats[stats_key]
+                by_day[day].remove(*values)
+                if by_day[day].count == 0:
+                    del by_day[day]
+        
+        for stats_key, by_day in list(self.daily_stats.items()):
+            for day in list(by_day):
+                if day >= first_kept_day:
+                    break
+                del by_day[day]
+            if stats_key is not None and not by_day:
+                del self.daily_stats[stats_key]
+        
+        for key, rows in list(self.location_index.items()):
+            rows.drop_before(new_head)
+            if not len(rows):
+                del self.location_index[key]
+        
+        self._head = new_head
+        if self._head - self._base > self.size:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Move live rows to the start of the buffers"""
+        offset = self._head - self._base
+        for buffer in self._buffers.values():
+            buffer[:self.size] = buffer[offset:offset + self.size]
+        self._base = self._head
+
+    def _reserve(self) -> None:
+        """Make room for at least one more row, compacting before growing"""
+        if self._head - self._base >= len(self._buffers['timestamp']) // 2:
+            self._compact()
+            return
+        
+        capacity = 2 * len(self._buffers['timestamp'])
+        offset = self._head - self._base
+        for name, buffer in self._buffers.items():
+            grown = np.empty(capacity, dtype=buffer.dtype)
+            grown[:self.size] = buffer[offset:offset + self.size]
+            self._buffers[name] = grown
+        self._base = self._head
+
+
 class AccuracyCalculator:
     """Calculates various accuracy metrics for weather predictions"""
     
@@ -40,13 +619,8 @@ class AccuracyCalculator:
         Returns:
             Tuple of (accuracy_score, absolute_error)
         """
-        absolute_error = abs(predicted - actual)
-        
         # Temperature accuracy: 100% if within 1°C, decreasing linearly to 0% at 10°C error
-        max_error = 10.0
-        accuracy = max(0.0, 1.0 - (absolute_error / max_error))
-        
-        return accuracy, absolute_error
+        return _temperature_accuracy(float(predicted), float(actual))
 
     def calculate_precipitation_accuracy(self, predicted_prob: float, actual_precip: float) -> Tuple[float, float]:
         """Calculate precipitation prediction accuracy
@@ -60,14 +634,8 @@ class AccuracyCalculator:
         """
         # Convert actual precipitation to probability (simplified)
         # 0mm = 0% probability, 10mm+ = 100% probability
-        actual_prob = min(1.0, actual_precip / 10.0)
-        
-        probability_error = abs(predicted_prob - actual_prob)
-        
         # Precipitation accuracy: 100% if within 0.1 probability, decreasing to 0% at 1.0 error
-        accuracy = max(0.0, 1.0 - probability_error)
-        
-        return accuracy, probability_error
+        return _precipitation_accuracy(float(predicted_prob), float(actual_precip))
 
     def calculate_condition_accuracy(self, predicted: str, actual: str) -> Tuple[float, bool]:
         """Calculate weather condition prediction accuracy
@@ -79,29 +647,17 @@ class AccuracyCalculator:
         Returns:
             Tuple of (accuracy_score, exact_match)
         """
-        exact_match = predicted.lower() == actual.lower()
-        
-        # Condition mapping for partial matches
-        condition_groups = {
-            'clear': ['clear', 'sunny'],
-            'cloudy': ['cloudy', 'partly cloudy', 'overcast'],
-            'rainy': ['rainy', 'drizzle', 'showers'],
-            'stormy': ['stormy', 'thunderstorm', 'severe'],
-            'snowy': ['snowy', 'snow', 'blizzard']
-        }
-        
-        if exact_match:
-            return 1.0, True
-        
-        # Check for partial matches within same group
         predicted_lower = predicted.lower()
         actual_lower = actual.lower()
         
-        for group_conditions in condition_groups.values():
-            if predicted_lower in group_conditions and actual_lower in group_conditions:
-                return 0.7, False  # Partial match within same group
+        if predicted_lower == actual_lower:
+            return 1.0, True
+        
+        # Unknown conditions get distinct sentinels so they never share a group
+        predicted_group = _COND_TO_GROUP.get(predicted_lower, -1)
+        actual_group = _COND_TO_GROUP.get(actual_lower, -2)
         
-        return 0.0, False
+        return (0.7 if predicted_group == actual_group else 0.0), False  # Partial match within same group
 
     def calculate_overall_accuracy(self, temperature_acc: float, precipitation_acc: float, 
                                  condition_acc: float) -> float:
@@ -115,41 +671,124 @@ class AccuracyCalculator:
         Returns:
             Overall accuracy score (0-1)
         """
-        return (temperature_acc * self.temperature_weight + 
-                precipitation_acc * self.precipitation_weight + 
-                condition_acc * self.condition_weight)
+        return _overall_accuracy(
+            float(temperature_acc), float(precipitation_acc), float(condition_acc),
+            self.temperature_weight, self.precipitation_weight, self.condition_weight
+        )
+
+    def calculate_batch_accuracy(self, predicted_temps: np.ndarray, actual_temps: np.ndarray,
+                                 predicted_probs: np.ndarray, actual_precips: np.ndarray,
+                                 predicted_conditions: Sequence[str],
+                                 actual_conditions: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Calculate accuracy components for many predictions at once
+        
+        Element-wise equivalent of the scalar calculate_* methods.
+        
+        Args:
+            predicted_temps: Predicted temperatures
+            actual_temps: Actual temperatures
+            predicted_probs: Predicted precipitation probabilities (0-1)
+            actual_precips: Actual precipitation amounts in mm
+            predicted_conditions: Predicted weather conditions
+            actual_conditions: Actual weather conditions
+            
+        Returns:
+            Dict of arrays: accuracy_score, temperature_error, precipitation_error, condition_match
+        """
+        # Condition strings repeat heavily, so lower-case each distinct value once
+        lowered: Dict[str, str] = {}
+        predicted_lower = [
+            lowered.get(c) or lowered.setdefault(c, c.lower()) for c in predicted_conditions
+        ]
+        actual_lower = [
+            lowered.get(c) or lowered.setdefault(c, c.lower()) for c in actual_conditions
+        ]
+        condition_match = np.array(
+            [p == a for p, a in zip(predicted_lower, actual_lower)], dtype=np.bool_
+        )
+        predicted_groups = np.array(
+            [_COND_TO_GROUP.get(c, -1) for c in predicted_lower], dtype=np.int8
+        )
+        actual_groups = np.array(
+            [_COND_TO_GROUP.get(c, -2) for c in actual_lower], dtype=np.int8
+        )
+        condition_acc = np.where(
+            condition_match, 1.0, np.where(predicted_groups == actual_groups, 0.7, 0.0)
+        )
+        
+        accuracy_score, temperature_error, precipitation_error = _accuracy_batch(
+            np.ascontiguousarray(predicted_temps, dtype=np.float64),
+            np.ascontiguousarray(actual_temps, dtype=np.float64),
+            np.ascontiguousarray(predicted_probs, dtype=np.float64),
+            np.ascontiguousarray(actual_precips, dtype=np.float64),
+            condition_acc,
+            self.temperature_weight, self.precipitation_weight, self.condition_weight
+        )
+        
+        return {
+            'accuracy_score': accuracy_score,
+            'temperature_error': temperature_error,
+            'precipitation_error': precipitation_error,
+            'condition_match': condition_match
+        }
 
-    def calculate_mae(self, errors: List[float]) -> float:
+    def calculate_mae(self, errors: Union[Sequence[float], np.ndarray]) -> float:
         """Calculate Mean Absolute Error
         
         Args:
-            errors: List of absolute errors
+            errors: List or array of absolute errors
             
         Returns:
             Mean absolute error
         """
-        if not errors:
+        errors_arr = np.asarray(errors, dtype=np.float64)
+        if errors_arr.size == 0:
             return 0.0
-        return mean(errors)
+        return float(np.mean(errors_arr))
 
-    def calculate_rmse(self, errors: List[float]) -> float:
+    def calculate_rmse(self, errors: Union[Sequence[float], np.ndarray]) -> float:
         """Calculate Root Mean Square Error
         
         Args:
-            errors: List of absolute errors
+            errors: List or array of absolute errors
             
         Returns:
             Root mean square error
         """
-        if not errors:
-            return 0.0
+        return self.calculate_mae_rmse(errors)[1]
+
+    def calculate_mae_rmse(self, errors: Union[Sequence[float], np.ndarray]) -> Tuple[float, float]:
+        """Calculate Mean Absolute Error and Root Mean Square Error together
         
-        mse = mean([error ** 2 for error in errors])
-        return math.sqrt(mse)
+        The squared sum is computed with a single dot product, without
+        materializing an array of squared errors.
+        
+        Args:
+            errors: List or array of absolute errors
+            
+        Returns:
+            Tuple of (mae, rmse)
+        """
+        errors_arr = np.asarray(errors, dtype=np.float64)
+        count = errors_arr.size
+        if count == 0:
+            return 0.0, 0.0
+        return (float(errors_arr.sum()) / count,
+                math.sqrt(float(np.dot(errors_arr, errors_arr)) / count))
 
 
 class AccuracyTracker:
-    """Tracks and analyzes prediction accuracy over time"""
+    """Tracks and analyzes prediction accuracy over time
+    
+    Location filters compare coordinates rounded to 1e-5 degrees (about 1 m)
+    rather than by exact float equality, so the same place reported with
+    slightly different float noise is treated as one location.
+    
+    prediction_outcomes stays a public, editable list of PredictionOutcome
+    objects; the columnar store is kept alongside it, so each outcome costs
+    its object plus one row of columns. Direct edits to the list are detected
+    and the columns rebuilt on the next read.
+    """
     
     def __init__(self, retention_days: int = 90):
         """Initialize accuracy tracker
@@ -159,13 +798,51 @@ class AccuracyTracker:
         """
         self.retention_days = retention_days
         self.calculator = AccuracyCalculator()
-        self.prediction_outcomes: List[PredictionOutcome] = []
+        self._outcomes = _OutcomeList()
         self.accuracy_history: List[AccuracyMetrics] = []
         
+        # Columnar copy of prediction_outcomes used for filtering and aggregation,
+        # with the list and mutation count it was last synced to
+        self._columns = _OutcomeColumns()
+        self._columns_source = self._outcomes
+        self._columns_mutations = 0
+        # Whether prediction_outcomes is itself in time order, so expired
+        # outcomes form a prefix of the list
+        self._outcomes_in_order = True
+        
+        # Packed location key -> metrics, kept in step with accuracy_history
+        self._history_index: Dict[int, List[AccuracyMetrics]] = {}
+        self._history_source: List[AccuracyMetrics] = self.accuracy_history
+        self._history_indexed = 0
+        
+        # Incremented whenever the stored outcomes change; guards the alert cache
+        self._version = 0
+        self._alert_cache: Dict[tuple, Tuple[int, float, AccuracyMetrics, List[str]]] = {}
+        
         # Accuracy alert thresholds
         self.accuracy_alert_threshold = 0.6  # Alert if accuracy drops below 60%
         self.min_predictions_for_alert = 10   # Minimum predictions before triggering alerts
 
+    @property
+    def retention_days(self) -> int:
+        """Number of days to retain accuracy history"""
+        return self._retention_days
+
+    @retention_days.setter
+    def retention_days(self, value: int) -> None:
+        self._retention_days = value
+        self._retention_delta = timedelta(days=value)
+
+    @property
+    def prediction_outcomes(self) -> List[PredictionOutcome]:
+        """Stored prediction outcomes"""
+        return self._outcomes
+
+    @prediction_outcomes.setter
+    def prediction_outcomes(self, outcomes: List[PredictionOutcome]) -> None:
+        # Copy into a mutation-counting list so later direct edits are seen
+        self._outcomes = _OutcomeList(outcomes)
+
     def compare_prediction_to_actual(self, forecast: Forecast, actual_weather: WeatherData) -> PredictionOutcome:
         """Compare a forecast to actual weather and calculate accuracy
         
@@ -203,20 +880,199 @@ class AccuracyTracker:
             condition_match=condition_match
         )
 
+    def compare_batch(self, forecasts: List[Forecast],
+                      actual_weather: List[WeatherData]) -> List[PredictionOutcome]:
+        """Compare many forecasts to their actual weather in one vectorized pass
+        
+        Args:
+            forecasts: Weather forecasts
+            actual_weather: Actual weather data, aligned with forecasts
+            
+        Returns:
+            List of PredictionOutcome, one per forecast
+        """
+        if len(forecasts) != len(actual_weather):
+            raise ValueError("forecasts and actual_weather must have the same length")
+        
+        count = len(forecasts)
+        results = self.calculator.calculate_batch_accuracy(
+            np.fromiter((f.predicted_temperature_high for f in forecasts), dtype=np.float64, count=count),
+            np.fromiter((a.temperature for a in actual_weather), dtype=np.float64, count=count),
+            np.fromiter((f.precipitation_probability for f in forecasts), dtype=np.float64, count=count),
+            np.fromiter((a.precipitation for a in actual_weather), dtype=np.float64, count=count),
+            [f.weather_condition for f in forecasts],
+            [a.weather_condition for a in actual_weather]
+        )
+        
+        return [
+            PredictionOutcome(
+                forecast=forecast,
+                actual_weather=actual,
+                accuracy_score=accuracy_score,
+                temperature_error=temperature_error,
+                precipitation_error=precipitation_error,
+                condition_match=condition_match
+            )
+            for forecast, actual, accuracy_score, temperature_error, precipitation_error, condition_match
+            in zip(forecasts, actual_weather,
+                   results['accuracy_score'].tolist(),
+                   results['temperature_error'].tolist(),
+                   results['precipitation_error'].tolist(),
+                   results['condition_match'].tolist())
+        ]
+
+    def _outcome_columns(self) -> _OutcomeColumns:
+        """Return the columnar outcome store, rebuilding it if the list changed directly
+        
+        Returns:
+            _OutcomeColumns in sync with prediction_outcomes
+        """
+        outcomes = self._outcomes
+        if self._columns_source is not outcomes or self._columns_mutations != outcomes.mutations:
+            self._rebuild_columns()
+        return self._columns
+
+    def _rebuild_columns(self) -> None:
+        """Rebuild the columnar store from prediction_outcomes
+        
+        The columns are built from a time-sorted copy; the public list keeps
+        whatever order the caller gave it.
+        """
+        outcomes = self.prediction_outcomes
+        ordered = sorted(outcomes, key=_outcome_time)
+        self._columns = _OutcomeColumns.from_outcomes(ordered)
+        self._columns_source = outcomes
+        self._columns_mutations = outcomes.mutations
+        self._outcomes_in_order = all(a is b for a, b in zip(ordered, outcomes))
+        self._version += 1
+
+    def _window_stats(self, cutoff_date: datetime,
+                      location: Optional[Location] = None) -> _StatsAccumulator:
+        """Aggregate outcomes observed after a cutoff, optionally for one location
+        
+        Args:
+            cutoff_date: Earliest observation time to include
+            location: Optional location filter (matched to 1e-5 degrees)
+            
+        Returns:
+            _StatsAccumulator for the selected outcomes
+        """
+        location_key = _location_key(location.latitude, location.longitude) if location else None
+        return self._outcome_columns().window_stats(cutoff_date.timestamp(), location_key)
+
+    def _history_for_location(self, location: Location) -> List[AccuracyMetrics]:
+        """Return accuracy history entries recorded for a location
+        
+        Entries appended to accuracy_history since the last call are indexed
+        incrementally; the index is rebuilt if the list was replaced or shrank.
+        
+        Args:
+            location: Location to look up
+            
+        Returns:
+            List of AccuracyMetrics for the location
+        """
+        history = self.accuracy_history
+        if self._history_source is not history or self._history_indexed > len(history):
+            self._history_index = {}
+            self._history_source = history
+            self._history_indexed = 0
+        
+        for metric in history[self._history_indexed:]:
+            if metric.location:
+                key = _location_key(metric.location.latitude, metric.location.longitude)
+                self._history_index.setdefault(key, []).append(metric)
+        self._history_indexed = len(history)
+        
+        return self._history_index.get(
+            _location_key(location.latitude, location.longitude), []
+        )
+
+    def _prune_history(self, cutoff_date: datetime) -> int:
+        """Remove accuracy history entries calculated before a cutoff
+        
+        accuracy_history is filtered in place and the per-location index is
+        pruned alongside it, so later lookups keep the index instead of
+        rebuilding it.
+        
+        Args:
+            cutoff_date: Earliest calculation time to keep
+            
+        Returns:
+            Number of entries removed
+        """
+        history = self.accuracy_history
+        kept = [metric for metric in history if metric.calculated_at >= cutoff_date]
+        removed = len(history) - len(kept)
+        
+        if removed and self._history_source is history:
+            self._history_indexed = sum(
+                1 for metric in history[:self._history_indexed]
+                if metric.calculated_at >= cutoff_date
+            )
+            for key, metrics in list(self._history_index.items()):
+                metrics[:] = [metric for metric in metrics if metric.calculated_at >= cutoff_date]
+                if not metrics:
+                    del self._history_index[key]
+        if removed:
+            history[:] = kept
+        
+        return removed
+
+    def _remove_outcomes_before(self, cutoff_date: datetime) -> int:
+        """Remove outcomes observed before a cutoff from both the list and the columns
+        
+        Args:
+            cutoff_date: Earliest observation time to keep
+            
+        Returns:
+            Number of outcomes removed
+        """
+        columns = self._outcome_columns()
+        removed = columns.count_before(cutoff_date.timestamp())
+        
+        if removed:
+            if self._outcomes_in_order:
+                del self.prediction_outcomes[:removed]
+            else:
+                cutoff = cutoff_date.timestamp()
+                self.prediction_outcomes[:] = [
+                    outcome for outcome in self.prediction_outcomes
+                    if _outcome_time(outcome) >= cutoff
+                ]
+            self._columns_mutations = self._outcomes.mutations
+            columns.drop_head(removed)
+            self._version += 1
+        
+        return removed
+
     def add_prediction_outcome(self, outcome: PredictionOutcome) -> None:
         """Add a prediction outcome to the tracking history
         
         Args:
             outcome: Prediction outcome to add
         """
-        self.prediction_outcomes.append(outcome)
+        columns = self._outcome_columns()
         
-        # Clean up old outcomes beyond retention period
-        cutoff_date = datetime.now() - timedelta(days=self.retention_days)
-        self.prediction_outcomes = [
-            outcome for outcome in self.prediction_outcomes
-            if outcome.actual_weather.timestamp >= cutoff_date
-        ]
+        if columns.size and _outcome_time(outcome) < columns['timestamp'][-1]:
+            # Late arrival: insert in chronological position in both stores
+            if self._outcomes_in_order:
+                bisect.insort(self.prediction_outcomes, outcome, key=_outcome_time)
+            else:
+                self.prediction_outcomes.append(outcome)
+            columns.insert(outcome)
+        else:
+            self.prediction_outcomes.append(outcome)
+            columns.append(outcome)
+        self._columns_mutations = self._outcomes.mutations
+        self._version += 1
+        
+        # Clean up old outcomes beyond retention period; the oldest row tells
+        # in O(1) whether anything has expired
+        cutoff_date = datetime.now() - self._retention_delta
+        columns = self._columns
+        if columns.size and columns['timestamp'][0] < cutoff_date.timestamp():
+            self._remove_outcomes_before(cutoff_date)
         
         logger.info(f"Added prediction outcome. Total outcomes: {len(self.prediction_outcomes)}")
 
@@ -225,27 +1081,20 @@ class AccuracyTracker:
         """Calculate accuracy metrics for recent predictions
         
         Args:
-            location: Optional location filter
+            location: Optional location filter (matched to 1e-5 degrees)
             days: Number of recent days to analyze
             
         Returns:
             AccuracyMetrics object with calculated metrics
         """
-        # Filter outcomes by location and time period
-        cutoff_date = datetime.now() - timedelta(days=days)
-        filtered_outcomes = [
-            outcome for outcome in self.prediction_outcomes
-            if outcome.actual_weather.timestamp >= cutoff_date
-        ]
+        now = datetime.now()
         
-        if location:
-            filtered_outcomes = [
-                outcome for outcome in filtered_outcomes
-                if (outcome.forecast.location.latitude == location.latitude and
-                    outcome.forecast.location.longitude == location.longitude)
-            ]
+        # Filter outcomes by location and time period
+        cutoff_date = now - timedelta(days=days)
+        stats = self._window_stats(cutoff_date, location)
+        count = stats.count
         
-        if not filtered_outcomes:
+        if count == 0:
             # Return default metrics if no data
             return AccuracyMetrics(
                 location=location,
@@ -256,42 +1105,33 @@ class AccuracyTracker:
                 condition_accuracy=0.0,
                 total_predictions=0,
                 evaluation_period_days=days,
-                calculated_at=datetime.now()
+                calculated_at=now
             )
         
-        # Calculate metrics
-        accuracy_scores = [outcome.accuracy_score for outcome in filtered_outcomes]
-        temperature_errors = [outcome.temperature_error for outcome in filtered_outcomes]
-        precipitation_errors = [outcome.precipitation_error for outcome in filtered_outcomes]
-        condition_matches = [outcome.condition_match for outcome in filtered_outcomes]
-        
-        overall_accuracy = mean(accuracy_scores)
-        temperature_mae = self.calculator.calculate_mae(temperature_errors)
-        temperature_rmse = self.calculator.calculate_rmse(temperature_errors)
-        precipitation_accuracy = 1.0 - mean(precipitation_errors)  # Convert error to accuracy
-        condition_accuracy = sum(condition_matches) / len(condition_matches)
+        # Derive metrics from the window's running sums, clamped against the
+        # rounding drift that subtracting expired outcomes can leave behind
+        overall_accuracy = min(1.0, max(0.0, stats.sum_accuracy / count))
+        temperature_mae = max(0.0, stats.sum_temperature_error / count)
+        temperature_rmse = math.sqrt(max(0.0, stats.sum_temperature_error_sq / count))
+        condition_accuracy = stats.sum_condition_match / count
         
         metrics = AccuracyMetrics(
             location=location,
             overall_accuracy=overall_accuracy,
             temperature_mae=temperature_mae,
             temperature_rmse=temperature_rmse,
-            precipitation_accuracy=max(0.0, precipitation_accuracy),
+            precipitation_accuracy=stats.precipitation_accuracy,
             condition_accuracy=condition_accuracy,
-            total_predictions=len(filtered_outcomes),
+            total_predictions=count,
             evaluation_period_days=days,
-            calculated_at=datetime.now()
+            calculated_at=now
         )
         
         # Store in history
         self.accuracy_history.append(metrics)
         
         # Clean up old history beyond retention period
-        history_cutoff = datetime.now() - timedelta(days=self.retention_days)
-        self.accuracy_history = [
-            metric for metric in self.accuracy_history
-            if metric.calculated_at >= history_cutoff
-        ]
+        self._prune_history(now - self._retention_delta)
         
         return metrics
 
@@ -300,41 +1140,75 @@ class AccuracyTracker:
         """Get accuracy trend over time
         
         Args:
-            location: Optional location filter
+            location: Optional location filter (matched to 1e-5 degrees)
             days: Number of days to analyze
             
         Returns:
             List of AccuracyMetrics ordered by calculation time
         """
         cutoff_date = datetime.now() - timedelta(days=days)
+        candidates = self._history_for_location(location) if location else self.accuracy_history
         filtered_history = [
-            metric for metric in self.accuracy_history
+            metric for metric in candidates
             if metric.calculated_at >= cutoff_date
         ]
         
-        if location:
-            filtered_history = [
-                metric for metric in filtered_history
-                if (metric.location and 
-                    metric.location.latitude == location.latitude and
-                    metric.location.longitude == location.longitude)
-            ]
-        
         return sorted(filtered_history, key=lambda x: x.calculated_at)
 
     def check_accuracy_alerts(self, location: Optional[Location] = None) -> List[str]:
         """Check if accuracy has dropped below alert thresholds
         
+        Results are cached until an outcome is added or removed, or until the
+        oldest outcome in the 7-day window ages out of it. A cache hit still
+        records the cached metrics in accuracy_history, as a fresh calculation
+        would.
+        
         Args:
-            location: Optional location filter
+            location: Optional location filter (matched to 1e-5 degrees)
             
         Returns:
             List of alert messages
         """
-        alerts = []
+        now_dt = datetime.now()
+        now = now_dt.timestamp()
+        columns = self._outcome_columns()
+        cache_key = (
+            (location.latitude, location.longitude, location.city) if location else None,
+            self.accuracy_alert_threshold,
+            self.min_predictions_for_alert
+        )
+        
+        cached = self._alert_cache.get(cache_key)
+        if cached is not None and cached[0] == self._version and now < cached[1]:
+            metrics = cached[2]
+            if metrics.total_predictions > 0:
+                self.accuracy_history.append(
+                    metrics.model_copy(update={"location": location, "calculated_at": now_dt})
+                )
+                self._prune_history(now_dt - self._retention_delta)
+            return list(cached[3])
+        
+        metrics = self.calculate_accuracy_metrics(location, days=7)
+        alerts = self._compute_accuracy_alerts(metrics)
         
-        # Get recent accuracy metrics
-        recent_metrics = self.calculate_accuracy_metrics(location, days=7)
+        # The window contents change once its oldest outcome is 7 days old
+        window = timedelta(days=7).total_seconds()
+        start = columns.count_before(now - window)
+        valid_until = columns['timestamp'][start] + window if start < columns.size else math.inf
+        self._alert_cache[cache_key] = (self._version, valid_until, metrics, alerts)
+        
+        return list(alerts)
+
+    def _compute_accuracy_alerts(self, recent_metrics: AccuracyMetrics) -> List[str]:
+        """Evaluate accuracy alert thresholds against the last 7 days of outcomes
+        
+        Args:
+            recent_metrics: Metrics calculated over the last 7 days
+            
+        Returns:
+            List of alert messages
+        """
+        alerts = []
         
         if recent_metrics.total_predictions < self.min_predictions_for_alert:
             return alerts  # Not enough data for reliable alerts
@@ -369,26 +1243,14 @@ class AccuracyTracker:
         """Get count of predictions for a location and time period
         
         Args:
-            location: Optional location filter
+            location: Optional location filter (matched to 1e-5 degrees)
             days: Number of days to count
             
         Returns:
             Number of predictions
         """
         cutoff_date = datetime.now() - timedelta(days=days)
-        filtered_outcomes = [
-            outcome for outcome in self.prediction_outcomes
-            if outcome.actual_weather.timestamp >= cutoff_date
-        ]
-        
-        if location:
-            filtered_outcomes = [
-                outcome for outcome in filtered_outcomes
-                if (outcome.forecast.location.latitude == location.latitude and
-                    outcome.forecast.location.longitude == location.longitude)
-            ]
-        
-        return len(filtered_outcomes)
+        return self._window_stats(cutoff_date, location).count
 
     def cleanup_old_data(self) -> int:
         """Remove data older than retention period
@@ -396,23 +1258,13 @@ class AccuracyTracker:
         Returns:
             Number of records removed
         """
-        cutoff_date = datetime.now() - timedelta(days=self.retention_days)
+        cutoff_date = datetime.now() - self._retention_delta
         
         # Clean prediction outcomes
-        initial_outcomes = len(self.prediction_outcomes)
-        self.prediction_outcomes = [
-            outcome for outcome in self.prediction_outcomes
-            if outcome.actual_weather.timestamp >= cutoff_date
-        ]
-        outcomes_removed = initial_outcomes - len(self.prediction_outcomes)
+        outcomes_removed = self._remove_outcomes_before(cutoff_date)
         
         # Clean accuracy history
-        initial_history = len(self.accuracy_history)
-        self.accuracy_history = [
-            metric for metric in self.accuracy_history
-            if metric.calculated_at >= cutoff_date
-        ]
-        history_removed = initial_history - len(self.accuracy_history)
+        history_removed = self._prune_history(cutoff_date)
         
         total_removed = outcomes_removed + history_removed
         if total_removed > 0:
@@ -1,13 +1,203 @@
 """Analytics processor for weather data visualization and trend analysis"""
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta, date
-from typing import List, Dict, Optional, Tuple
-from statistics import mean, stdev
+from functools import cached_property
+from operator import attrgetter
+from typing import List, Dict, Optional, Tuple, Union
 import math
+import numpy as np
 from app.models import WeatherData, Forecast, ChartData, Location, AccuracyMetrics
 
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:  # NumExpr is optional; plain NumPy ufuncs are used instead
+    numexpr = None
+    NUMEXPR_AVAILABLE = False
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; fall back to NumPy binning
+    numba = None
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Below this many samples NumExpr's dispatch overhead outweighs its gains
+_NUMEXPR_MIN_SIZE = 5000
+
+# Archive-sized inputs where the parallel Numba kernels pay off
+_NUMBA_MIN_SIZE = 100_000
+
+# Upper edges of the compass sectors; the ninth bin (>= 337.5) wraps to north
+_COMPASS_EDGES = np.array([22.5, 67.5, 112.5, 157.5, 202.5, 247.5, 292.5, 337.5])
+_COMPASS_NAMES = ('N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW')
+
+# Comparative chart metrics: column getter, current label, historical label
+_METRIC_MAP = {
+    'temperature': (
+        attrgetter('temperature'),
+        'Current Temperature (°C)',
+        'Historical Average Temperature (°C)'
+    ),
+    'precipitation': (
+        attrgetter('precipitation'),
+        'Current Precipitation (mm)',
+        'Historical Average Precipitation (mm)'
+    ),
+    'humidity': (
+        attrgetter('humidity'),
+        'Current Humidity (%)',
+        'Historical Average Humidity (%)'
+    ),
+}
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, parallel=True)
+    def _bin_directions(directions, n_chunks):
+        """Count directions per compass sector with per-chunk accumulators"""
+        n = directions.size
+        chunk = (n + n_chunks - 1) // n_chunks
+        local_counts = np.zeros((n_chunks, 8), dtype=np.int64)
+        for c in numba.prange(n_chunks):
+            for i in range(c * chunk, min(n, (c + 1) * chunk)):
+                # Shift by half a sector so north spans [337.5, 22.5)
+                local_counts[c, int(((directions[i] + 22.5) % 360.0) // 45.0)] += 1
+        return local_counts.sum(axis=0)
+
+    @numba.vectorize(['float64(float64, float64)'], target='parallel', cache=True)
+    def _wind_u(speed, direction):
+        """Eastward wind component from speed and direction in degrees"""
+        return speed * math.sin(direction * 0.017453292519943295)
+
+    @numba.vectorize(['float64(float64, float64)'], target='parallel', cache=True)
+    def _wind_v(speed, direction):
+        """Northward wind component from speed and direction in degrees"""
+        return speed * math.cos(direction * 0.017453292519943295)
+else:
+    _bin_directions = _wind_u = _wind_v = None
+
+
+def _compass_counts(directions: np.ndarray) -> np.ndarray:
+    """Count wind directions per 8-point compass sector
+    
+    Args:
+        directions: Wind directions in degrees
+        
+    Returns:
+        Array of 8 counts ordered as _COMPASS_NAMES
+    """
+    if NUMBA_AVAILABLE and directions.size > _NUMBA_MIN_SIZE:
+        # Thread count is read here, not in the kernel, so the kernel stays cacheable
+        return _bin_directions(np.ascontiguousarray(directions, dtype=np.float64),
+                               numba.get_num_threads())
+    counts = np.bincount(np.digitize(directions, _COMPASS_EDGES), minlength=9)
+    counts[0] += counts[8]
+    return counts[:8]
+
+
+def _timestamp_sort_keys(timestamps: List[datetime]) -> np.ndarray:
+    """Convert timestamps to an array that orders like the datetimes
+    
+    Naive timestamps become wall-clock datetime64 values; aware ones become
+    POSIX times. The two kinds cannot be compared, so the first one decides.
+    
+    Args:
+        timestamps: Timestamps in any order
+        
+    Returns:
+        Array of sortable keys aligned with the timestamps
+    """
+    if timestamps and timestamps[0].tzinfo is None:
+        return np.array(timestamps, dtype='datetime64[us]')
+    return np.fromiter((ts.timestamp() for ts in timestamps), dtype=np.float64, count=len(timestamps))
+
+
+class _WeatherColumns:
+    """Time-ordered column view of a weather data list
+    
+    Built once per analytics run so every trend and chart stage shares a
+    single argsort and a single pass of attribute extraction.
+    """
+    
+    def __init__(self, weather_data_list: List[WeatherData]):
+        """Extract the numeric columns and order them by timestamp
+        
+        Args:
+            weather_data_list: Weather data in any order
+        """
+        n = len(weather_data_list)
+        timestamps = [data.timestamp for data in weather_data_list]
+        self._naive = bool(timestamps) and timestamps[0].tzinfo is None
+        sort_keys = _timestamp_sort_keys(timestamps)
+        order = np.argsort(sort_keys, kind='stable')
+        
+        def column(name: str) -> np.ndarray:
+            values = np.fromiter(map(attrgetter(name), weather_data_list), dtype=np.float64, count=n)
+            return values[order]
+        
+        self.timestamps: List[datetime] = [timestamps[i] for i in order.tolist()]
+        self._sort_keys = sort_keys[order]
+        self.temperature = column('temperature')
+        self.humidity = column('humidity')
+        self.pressure = column('pressure')
+        self.wind_speed = column('wind_speed')
+        self.wind_direction = column('wind_direction')
+        self.precipitation = column('precipitation')
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    @cached_property
+    def labels(self) -> List[str]:
+        """Timestamp labels formatted as '%Y-%m-%d %H:%M'"""
+        if self._naive:
+            minutes = self._sort_keys.astype('datetime64[m]')
+            return np.strings.replace(np.datetime_as_string(minutes), 'T', ' ').tolist()
+        # Aware timestamps keep strftime because datetime64 would shift them to UTC
+        return [ts.strftime('%Y-%m-%d %H:%M') for ts in self.timestamps]
+    
+    @cached_property
+    def day_labels(self) -> List[str]:
+        """Timestamp labels formatted as '%Y-%m-%d'"""
+        if self._naive:
+            return np.datetime_as_string(self._sort_keys.astype('datetime64[D]')).tolist()
+        return [ts.strftime('%Y-%m-%d') for ts in self.timestamps]
+
+
+def _merge_labels(labels: List[str], new_labels) -> None:
+    """Append labels not already present, preserving first-seen order
+    
+    Args:
+        labels: Label list to extend in place
+        new_labels: Iterable of candidate labels
+    """
+    seen = set(labels)
+    for label in new_labels:
+        if label not in seen:
+            seen.add(label)
+            labels.append(label)
+
+
+WeatherSeries = Union[List[WeatherData], _WeatherColumns]
+
+
+def _as_columns(weather_data: WeatherSeries) -> _WeatherColumns:
+    """Return weather data as columns, reusing an existing column view
+    
+    Args:
+        weather_data: Weather data list or an already-built column view
+        
+    Returns:
+        Time-ordered column view of the data
+    """
+    if isinstance(weather_data, _WeatherColumns):
+        return weather_data
+    return _WeatherColumns(weather_data)
+
 
 class TrendAnalyzer:
     """Analyzes weather trends and patterns"""
@@ -18,13 +208,13 @@ class TrendAnalyzer:
 
     def calculate_temperature_trend(
         self, 
-        weather_data_list: List[WeatherData], 
+        weather_data_list: WeatherSeries, 
         days: int = 7
     ) -> Dict[str, any]:
         """Calculate temperature trends over time
         
         Args:
-            weather_data_list: List of historical weather data
+            weather_data_list: Historical weather data, as a list or column view
             days: Number of days to analyze
             
         Returns:
@@ -39,23 +229,33 @@ class TrendAnalyzer:
                 'max_temperature': 0.0
             }
         
-        # Sort by timestamp
-        sorted_data = sorted(weather_data_list, key=lambda x: x.timestamp)
-        
-        # Calculate statistics
-        temperatures = [data.temperature for data in sorted_data]
-        avg_temp = mean(temperatures)
-        min_temp = min(temperatures)
-        max_temp = max(temperatures)
-        
-        # Calculate trend direction
-        if len(temperatures) >= 2:
-            first_half = temperatures[:len(temperatures)//2]
-            second_half = temperatures[len(temperatures)//2:]
-            
-            avg_first = mean(first_half)
-            avg_second = mean(second_half)
-            temp_change = avg_second - avg_first
+        # Order-independent statistics need no sort, so a plain list only has
+        # its temperatures and timestamps extracted
+        if isinstance(weather_data_list, _WeatherColumns):
+            temps = weather_data_list.temperature
+            sort_keys = None
+        else:
+            temps = np.fromiter(
+                (data.temperature for data in weather_data_list),
+                dtype=np.float64,
+                count=len(weather_data_list)
+            )
+            sort_keys = _timestamp_sort_keys([data.timestamp for data in weather_data_list])
+        avg_temp = float(temps.mean())
+        min_temp = float(temps.min())
+        max_temp = float(temps.max())
+        
+        # Calculate trend direction from the earlier and later halves by time
+        if temps.size >= 2:
+            half = temps.size // 2
+            if sort_keys is None:
+                # Column views are already time-ordered
+                temp_change = float(temps[half:].mean() - temps[:half].mean())
+            else:
+                # O(N) partition on time instead of a full sort
+                earlier = np.zeros(temps.size, dtype=np.bool_)
+                earlier[np.argpartition(sort_keys, half)[:half]] = True
+                temp_change = float(temps[~earlier].mean() - temps[earlier].mean())
             
             if temp_change > 1.0:
                 trend_direction = 'increasing'
@@ -73,17 +273,17 @@ class TrendAnalyzer:
             'temperature_change': round(temp_change, 2),
             'min_temperature': round(min_temp, 2),
             'max_temperature': round(max_temp, 2),
-            'data_points': len(temperatures)
+            'data_points': int(temps.size)
         }
 
     def calculate_precipitation_pattern(
         self, 
-        weather_data_list: List[WeatherData]
+        weather_data_list: WeatherSeries
     ) -> Dict[str, any]:
         """Calculate precipitation patterns
         
         Args:
-            weather_data_list: List of historical weather data
+            weather_data_list: Historical weather data, as a list or column view
             
         Returns:
             Dictionary with precipitation pattern analysis
@@ -96,11 +296,11 @@ class TrendAnalyzer:
                 'precipitation_probability': 0.0
             }
         
-        precipitations = [data.precipitation for data in weather_data_list]
-        total_precip = sum(precipitations)
-        avg_precip = mean(precipitations)
-        rainy_days = sum(1 for p in precipitations if p > 0.1)  # > 0.1mm counts as rain
-        precip_probability = rainy_days / len(precipitations) if precipitations else 0.0
+        precip = _as_columns(weather_data_list).precipitation
+        total_precip = float(precip.sum())
+        avg_precip = float(precip.mean())
+        rainy_days = int((precip > 0.1).sum())  # > 0.1mm counts as rain
+        precip_probability = rainy_days / precip.size
         
         return {
             'total_precipitation': round(total_precip, 2),
@@ -111,12 +311,12 @@ class TrendAnalyzer:
 
     def calculate_wind_statistics(
         self, 
-        weather_data_list: List[WeatherData]
+        weather_data_list: WeatherSeries
     ) -> Dict[str, any]:
         """Calculate wind speed and direction statistics
         
         Args:
-            weather_data_list: List of historical weather data
+            weather_data_list: Historical weather data, as a list or column view
             
         Returns:
             Dictionary with wind statistics
@@ -129,41 +329,18 @@ class TrendAnalyzer:
                 'wind_variability': 0.0
             }
         
-        wind_speeds = [data.wind_speed for data in weather_data_list]
-        wind_directions = [data.wind_direction for data in weather_data_list]
+        columns = _as_columns(weather_data_list)
+        wind_speeds = columns.wind_speed
+        wind_directions = columns.wind_direction
         
-        avg_speed = mean(wind_speeds)
-        max_speed = max(wind_speeds)
+        avg_speed = float(wind_speeds.mean())
+        max_speed = float(wind_speeds.max())
         
-        # Calculate predominant wind direction
-        # Divide into 8 compass directions
-        direction_bins = {
-            'N': 0, 'NE': 0, 'E': 0, 'SE': 0,
-            'S': 0, 'SW': 0, 'W': 0, 'NW': 0
-        }
+        # Calculate predominant wind direction over 8 compass sectors
+        predominant_direction = _COMPASS_NAMES[int(_compass_counts(wind_directions).argmax())]
         
-        for direction in wind_directions:
-            if 337.5 <= direction or direction < 22.5:
-                direction_bins['N'] += 1
-            elif 22.5 <= direction < 67.5:
-                direction_bins['NE'] += 1
-            elif 67.5 <= direction < 112.5:
-                direction_bins['E'] += 1
-            elif 112.5 <= direction < 157.5:
-                direction_bins['SE'] += 1
-            elif 157.5 <= direction < 202.5:
-                direction_bins['S'] += 1
-            elif 202.5 <= direction < 247.5:
-                direction_bins['SW'] += 1
-            elif 247.5 <= direction < 292.5:
-                direction_bins['W'] += 1
-            elif 292.5 <= direction < 337.5:
-                direction_bins['NW'] += 1
-        
-        predominant_direction = max(direction_bins, key=direction_bins.get)
-        
-        # Calculate wind variability (standard deviation)
-        wind_variability = stdev(wind_speeds) if len(wind_speeds) > 1 else 0.0
+        # Calculate wind variability (sample standard deviation)
+        wind_variability = float(wind_speeds.std(ddof=1)) if wind_speeds.size > 1 else 0.0
         
         return {
             'average_wind_speed': round(avg_speed, 2),
@@ -174,12 +351,12 @@ class TrendAnalyzer:
 
     def calculate_humidity_pressure_stats(
         self, 
-        weather_data_list: List[WeatherData]
+        weather_data_list: WeatherSeries
     ) -> Dict[str, any]:
         """Calculate humidity and pressure statistics
         
         Args:
-            weather_data_list: List of historical weather data
+            weather_data_list: Historical weather data, as a list or column view
             
         Returns:
             Dictionary with humidity and pressure statistics
@@ -192,14 +369,19 @@ class TrendAnalyzer:
                 'pressure_range': (0.0, 0.0)
             }
         
-        humidities = [data.humidity for data in weather_data_list]
-        pressures = [data.pressure for data in weather_data_list]
+        columns = _as_columns(weather_data_list)
+        humidities = columns.humidity
+        pressures = columns.pressure
         
         return {
-            'average_humidity': round(mean(humidities), 2),
-            'average_pressure': round(mean(pressures), 2),
-            'humidity_range': (round(min(humidities), 2), round(max(humidities), 2)),
-            'pressure_range': (round(min(pressures), 2), round(max(pressures), 2))
+            'average_humidity': round(float(humidities.mean()), 2),
+            'average_pressure': round(float(pressures.mean()), 2),
+            'humidity_range': (
+                round(float(humidities.min()), 2), round(float(humidities.max()), 2)
+            ),
+            'pressure_range': (
+                round(float(pressures.min()), 2), round(float(pressures.max()), 2)
+            )
         }
 
 
@@ -212,7 +394,7 @@ class VisualizationDataBuilder:
 
     def prepare_temperature_chart(
         self, 
-        weather_data_list: List[WeatherData],
+        weather_data_list: WeatherSeries,
         forecasts: Optional[List[Forecast]] = None
     ) -> ChartData:
         """Prepare temperature trend chart data
@@ -234,20 +416,16 @@ class VisualizationDataBuilder:
         
         # Process historical data
         if weather_data_list:
-            sorted_data = sorted(weather_data_list, key=lambda x: x.timestamp)
-            for data in sorted_data:
-                labels.append(data.timestamp.strftime('%Y-%m-%d %H:%M'))
-                historical_temps.append(data.temperature)
+            columns = _as_columns(weather_data_list)
+            labels.extend(columns.labels)
+            historical_temps = columns.temperature.tolist()
         
         # Process forecast data
         if forecasts:
-            sorted_forecasts = sorted(forecasts, key=lambda x: x.forecast_date)
-            for forecast in sorted_forecasts:
-                label = forecast.forecast_date.strftime('%Y-%m-%d')
-                if label not in labels:
-                    labels.append(label)
-                forecast_temps_high.append(forecast.predicted_temperature_high)
-                forecast_temps_low.append(forecast.predicted_temperature_low)
+            sorted_forecasts = sorted(forecasts, key=attrgetter('forecast_date'))
+            _merge_labels(labels, (f.forecast_date.strftime('%Y-%m-%d') for f in sorted_forecasts))
+            forecast_temps_high = [f.predicted_temperature_high for f in sorted_forecasts]
+            forecast_temps_low = [f.predicted_temperature_low for f in sorted_forecasts]
         
         datasets = []
         
@@ -279,7 +457,7 @@ class VisualizationDataBuilder:
 
     def prepare_precipitation_chart(
         self, 
-        weather_data_list: List[WeatherData],
+        weather_data_list: WeatherSeries,
         forecasts: Optional[List[Forecast]] = None
     ) -> ChartData:
         """Prepare precipitation probability chart data
@@ -291,50 +469,45 @@ class VisualizationDataBuilder:
         Returns:
             ChartData for precipitation visualization
         """
+        if not weather_data_list and not forecasts:
+            return ChartData(labels=[], datasets=[])
+        
         labels = []
         historical_precip = []
         forecast_precip_prob = []
         
         # Process historical data
         if weather_data_list:
-            sorted_data = sorted(weather_data_list, key=lambda x: x.timestamp)
-            for data in sorted_data:
-                labels.append(data.timestamp.strftime('%Y-%m-%d %H:%M'))
-                historical_precip.append(data.precipitation)
+            columns = _as_columns(weather_data_list)
+            labels.extend(columns.labels)
+            historical_precip = columns.precipitation.tolist()
         
         # Process forecast data
         if forecasts:
-            sorted_forecasts = sorted(forecasts, key=lambda x: x.forecast_date)
-            for forecast in sorted_forecasts:
-                label = forecast.forecast_date.strftime('%Y-%m-%d')
-                if label not in labels:
-                    labels.append(label)
-                # Convert probability to percentage
-                forecast_precip_prob.append(forecast.precipitation_probability * 100)
-        
-        datasets = []
-        
-        if historical_precip:
-            datasets.append({
-                'label': 'Historical Precipitation (mm)',
-                'data': historical_precip,
-                'color': self.blue_colors[0],
-                'type': 'bar'
-            })
+            sorted_forecasts = sorted(forecasts, key=attrgetter('forecast_date'))
+            _merge_labels(labels, (f.forecast_date.strftime('%Y-%m-%d') for f in sorted_forecasts))
+            # Convert probability to percentage
+            forecast_precip_prob = [f.precipitation_probability * 100 for f in sorted_forecasts]
         
-        if forecast_precip_prob:
-            datasets.append({
-                'label': 'Forecast Precipitation Probability (%)',
-                'data': forecast_precip_prob,
-                'color': self.blue_colors[3],
+        datasets = [
+            {
+                'label': label,
+                'data': data,
+                'color': color,
                 'type': 'bar'
-            })
+            }
+            for label, data, color in (
+                ('Historical Precipitation (mm)', historical_precip, self.blue_colors[0]),
+                ('Forecast Precipitation Probability (%)', forecast_precip_prob, self.blue_colors[3])
+            )
+            if data
+        ]
         
         return ChartData(labels=labels, datasets=datasets)
 
     def prepare_wind_vector_data(
         self, 
-        weather_data_list: List[WeatherData]
+        weather_data_list: WeatherSeries
     ) -> Dict[str, any]:
         """Prepare wind vector graphics data
         
@@ -350,45 +523,41 @@ class VisualizationDataBuilder:
                 'compass_data': {}
             }
         
-        vectors = []
-        for data in weather_data_list:
-            # Convert wind direction and speed to vector components
-            direction_rad = math.radians(data.wind_direction)
-            u_component = data.wind_speed * math.sin(direction_rad)
-            v_component = data.wind_speed * math.cos(direction_rad)
-            
-            vectors.append({
-                'timestamp': data.timestamp.strftime('%Y-%m-%d %H:%M'),
-                'speed': round(data.wind_speed, 2),
-                'direction': round(data.wind_direction, 2),
-                'u': round(u_component, 2),
-                'v': round(v_component, 2)
-            })
+        columns = _as_columns(weather_data_list)
+        speeds = columns.wind_speed
+        directions = columns.wind_direction
+        
+        # Convert wind direction and speed to vector components
+        if NUMBA_AVAILABLE and speeds.size > _NUMBA_MIN_SIZE:
+            u_components = _wind_u(speeds, directions)
+            v_components = _wind_v(speeds, directions)
+        elif NUMEXPR_AVAILABLE and speeds.size > _NUMEXPR_MIN_SIZE:
+            u_components = numexpr.evaluate('speeds * sin(directions * 0.017453292519943295)')
+            v_components = numexpr.evaluate('speeds * cos(directions * 0.017453292519943295)')
+        else:
+            direction_rad = np.deg2rad(directions)
+            u_components = speeds * np.sin(direction_rad)
+            v_components = speeds * np.cos(direction_rad)
         
-        # Calculate compass data (direction frequency)
-        direction_bins = {
-            'N': 0, 'NE': 0, 'E': 0, 'SE': 0,
-            'S': 0, 'SW': 0, 'W': 0, 'NW': 0
-        }
+        vectors = [
+            {
+                'timestamp': label,
+                'speed': speed,
+                'direction': direction,
+                'u': u,
+                'v': v
+            }
+            for label, speed, direction, u, v in zip(
+                columns.labels,
+                np.round(speeds, 2).tolist(),
+                np.round(directions, 2).tolist(),
+                np.round(u_components, 2).tolist(),
+                np.round(v_components, 2).tolist()
+            )
+        ]
         
-        for data in weather_data_list:
-            direction = data.wind_direction
-            if 337.5 <= direction or direction < 22.5:
-                direction_bins['N'] += 1
-            elif 22.5 <= direction < 67.5:
-                direction_bins['NE'] += 1
-            elif 67.5 <= direction < 112.5:
-                direction_bins['E'] += 1
-            elif 112.5 <= direction < 157.5:
-                direction_bins['SE'] += 1
-            elif 157.5 <= direction < 202.5:
-                direction_bins['S'] += 1
-            elif 202.5 <= direction < 247.5:
-                direction_bins['SW'] += 1
-            elif 247.5 <= direction < 292.5:
-                direction_bins['W'] += 1
-            elif 292.5 <= direction < 337.5:
-                direction_bins['NW'] += 1
+        # Calculate compass data (direction frequency)
+        direction_bins = dict(zip(_COMPASS_NAMES, _compass_counts(directions).tolist()))
         
         return {
             'vectors': vectors,
@@ -397,7 +566,7 @@ class VisualizationDataBuilder:
 
     def prepare_humidity_chart(
         self, 
-        weather_data_list: List[WeatherData]
+        weather_data_list: WeatherSeries
     ) -> ChartData:
         """Prepare humidity chart data
         
@@ -410,9 +579,9 @@ class VisualizationDataBuilder:
         if not weather_data_list:
             return ChartData(labels=[], datasets=[])
         
-        sorted_data = sorted(weather_data_list, key=lambda x: x.timestamp)
-        labels = [data.timestamp.strftime('%Y-%m-%d %H:%M') for data in sorted_data]
-        humidity_values = [data.humidity for data in sorted_data]
+        columns = _as_columns(weather_data_list)
+        labels = list(columns.labels)
+        humidity_values = columns.humidity.tolist()
         
         datasets = [{
             'label': 'Humidity (%)',
@@ -425,7 +594,7 @@ class VisualizationDataBuilder:
 
     def prepare_pressure_chart(
         self, 
-        weather_data_list: List[WeatherData]
+        weather_data_list: WeatherSeries
     ) -> ChartData:
         """Prepare atmospheric pressure chart data
         
@@ -438,9 +607,9 @@ class VisualizationDataBuilder:
         if not weather_data_list:
             return ChartData(labels=[], datasets=[])
         
-        sorted_data = sorted(weather_data_list, key=lambda x: x.timestamp)
-        labels = [data.timestamp.strftime('%Y-%m-%d %H:%M') for data in sorted_data]
-        pressure_values = [data.pressure for data in sorted_data]
+        columns = _as_columns(weather_data_list)
+        labels = list(columns.labels)
+        pressure_values = columns.pressure.tolist()
         
         datasets = [{
             'label': 'Atmospheric Pressure (hPa)',
@@ -466,7 +635,7 @@ class VisualizationDataBuilder:
         if not accuracy_metrics_list:
             return ChartData(labels=[], datasets=[])
         
-        sorted_metrics = sorted(accuracy_metrics_list, key=lambda x: x.calculated_at)
+        sorted_metrics = sorted(accuracy_metrics_list, key=attrgetter('calculated_at'))
         labels = [m.calculated_at.strftime('%Y-%m-%d') for m in sorted_metrics]
         overall_accuracy = [m.overall_accuracy * 100 for m in sorted_metrics]
         temp_mae = [m.temperature_mae for m in sorted_metrics]
@@ -497,7 +666,7 @@ class VisualizationDataBuilder:
 
     def prepare_comparative_chart(
         self, 
-        current_data: List[WeatherData],
+        current_data: WeatherSeries,
         historical_average: List[float],
         metric: str = 'temperature'
     ) -> ChartData:
@@ -514,30 +683,25 @@ class VisualizationDataBuilder:
         if not current_data:
             return ChartData(labels=[], datasets=[])
         
-        sorted_data = sorted(current_data, key=lambda x: x.timestamp)
-        labels = [data.timestamp.strftime('%Y-%m-%d') for data in sorted_data]
-        
-        # Extract current values based on metric
-        if metric == 'temperature':
-            current_values = [data.temperature for data in sorted_data]
-            label_current = 'Current Temperature (°C)'
-            label_historical = 'Historical Average Temperature (°C)'
-        elif metric == 'precipitation':
-            current_values = [data.precipitation for data in sorted_data]
-            label_current = 'Current Precipitation (mm)'
-            label_historical = 'Historical Average Precipitation (mm)'
-        elif metric == 'humidity':
-            current_values = [data.humidity for data in sorted_data]
-            label_current = 'Current Humidity (%)'
-            label_historical = 'Historical Average Humidity (%)'
+        columns = _as_columns(current_data)
+        labels = list(columns.day_labels)
+        
+        # Extract current values based on metric; unknown metrics plot temperature
+        spec = _METRIC_MAP.get(metric)
+        if spec is not None:
+            getter, label_current, label_historical = spec
         else:
-            current_values = [data.temperature for data in sorted_data]
+            getter = _METRIC_MAP['temperature'][0]
             label_current = f'Current {metric}'
             label_historical = f'Historical Average {metric}'
+        current_values = getter(columns).tolist()
         
-        # Ensure historical_average matches length
-        if len(historical_average) < len(current_values):
-            historical_average = historical_average + [historical_average[-1]] * (len(current_values) - len(historical_average)) if historical_average else [0] * len(current_values)
+        # Ensure historical_average matches length, padding with its last value
+        pad = len(current_values) - len(historical_average)
+        if pad > 0:
+            fill = historical_average[-1] if historical_average else 0.0
+            historical_average = list(historical_average)
+            historical_average.extend([fill] * pad)
         
         datasets = [
             {
@@ -557,13 +721,67 @@ class VisualizationDataBuilder:
         return ChartData(labels=labels, datasets=datasets)
 
 
+def _analytics_fingerprint(
+    columns: _WeatherColumns,
+    forecasts: Optional[List[Forecast]],
+    accuracy_metrics: Optional[List[AccuracyMetrics]]
+) -> Tuple:
+    """Build a cache key covering every input field the analytics read
+    
+    Args:
+        columns: Time-ordered weather columns
+        forecasts: Optional forecast data
+        accuracy_metrics: Optional accuracy metrics
+        
+    Returns:
+        Hashable fingerprint of the analytics inputs
+    """
+    values = np.concatenate((
+        columns.temperature, columns.humidity, columns.pressure,
+        columns.wind_speed, columns.wind_direction, columns.precipitation
+    ))
+    forecast_key = tuple(
+        (f.forecast_date, f.predicted_temperature_high, f.predicted_temperature_low,
+         f.precipitation_probability)
+        for f in forecasts
+    ) if forecasts else None
+    accuracy_key = tuple(
+        (m.calculated_at, m.overall_accuracy, m.temperature_mae, m.precipitation_accuracy)
+        for m in accuracy_metrics
+    ) if accuracy_metrics else None
+    # Keep the raw timestamps and value bytes in the key rather than their
+    # hashes, so a hash collision cannot return another dataset's analytics
+    return (
+        len(columns), tuple(columns.timestamps), values.tobytes(),
+        forecast_key, accuracy_key
+    )
+
+
+def _copy_result(result: Dict[str, any]) -> Dict[str, any]:
+    """Copy the container levels of an analytics result
+    
+    Callers may add or replace trends and charts without touching the cached
+    result; the individual trend and chart payloads are shared.
+    """
+    return {
+        'trends': dict(result['trends']),
+        'charts': dict(result['charts'])
+    }
+
+
 class AnalyticsProcessor:
     """Main analytics processor combining trend analysis and visualization"""
     
-    def __init__(self):
-        """Initialize analytics processor"""
+    def __init__(self, result_cache_size: int = 32):
+        """Initialize analytics processor
+        
+        Args:
+            result_cache_size: Number of recent analytics results to memoize
+        """
         self.trend_analyzer = TrendAnalyzer()
         self.viz_builder = VisualizationDataBuilder()
+        self.result_cache_size = result_cache_size
+        self._result_cache: OrderedDict[Tuple, Dict[str, any]] = OrderedDict()
 
     def process_weather_analytics(
         self, 
@@ -579,20 +797,31 @@ class AnalyticsProcessor:
             accuracy_metrics: Optional accuracy metrics
             
         Returns:
-            Dictionary with all analytics and chart data
+            Dictionary with all analytics and chart data. Results for inputs
+            seen recently are served from a cache, so the nested trend and
+            chart payloads must be treated as read-only.
         """
+        # Sort and extract once; every stage below reads the same columns
+        columns = _as_columns(weather_data_list)
+        
+        cache_key = _analytics_fingerprint(columns, forecasts, accuracy_metrics)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            return _copy_result(cached)
+        
         # Calculate trends
-        temp_trend = self.trend_analyzer.calculate_temperature_trend(weather_data_list)
-        precip_pattern = self.trend_analyzer.calculate_precipitation_pattern(weather_data_list)
-        wind_stats = self.trend_analyzer.calculate_wind_statistics(weather_data_list)
-        humidity_pressure = self.trend_analyzer.calculate_humidity_pressure_stats(weather_data_list)
+        temp_trend = self.trend_analyzer.calculate_temperature_trend(columns)
+        precip_pattern = self.trend_analyzer.calculate_precipitation_pattern(columns)
+        wind_stats = self.trend_analyzer.calculate_wind_statistics(columns)
+        humidity_pressure = self.trend_analyzer.calculate_humidity_pressure_stats(columns)
         
         # Prepare chart data
-        temp_chart = self.viz_builder.prepare_temperature_chart(weather_data_list, forecasts)
-        precip_chart = self.viz_builder.prepare_precipitation_chart(weather_data_list, forecasts)
-        wind_vector_data = self.viz_builder.prepare_wind_vector_data(weather_data_list)
-        humidity_chart = self.viz_builder.prepare_humidity_chart(weather_data_list)
-        pressure_chart = self.viz_builder.prepare_pressure_chart(weather_data_list)
+        temp_chart = self.viz_builder.prepare_temperature_chart(columns, forecasts)
+        precip_chart = self.viz_builder.prepare_precipitation_chart(columns, forecasts)
+        wind_vector_data = self.viz_builder.prepare_wind_vector_data(columns)
+        humidity_chart = self.viz_builder.prepare_humidity_chart(columns)
+        pressure_chart = self.viz_builder.prepare_pressure_chart(columns)
         
         result = {
             'trends': {
@@ -602,17 +831,21 @@ class AnalyticsProcessor:
                 'humidity_pressure': humidity_pressure
             },
             'charts': {
-                'temperature': temp_chart.model_dump(),
-                'precipitation': precip_chart.model_dump(),
+                'temperature': temp_chart.fast_dump(),
+                'precipitation': precip_chart.fast_dump(),
                 'wind_vectors': wind_vector_data,
-                'humidity': humidity_chart.model_dump(),
-                'pressure': pressure_chart.model_dump()
+                'humidity': humidity_chart.fast_dump(),
+                'pressure': pressure_chart.fast_dump()
             }
         }
         
         # Add accuracy chart if metrics provided
         if accuracy_metrics:
             accuracy_chart = self.viz_builder.prepare_accuracy_chart(accuracy_metrics)
-            result['charts']['accuracy'] = accuracy_chart.model_dump()
+            result['charts']['accuracy'] = accuracy_chart.fast_dump()
+        
+        self._result_cache[cache_key] = result
+        if len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
         
-        return result
+        return _copy_result(result)
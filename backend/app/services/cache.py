@@ -1,25 +1,60 @@
 """Caching layer for weather data with fallback support"""
 import logging
-from typing import Optional, Dict
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
 from app.models import WeatherData, Location
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _format_cache_key(latitude: float, longitude: float) -> str:
+    """Format the cache key for a coordinate pair
+    
+    Args:
+        latitude: Latitude coordinate
+        longitude: Longitude coordinate
+        
+    Returns:
+        Cache key string
+    """
+    return f"{latitude:.4f},{longitude:.4f}"
+
+
 class WeatherCache:
-    """In-memory cache for weather data with TTL support"""
+    """In-memory cache for weather data with TTL support
+    
+    Entries are kept in write order. Every entry shares the same TTL, so the
+    expired entries always form a prefix of that order and purging or
+    counting them only touches the expired entries themselves. When the
+    cache is full, the oldest-written entry (the next to expire) is evicted.
+    """
 
-    def __init__(self, ttl_minutes: int = 30):
+    def __init__(self, ttl_minutes: int = 30, max_entries: int = 1024):
         """Initialize weather cache
         
         Args:
             ttl_minutes: Time-to-live for cached data in minutes
+            max_entries: Maximum number of cached locations
         """
         self.ttl_minutes = ttl_minutes
-        self._cache: Dict[str, tuple[WeatherData, datetime]] = {}
+        self.max_entries = max_entries
+        # key -> (data, monotonic time it was cached), oldest write first
+        self._cache: OrderedDict[str, Tuple[WeatherData, float]] = OrderedDict()
         logger.info(f"Weather cache initialized with TTL={ttl_minutes} minutes")
 
+    @property
+    def ttl_minutes(self) -> int:
+        """Time-to-live for cached data in minutes"""
+        return self._ttl_minutes
+
+    @ttl_minutes.setter
+    def ttl_minutes(self, value: int) -> None:
+        self._ttl_minutes = value
+        self._ttl_seconds = value * 60.0
+
     def _get_cache_key(self, location: Location) -> str:
         """Generate cache key for a location
         
@@ -29,7 +64,23 @@ class WeatherCache:
         Returns:
             Cache key string
         """
-        return f"{location.latitude:.4f},{location.longitude:.4f}"
+        return _format_cache_key(location.latitude, location.longitude)
+
+    def _count_expired(self, cutoff: float) -> int:
+        """Count entries cached before the cutoff
+        
+        Args:
+            cutoff: Monotonic time before which entries are expired
+            
+        Returns:
+            Length of the expired prefix
+        """
+        count = 0
+        for _, cached_at in self._cache.values():
+            if cached_at >= cutoff:
+                break
+            count += 1
+        return count
 
     def get(self, location: Location) -> Optional[WeatherData]:
         """Get cached weather data for a location
@@ -41,20 +92,21 @@ class WeatherCache:
             Cached WeatherData or None if not found or expired
         """
         key = self._get_cache_key(location)
+        entry = self._cache.get(key)
         
-        if key not in self._cache:
-            logger.debug(f"Cache miss for {location.city}")
+        if entry is None:
+            logger.debug("Cache miss for %s", location.city)
             return None
 
-        data, cached_at = self._cache[key]
-        age = datetime.now() - cached_at
+        data, cached_at = entry
+        age = time.monotonic() - cached_at
 
-        if age > timedelta(minutes=self.ttl_minutes):
-            logger.debug(f"Cache expired for {location.city} (age: {age})")
+        if age > self._ttl_seconds:
+            logger.debug("Cache expired for %s (age: %.1fs)", location.city, age)
             del self._cache[key]
             return None
 
-        logger.info(f"Cache hit for {location.city} (age: {age})")
+        logger.info("Cache hit for %s (age: %.1fs)", location.city, age)
         return data
 
     def set(self, location: Location, data: WeatherData) -> None:
@@ -65,7 +117,14 @@ class WeatherCache:
             data: WeatherData to cache
         """
         key = self._get_cache_key(location)
-        self._cache[key] = (data, datetime.now())
+        # Re-inserting moves the key to the newest end of the write order
+        self._cache.pop(key, None)
+        self._cache[key] = (data, time.monotonic())
+        
+        while len(self._cache) > self.max_entries:
+            evicted_key, _ = self._cache.popitem(last=False)
+            logger.debug("Evicted cached weather data for %s", evicted_key)
+        
         logger.debug(f"Cached weather data for {location.city}")
 
     def clear(self) -> None:
@@ -80,21 +139,15 @@ class WeatherCache:
         Returns:
             Number of entries removed
         """
-        now = datetime.now()
-        expired_keys = []
-
-        for key, (data, cached_at) in self._cache.items():
-            age = now - cached_at
-            if age > timedelta(minutes=self.ttl_minutes):
-                expired_keys.append(key)
+        removed = self._count_expired(time.monotonic() - self._ttl_seconds)
 
-        for key in expired_keys:
-            del self._cache[key]
+        for _ in range(removed):
+            self._cache.popitem(last=False)
 
-        if expired_keys:
-            logger.info(f"Removed {len(expired_keys)} expired cache entries")
+        if removed:
+            logger.info(f"Removed {removed} expired cache entries")
 
-        return len(expired_keys)
+        return removed
 
     def get_cache_stats(self) -> dict:
         """Get cache statistics
@@ -102,14 +155,8 @@ class WeatherCache:
         Returns:
             Dictionary with cache statistics
         """
-        now = datetime.now()
         total_entries = len(self._cache)
-        expired_count = 0
-
-        for data, cached_at in self._cache.values():
-            age = now - cached_at
-            if age > timedelta(minutes=self.ttl_minutes):
-                expired_count += 1
+        expired_count = self._count_expired(time.monotonic() - self._ttl_seconds)
 
         return {
             "total_entries": total_entries,
@@ -1,28 +1,113 @@
 """Data collection service for fetching weather data from external APIs"""
 import asyncio
 import logging
-from typing import Optional, List
+import random
+import re
+import time
+from functools import lru_cache
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime, timedelta
+from urllib.parse import urlencode
 import httpx
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from pydantic_core import from_json
 from app.models import WeatherData, Location
 from app.config import settings
 
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:  # httpx needs the http2 extra; HTTP/1.1 pooling is used instead
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# Most city IDs the OpenWeatherMap group endpoint accepts per request
+_GROUP_SIZE = 20
+
+
+@lru_cache(maxsize=4096)
+def _location_query(latitude: float, longitude: float, api_key: str) -> str:
+    """Encode the query string for a per-location request
+    
+    Args:
+        latitude: Location latitude
+        longitude: Location longitude
+        api_key: OpenWeatherMap API key
+        
+    Returns:
+        URL-encoded query string
+    """
+    return urlencode({"lat": latitude, "lon": longitude, "appid": api_key, "units": "metric"})
+
+
+class NonRetryableAPIError(Exception):
+    """Raised when the weather API rejects a request in a way retrying cannot fix"""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
 
 class APIClient:
     """HTTP client for external weather APIs"""
 
-    def __init__(self, api_key: Optional[str] = None, timeout: int = 10):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        timeout: int = 10,
+        cache_ttl: Optional[float] = None,
+        cache_max_entries: int = 1024
+    ):
         """Initialize API client
         
         Args:
             api_key: API key for weather service
             timeout: Request timeout in seconds
+            cache_ttl: Response cache lifetime in seconds (defaults to settings)
+            cache_max_entries: Maximum number of cached responses
         """
         self.api_key = api_key or settings.openweather_api_key
         self.timeout = timeout
         self.base_url = "https://api.openweathermap.org/data/2.5"
+        self.cache_ttl = settings.weather_cache_ttl_seconds if cache_ttl is None else cache_ttl
+        self.cache_max_entries = cache_max_entries
+        # (lat, lon, endpoint) -> (monotonic expiry, response data)
+        self._response_cache: Dict[Tuple[float, float, str], Tuple[float, dict]] = {}
+        self._inflight: Dict[Tuple[float, float, str], asyncio.Future] = {}
+        # Pooled client, created lazily on the event loop that first uses it
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for the running event loop
+        
+        A client's connections belong to the loop that opened them, so a new
+        client is created if the loop has changed or the old one was closed.
+        
+        Returns:
+            Shared httpx.AsyncClient
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+                # Concurrent requests multiplex over one connection under HTTP/2
+                http2=HTTP2_AVAILABLE
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and its connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
 
     async def fetch_current_weather(self, location: Location) -> Optional[dict]:
         """Fetch current weather data from OpenWeatherMap API
@@ -32,30 +117,11 @@ class APIClient:
             
         Returns:
             Weather data dict or None if request fails
+            
+        Raises:
+            NonRetryableAPIError: If the API rejects the request with a 4xx status
         """
-        if not self.api_key:
-            logger.warning("OpenWeatherMap API key not configured")
-            return None
-
-        url = f"{self.base_url}/weather"
-        params = {
-            "lat": location.latitude,
-            "lon": location.longitude,
-            "appid": self.api_key,
-            "units": "metric"
-        }
-
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error fetching weather data: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error fetching weather data: {e}")
-            return None
+        return await self._fetch_cached("weather", location, "weather data")
 
     async def fetch_forecast(self, location: Location) -> Optional[dict]:
         """Fetch weather forecast from OpenWeatherMap API
@@ -65,30 +131,217 @@ class APIClient:
             
         Returns:
             Forecast data dict or None if request fails
+            
+        Raises:
+            NonRetryableAPIError: If the API rejects the request with a 4xx status
+        """
+        return await self._fetch_cached("forecast", location, "forecast data")
+
+    async def fetch_group_weather(self, city_ids: List[int]) -> Optional[dict]:
+        """Fetch current weather for several cities in one request
+        
+        Args:
+            city_ids: OpenWeatherMap city IDs (at most 20)
+            
+        Returns:
+            Response dict with one entry per city under "list", or None if
+            request fails
+            
+        Raises:
+            NonRetryableAPIError: If the API rejects the request with a 4xx status
         """
         if not self.api_key:
             logger.warning("OpenWeatherMap API key not configured")
             return None
 
-        url = f"{self.base_url}/forecast"
         params = {
-            "lat": location.latitude,
-            "lon": location.longitude,
+            "id": ",".join(str(city_id) for city_id in city_ids),
             "appid": self.api_key,
             "units": "metric"
         }
+        result = await self._request("/group", "group weather data", params)
+        return None if result is None else result[1]
+
+    async def _fetch_cached(
+        self, endpoint: str, location: Location, description: str
+    ) -> Optional[dict]:
+        """Serve an endpoint response from the TTL cache or fetch it once
+        
+        Responses are cached per endpoint and location rounded to two decimal
+        places (about 1 km). Concurrent misses for the same key share a single
+        in-flight request.
+        
+        Args:
+            endpoint: API endpoint name ("weather" or "forecast")
+            location: Location to fetch data for
+            description: Human-readable data description for logs
+            
+        Returns:
+            Response dict or None if request fails
+        """
+        if not self.api_key:
+            logger.warning("OpenWeatherMap API key not configured")
+            return None
 
+        key = (round(location.latitude, 2), round(location.longitude, 2), endpoint)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            if time.monotonic() < cached[0]:
+                return cached[1]
+            del self._response_cache[key]
+
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(endpoint, location, description, key))
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the request for the others
+        return await asyncio.shield(pending)
+
+    async def _fetch(
+        self, endpoint: str, location: Location, description: str, key: tuple
+    ) -> Optional[dict]:
+        """Request an endpoint and cache a successful response
+        
+        Args:
+            endpoint: API endpoint name
+            location: Location to fetch data for
+            description: Human-readable data description for logs
+            key: Response cache key
+            
+        Returns:
+            Response dict or None if request fails
+        """
+        # A prebuilt query in the path spares httpx from re-encoding params
+        query = _location_query(location.latitude, location.longitude, self.api_key)
+        result = await self._request(f"/{endpoint}?{query}", description)
+        if result is None:
+            return None
+        response, data = result
+
+        ttl = self._response_ttl(response)
+        if ttl > 0:
+            if len(self._response_cache) >= self.cache_max_entries:
+                # Drop the oldest insertion to stay within the bound
+                self._response_cache.pop(next(iter(self._response_cache)))
+            self._response_cache[key] = (time.monotonic() + ttl, data)
+        return data
+
+    async def _request(
+        self, path: str, description: str, params: Optional[dict] = None
+    ) -> Optional[Tuple[httpx.Response, dict]]:
+        """Send a GET request and decode its JSON body
+        
+        Args:
+            path: Request path relative to the base URL
+            description: Human-readable data description for logs
+            params: Query parameters not already encoded in the path
+            
+        Returns:
+            Tuple of (response, decoded body) or None if request fails
+            
+        Raises:
+            NonRetryableAPIError: If the API rejects the request with a 4xx status
+        """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_client().get(path, params=params)
+            response.raise_for_status()
+            # pydantic-core's Rust parser works on the raw bytes directly
+            data = from_json(response.content)
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            # Client errors (bad key, unknown location) will not succeed on retry;
+            # rate limiting and server errors might
+            if 400 <= status < 500 and status not in (408, 429):
+                logger.error("API rejected request for %s: %s", description, e)
+                raise NonRetryableAPIError(status, str(e)) from e
+            logger.error("HTTP error fetching %s: %s", description, e)
+            return None
         except httpx.HTTPError as e:
-            logger.error(f"HTTP error fetching forecast data: {e}")
+            logger.error("HTTP error fetching %s: %s", description, e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error fetching forecast data: {e}")
+            logger.error("Unexpected error fetching %s: %s", description, e)
             return None
+        return response, data
+
+    def _response_ttl(self, response: httpx.Response) -> float:
+        """Pick the cache lifetime for a response
+        
+        Honors an upstream Cache-Control header when present and falls back
+        to the configured TTL otherwise.
+        
+        Args:
+            response: Successful API response
+            
+        Returns:
+            Lifetime in seconds; 0 disables caching
+        """
+        header = response.headers.get("cache-control")
+        if isinstance(header, str):
+            if "no-store" in header or "no-cache" in header:
+                return 0
+            match = _MAX_AGE_RE.search(header)
+            if match:
+                return float(match.group(1))
+        return self.cache_ttl
+
+
+class _OWMMain(BaseModel):
+    """Required part of the "main" block of an OpenWeatherMap response"""
+    temp: float = Field(..., ge=-100, le=60)
+    humidity: float = Field(..., ge=0, le=100)
+    pressure: float = Field(..., gt=0)
+
+
+class _OWMWind(BaseModel):
+    """Required part of the "wind" block of an OpenWeatherMap response"""
+    speed: float = Field(..., ge=0, le=150)
+    deg: float = Field(..., ge=0, le=360)
+
+
+class _OWMClouds(BaseModel):
+    """Required part of the "clouds" block of an OpenWeatherMap response"""
+    all: float = Field(..., ge=0, le=100)
+
+
+class _OWMCondition(BaseModel):
+    """Required part of a "weather" condition entry"""
+    main: str = Field(..., min_length=1, max_length=100)
+
+
+class _OWMRain(BaseModel):
+    """Optional "rain" block of an OpenWeatherMap response"""
+    one_hour: float = Field(0, ge=0, alias="1h")
+
+
+class OWMCurrentResponse(BaseModel):
+    """Fields of an OpenWeatherMap current weather response the collector relies on"""
+    main: _OWMMain
+    wind: _OWMWind
+    clouds: _OWMClouds
+    weather: List[_OWMCondition] = Field(..., min_length=1)
+    rain: Optional[_OWMRain] = None
+
+
+# Built once so validation runs entirely in pydantic-core
+_RESPONSE_VALIDATOR = TypeAdapter(OWMCurrentResponse)
+
+# Human-readable names for error locations reported by the validator
+_FIELD_LABELS = {
+    ("main",): "main weather",
+    ("main", "temp"): "temperature",
+    ("main", "humidity"): "humidity",
+    ("main", "pressure"): "pressure",
+    ("wind",): "wind",
+    ("wind", "speed"): "wind speed",
+    ("wind", "deg"): "wind direction",
+    ("clouds",): "cloud cover",
+    ("clouds", "all"): "cloud cover",
+    ("weather",): "weather condition",
+    ("rain",): "precipitation",
+    ("rain", "1h"): "precipitation",
+}
 
 
 class DataValidator:
@@ -112,50 +365,32 @@ class DataValidator:
         if not data:
             return False, "Data is empty"
 
-        # Check for required fields
-        main_data = data.get('main', {})
-        wind_data = data.get('wind', {})
-        clouds_data = data.get('clouds', {})
-        weather_data = data.get('weather', [])
-
-        if not main_data:
-            return False, "Missing main weather data"
-
-        if 'temp' not in main_data:
-            return False, "Missing temperature data"
-
-        if 'humidity' not in main_data:
-            return False, "Missing humidity data"
-
-        if 'pressure' not in main_data:
-            return False, "Missing pressure data"
-
-        if 'speed' not in wind_data:
-            return False, "Missing wind speed data"
-
-        if 'deg' not in wind_data:
-            return False, "Missing wind direction data"
-
-        if 'all' not in clouds_data:
-            return False, "Missing cloud cover data"
-
-        if not weather_data or 'main' not in weather_data[0]:
-            return False, "Missing weather condition data"
-
-        # Validate value ranges
-        temp = main_data.get('temp')
-        if temp is None or temp < -100 or temp > 60:
-            return False, f"Invalid temperature: {temp}"
-
-        humidity = main_data.get('humidity')
-        if humidity is None or humidity < 0 or humidity > 100:
-            return False, f"Invalid humidity: {humidity}"
+        try:
+            _RESPONSE_VALIDATOR.validate_python(data)
+        except ValidationError as e:
+            return False, DataValidator._describe_error(e)
+        return True, None
 
-        wind_speed = wind_data.get('speed')
-        if wind_speed is None or wind_speed < 0 or wind_speed > 150:
-            return False, f"Invalid wind speed: {wind_speed}"
+    @staticmethod
+    def _describe_error(error: ValidationError) -> str:
+        """Turn the first validation error into a short message
+        
+        Args:
+            error: Validation error raised for an API response
+            
+        Returns:
+            Error message naming the offending field
+        """
+        detail = error.errors(include_url=False)[0]
+        loc = detail["loc"]
+        # Every problem inside the condition list is reported as the list itself
+        if loc and loc[0] == "weather":
+            loc = ("weather",)
+        label = _FIELD_LABELS.get(tuple(loc), ".".join(str(part) for part in loc))
 
-        return True, None
+        if detail["type"] == "missing":
+            return f"Missing {label} data"
+        return f"Invalid {label}: {detail['input']}"
 
 
 class WeatherDataCollector:
@@ -170,25 +405,35 @@ class WeatherDataCollector:
         self.api_client = api_client or APIClient()
         self.validator = DataValidator()
         self.retry_attempts = 3
-        self.retry_delay = 1  # seconds
-
-    async def fetch_weather_data(self, location: Location) -> Optional[WeatherData]:
+        self.retry_delay = 1  # seconds, base of the backoff
+        self.max_retry_delay = 4  # seconds, cap on a single backoff sleep
+        # Caps concurrent upstream requests across a collect_for_locations fan-out
+        self._request_slots = asyncio.Semaphore(settings.max_concurrent_requests)
+
+    async def fetch_weather_data(
+        self, location: Location, timestamp: Optional[datetime] = None
+    ) -> Optional[WeatherData]:
         """Fetch and validate weather data for a location with retry logic
         
         Args:
             location: Location to fetch weather for
+            timestamp: Observation time to record (defaults to now)
             
         Returns:
             WeatherData object or None if fetch fails
         """
         for attempt in range(self.retry_attempts):
             try:
-                raw_data = await self.api_client.fetch_current_weather(location)
+                # Only the request holds a slot; backoff sleeps do not
+                async with self._request_slots:
+                    raw_data = await self.api_client.fetch_current_weather(location)
 
                 if raw_data is None:
                     if attempt < self.retry_attempts - 1:
-                        delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                        logger.info(f"Retrying in {delay}s (attempt {attempt + 1}/{self.retry_attempts})")
+                        delay = self._backoff_delay(attempt)
+                        logger.info(
+                            "Retrying in %.2fs (attempt %d/%d)", delay, attempt + 1, self.retry_attempts
+                        )
                         await asyncio.sleep(delay)
                         continue
                     else:
@@ -198,69 +443,167 @@ class WeatherDataCollector:
                 # Validate data
                 is_valid, error_msg = self.validator.validate_data(raw_data)
                 if not is_valid:
-                    logger.error(f"Data validation failed: {error_msg}")
+                    logger.error("Data validation failed: %s", error_msg)
                     if attempt < self.retry_attempts - 1:
-                        delay = self.retry_delay * (2 ** attempt)
-                        await asyncio.sleep(delay)
+                        await asyncio.sleep(self._backoff_delay(attempt))
                         continue
                     else:
                         return None
 
                 # Convert to WeatherData model
-                weather_data = self._parse_weather_data(raw_data, location)
-                logger.info(f"Successfully collected weather data for {location.city}")
+                weather_data = self._parse_weather_data(raw_data, location, timestamp)
+                logger.info("Successfully collected weather data for %s", location.city)
                 return weather_data
 
+            except NonRetryableAPIError as e:
+                logger.error("Giving up on %s without retrying: %s", location.city, e)
+                return None
+
             except Exception as e:
-                logger.error(f"Error during data collection (attempt {attempt + 1}): {e}")
+                logger.error("Error during data collection (attempt %d): %s", attempt + 1, e)
                 if attempt < self.retry_attempts - 1:
-                    delay = self.retry_delay * (2 ** attempt)
-                    await asyncio.sleep(delay)
+                    await asyncio.sleep(self._backoff_delay(attempt))
                 else:
                     return None
 
         return None
 
-    def _parse_weather_data(self, raw_data: dict, location: Location) -> WeatherData:
+    def _backoff_delay(self, attempt: int) -> float:
+        """Pick a full-jitter exponential backoff delay
+        
+        Randomizing over the whole window keeps concurrent locations from
+        retrying in lockstep after a shared upstream outage.
+        
+        Args:
+            attempt: Zero-based attempt number that just failed
+            
+        Returns:
+            Delay in seconds
+        """
+        return random.uniform(0, min(self.max_retry_delay, self.retry_delay * (2 ** attempt)))
+
+    def _parse_weather_data(
+        self, raw_data: dict, location: Location, timestamp: Optional[datetime] = None
+    ) -> WeatherData:
         """Parse raw API response into WeatherData model
         
+        The response must already have passed DataValidator, whose schema
+        covers every WeatherData constraint, so the model is built without
+        running validation a second time.
+        
         Args:
             raw_data: Raw weather data from API
             location: Location object
+            timestamp: Observation time to record (defaults to now)
             
         Returns:
             WeatherData object
         """
-        main = raw_data.get('main', {})
-        wind = raw_data.get('wind', {})
-        clouds = raw_data.get('clouds', {})
-        weather = raw_data.get('weather', [{}])[0]
+        main = raw_data['main']
+        wind = raw_data['wind']
+        rain = raw_data.get('rain') or {}
 
-        return WeatherData(
+        return WeatherData.model_construct(
             location=location,
-            timestamp=datetime.now(),
-            temperature=main.get('temp', 0),
-            humidity=main.get('humidity', 0),
-            pressure=main.get('pressure', 0),
-            wind_speed=wind.get('speed', 0),
-            wind_direction=wind.get('deg', 0),
-            precipitation=raw_data.get('rain', {}).get('1h', 0),
-            cloud_cover=clouds.get('all', 0),
-            weather_condition=weather.get('main', 'Unknown')
+            timestamp=timestamp or datetime.now(),
+            temperature=float(main['temp']),
+            humidity=float(main['humidity']),
+            pressure=float(main['pressure']),
+            wind_speed=float(wind['speed']),
+            wind_direction=float(wind['deg']),
+            precipitation=float(rain.get('1h', 0)),
+            cloud_cover=float(raw_data['clouds']['all']),
+            weather_condition=raw_data['weather'][0]['main']
         )
 
     async def collect_for_locations(self, locations: List[Location]) -> List[WeatherData]:
         """Collect weather data for multiple locations concurrently
         
+        Locations with an OpenWeatherMap city ID are fetched in batches
+        through the group endpoint; the rest are fetched one by one.
+        
         Args:
             locations: List of locations to collect data for
             
         Returns:
             List of successfully collected WeatherData objects
         """
-        tasks = [self.fetch_weather_data(loc) for loc in locations]
-        results = await asyncio.gather(*tasks)
-        return [data for data in results if data is not None]
+        # Observations collected in one batch share a timestamp
+        timestamp = datetime.now()
+        single = [i for i, loc in enumerate(locations) if loc.city_id is None]
+        grouped = [i for i, loc in enumerate(locations) if loc.city_id is not None]
+        batches = [grouped[i:i + _GROUP_SIZE] for i in range(0, len(grouped), _GROUP_SIZE)]
+
+        tasks = [self.fetch_weather_data(locations[i], timestamp) for i in single]
+        tasks += [
+            self._fetch_group([locations[i] for i in batch], timestamp) for batch in batches
+        ]
+        # One failing location must not abort the others still in flight
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Map results back onto input positions to keep the caller's order
+        per_location: list = [None] * len(locations)
+        for i, result in zip(single, results):
+            per_location[i] = result
+        for batch, result in zip(batches, results[len(single):]):
+            if isinstance(result, BaseException):
+                result = [result] * len(batch)
+            for i, item in zip(batch, result):
+                per_location[i] = item
+
+        collected = []
+        for location, result in zip(locations, per_location):
+            if isinstance(result, BaseException):
+                logger.error("Data collection failed for %s: %s", location.city, result)
+            elif result is not None:
+                collected.append(result)
+        return collected
+
+    async def _fetch_group(
+        self, locations: List[Location], timestamp: datetime
+    ) -> List[Optional[WeatherData]]:
+        """Fetch one batch of locations through the group endpoint
+        
+        Falls back to per-location fetches (with their retries) if the
+        batched request fails or is rejected, so one bad city ID cannot fail
+        the whole batch.
+        
+        Args:
+            locations: Locations with city IDs, at most the group size
+            timestamp: Observation time to record
+            
+        Returns:
+            WeatherData or None for each location, in input order
+        """
+        try:
+            async with self._request_slots:
+                raw = await self.api_client.fetch_group_weather(
+                    [loc.city_id for loc in locations]
+                )
+        except NonRetryableAPIError as e:
+            logger.warning("Group request rejected, fetching %d locations individually: %s",
+                           len(locations), e)
+            raw = None
+        if raw is None:
+            return list(await asyncio.gather(
+                *(self.fetch_weather_data(loc, timestamp) for loc in locations)
+            ))
+
+        by_id = {item.get("id"): item for item in raw.get("list", [])}
+        parsed = []
+        for location in locations:
+            item = by_id.get(location.city_id)
+            if item is None:
+                logger.warning("Group response missing city %s (%s)", location.city_id, location.city)
+                parsed.append(None)
+                continue
+            is_valid, error_msg = self.validator.validate_data(item)
+            if not is_valid:
+                logger.error("Data validation failed for %s: %s", location.city, error_msg)
+                parsed.append(None)
+                continue
+            parsed.append(self._parse_weather_data(item, location, timestamp))
+        return parsed
 
     def validate_data(self, data: WeatherData) -> tuple[bool, Optional[str]]:
         """Validate WeatherData object
@@ -1,14 +1,23 @@
 """Gemini LLM integration for natural language weather insights"""
+import hashlib
 import logging
 import os
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from dataclasses import dataclass
+from functools import lru_cache
 import json
+import re
+import time
+from collections import deque
 from app.models import Forecast, WeatherData, Location
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Markdown emphasis markers stripped from model responses
+_MD_STAR_RE = re.compile(r"\*+")
+
 
 @dataclass
 class WeatherContext:
@@ -19,6 +28,83 @@ class WeatherContext:
     historical_data: Optional[List[WeatherData]] = None
 
 
+# Prompt text is a pure function of a few rounded values, so repeated requests
+# for the same forecasts reuse the built string instead of reformatting it.
+
+@lru_cache(maxsize=512)
+def _forecast_summary_prompt(city: str, country: str, rows: tuple) -> str:
+    """Format the forecast summary prompt
+    
+    Args:
+        city: Location city name
+        country: Location country name
+        rows: Tuples of (date, high, low, condition, precipitation %, confidence %)
+        
+    Returns:
+        Formatted prompt string
+    """
+    forecast_details = "\n".join(
+        f"- {day}: High {high:.1f}°C, "
+        f"Low {low:.1f}°C, "
+        f"{condition}, "
+        f"Precipitation: {precipitation:.0f}%, "
+        f"Confidence: {confidence:.0f}%"
+        for day, high, low, condition, precipitation, confidence in rows
+    )
+
+    return f"""Generate a natural language weather forecast summary for {city}, {country}.
+
+Weather Forecast:
+{forecast_details}
+
+Please provide:
+1. A brief overview of the weather pattern for the week
+2. Any notable weather changes or trends
+3. Practical advice for planning activities
+
+Keep the summary concise, friendly, and easy to understand."""
+
+
+@lru_cache(maxsize=512)
+def _weather_explanation_prompt(current: tuple, forecast: tuple) -> str:
+    """Format the weather explanation prompt
+    
+    Args:
+        current: Tuple of (city, country, temperature, humidity, pressure,
+            wind speed, wind direction, condition, precipitation)
+        forecast: Tuple of (date, high, low, condition, precipitation %)
+        
+    Returns:
+        Formatted prompt string
+    """
+    (city, country, temperature, humidity, pressure,
+     wind_speed, wind_direction, condition, precipitation) = current
+    day, high, low, forecast_condition, precipitation_probability = forecast
+
+    return f"""Explain the weather pattern for {city}, {country}.
+
+Current Conditions:
+- Temperature: {temperature:.1f}°C
+- Humidity: {humidity:.0f}%
+- Pressure: {pressure:.1f} hPa
+- Wind: {wind_speed:.1f} m/s from {wind_direction:.0f}°
+- Conditions: {condition}
+- Precipitation: {precipitation:.1f} mm
+
+Forecast for {day}:
+- High: {high:.1f}°C
+- Low: {low:.1f}°C
+- Conditions: {forecast_condition}
+- Precipitation Probability: {precipitation_probability:.0f}%
+
+Please explain:
+1. What meteorological factors are influencing this weather
+2. Why the forecast predicts these conditions
+3. What this means for daily activities
+
+Use simple, accessible language."""
+
+
 class PromptBuilder:
     """Builds prompts with weather context for Gemini API"""
     
@@ -39,30 +125,18 @@ class PromptBuilder:
             return "Generate a brief weather summary."
         
         location = forecasts[0].location
-        forecast_details = []
-        
-        for forecast in forecasts[:7]:  # Limit to 7 days
-            forecast_details.append(
-                f"- {forecast.forecast_date}: High {forecast.predicted_temperature_high:.1f}°C, "
-                f"Low {forecast.predicted_temperature_low:.1f}°C, "
-                f"{forecast.weather_condition}, "
-                f"Precipitation: {forecast.precipitation_probability*100:.0f}%, "
-                f"Confidence: {forecast.confidence_score*100:.0f}%"
+        rows = tuple(
+            (
+                forecast.forecast_date,
+                round(forecast.predicted_temperature_high, 1),
+                round(forecast.predicted_temperature_low, 1),
+                forecast.weather_condition,
+                round(forecast.precipitation_probability * 100),
+                round(forecast.confidence_score * 100)
             )
-        
-        prompt = f"""Generate a natural language weather forecast summary for {location.city}, {location.country}.
-
-Weather Forecast:
-{chr(10).join(forecast_details)}
-
-Please provide:
-1. A brief overview of the weather pattern for the week
-2. Any notable weather changes or trends
-3. Practical advice for planning activities
-
-Keep the summary concise, friendly, and easy to understand."""
-        
-        return prompt
+            for forecast in forecasts[:7]  # Limit to 7 days
+        )
+        return _forecast_summary_prompt(location.city, location.country, rows)
 
     def build_weather_explanation_prompt(self, current_weather: WeatherData, 
                                        forecast: Forecast) -> str:
@@ -75,30 +149,27 @@ Keep the summary concise, friendly, and easy to understand."""
         Returns:
             Formatted prompt string
         """
-        prompt = f"""Explain the weather pattern for {current_weather.location.city}, {current_weather.location.country}.
-
-Current Conditions:
-- Temperature: {current_weather.temperature:.1f}°C
-- Humidity: {current_weather.humidity:.0f}%
-- Pressure: {current_weather.pressure:.1f} hPa
-- Wind: {current_weather.wind_speed:.1f} m/s from {current_weather.wind_direction:.0f}°
-- Conditions: {current_weather.weather_condition}
-- Precipitation: {current_weather.precipitation:.1f} mm
-
-Forecast for {forecast.forecast_date}:
-- High: {forecast.predicted_temperature_high:.1f}°C
-- Low: {forecast.predicted_temperature_low:.1f}°C
-- Conditions: {forecast.weather_condition}
-- Precipitation Probability: {forecast.precipitation_probability*100:.0f}%
-
-Please explain:
-1. What meteorological factors are influencing this weather
-2. Why the forecast predicts these conditions
-3. What this means for daily activities
-
-Use simple, accessible language."""
-        
-        return prompt
+        w = current_weather
+        return _weather_explanation_prompt(
+            (
+                w.location.city,
+                w.location.country,
+                round(w.temperature, 1),
+                round(w.humidity),
+                round(w.pressure, 1),
+                round(w.wind_speed, 1),
+                round(w.wind_direction),
+                w.weather_condition,
+                round(w.precipitation, 1)
+            ),
+            (
+                forecast.forecast_date,
+                round(forecast.predicted_temperature_high, 1),
+                round(forecast.predicted_temperature_low, 1),
+                forecast.weather_condition,
+                round(forecast.precipitation_probability * 100)
+            )
+        )
 
     def build_question_answer_prompt(self, question: str, context: WeatherContext) -> str:
         """Build prompt for answering user questions about weather
@@ -159,13 +230,7 @@ class ResponseParser:
         Returns:
             Formatted summary text
         """
-        # Clean up response text
-        cleaned = response_text.strip()
-        
-        # Remove any markdown formatting if present
-        cleaned = cleaned.replace('**', '').replace('*', '')
-        
-        return cleaned
+        return self._clean(response_text)
 
     def parse_explanation_response(self, response_text: str) -> str:
         """Parse weather explanation response
@@ -176,9 +241,7 @@ class ResponseParser:
         Returns:
             Formatted explanation text
         """
-        cleaned = response_text.strip()
-        cleaned = cleaned.replace('**', '').replace('*', '')
-        return cleaned
+        return self._clean(response_text)
 
     def parse_answer_response(self, response_text: str) -> str:
         """Parse question answer response
@@ -189,21 +252,42 @@ class ResponseParser:
         Returns:
             Formatted answer text
         """
-        cleaned = response_text.strip()
-        cleaned = cleaned.replace('**', '').replace('*', '')
-        return cleaned
+        return self._clean(response_text)
+
+    @staticmethod
+    def _clean(response_text: str) -> str:
+        """Trim a response and strip markdown emphasis in a single pass
+        
+        Args:
+            response_text: Raw response from Gemini
+            
+        Returns:
+            Cleaned text
+        """
+        return _MD_STAR_RE.sub("", response_text.strip())
 
 
 class GeminiClient:
     """Client for Google Gemini API"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        cache_max_entries: int = 512
+    ):
         """Initialize Gemini client
         
         Args:
             api_key: Gemini API key (defaults to environment variable)
+            cache_ttl: Response cache lifetime in seconds (defaults to settings)
+            cache_max_entries: Maximum number of cached responses
         """
         self.api_key = api_key or os.getenv('GEMINI_API_KEY')
+        self.cache_ttl = settings.gemini_cache_ttl_seconds if cache_ttl is None else cache_ttl
+        self.cache_max_entries = cache_max_entries
+        # Prompt digest -> (monotonic expiry, response text)
+        self._response_cache: Dict[str, tuple[float, str]] = {}
         self.prompt_builder = PromptBuilder()
         self.response_parser = ResponseParser()
         
@@ -211,6 +295,8 @@ class GeminiClient:
         self.request_queue: List[Dict[str, Any]] = []
         self.max_requests_per_minute = 60
         self.last_request_time: Optional[datetime] = None
+        # Monotonic send times of requests within the last minute
+        self._request_times: deque[float] = deque(maxlen=self.max_requests_per_minute)
         
         # Fallback responses
         self.fallback_responses = {
@@ -218,6 +304,13 @@ class GeminiClient:
             'explanation': "Weather patterns are influenced by atmospheric pressure, temperature, and humidity. Check the current conditions and forecast for specific details.",
             'answer': "I'm currently unable to provide a detailed answer. Please refer to the weather forecast and current conditions for information."
         }
+        
+        # Simulated responses used when the live API call fails, by prompt kind
+        self._simulated_handlers = {
+            'summary': self._generate_simulated_summary,
+            'explanation': self._generate_simulated_explanation,
+            'answer': self._generate_simulated_answer
+        }
 
     def generate_forecast_summary(self, forecasts: List[Forecast]) -> str:
         """Generate natural language summary of weather forecast
@@ -236,7 +329,7 @@ class GeminiClient:
             prompt = self.prompt_builder.build_forecast_summary_prompt(forecasts)
             
             # Make API call (simulated for now)
-            response = self._call_gemini_api(prompt)
+            response = self._call_gemini_api(prompt, 'summary')
             
             # Parse response
             summary = self.response_parser.parse_summary_response(response)
@@ -244,7 +337,7 @@ class GeminiClient:
             return summary
             
         except Exception as e:
-            logger.error(f"Error generating forecast summary: {e}")
+            logger.error("Error generating forecast summary: %s", e)
             return self.fallback_responses['summary']
 
     def explain_weather_pattern(self, current_weather: WeatherData, 
@@ -265,7 +358,7 @@ class GeminiClient:
             )
             
             # Make API call
-            response = self._call_gemini_api(prompt)
+            response = self._call_gemini_api(prompt, 'explanation')
             
             # Parse response
             explanation = self.response_parser.parse_explanation_response(response)
@@ -273,7 +366,7 @@ class GeminiClient:
             return explanation
             
         except Exception as e:
-            logger.error(f"Error explaining weather pattern: {e}")
+            logger.error("Error explaining weather pattern: %s", e)
             return self.fallback_responses['explanation']
 
     def answer_question(self, question: str, context: WeatherContext) -> str:
@@ -291,7 +384,7 @@ class GeminiClient:
             prompt = self.prompt_builder.build_question_answer_prompt(question, context)
             
             # Make API call
-            response = self._call_gemini_api(prompt)
+            response = self._call_gemini_api(prompt, 'answer')
             
             # Parse response
             answer = self.response_parser.parse_answer_response(response)
@@ -299,18 +392,28 @@ class GeminiClient:
             return answer
             
         except Exception as e:
-            logger.error(f"Error answering question: {e}")
+            logger.error("Error answering question: %s", e)
             return self.fallback_responses['answer']
 
-    def _call_gemini_api(self, prompt: str) -> str:
+    def _call_gemini_api(self, prompt: str, kind: str = 'answer') -> str:
         """Make API call to Gemini
         
         Args:
             prompt: Formatted prompt
+            kind: Prompt kind ('summary', 'explanation' or 'answer'), used to
+                pick the simulated response if the call fails
             
         Returns:
             API response text
         """
+        # Identical prompts within the TTL reuse the earlier answer
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            if time.monotonic() < cached[0]:
+                return cached[1]
+            del self._response_cache[key]
+
         # Check rate limits
         if self._is_rate_limited():
             logger.warning("Rate limit reached, queueing request")
@@ -331,23 +434,35 @@ class GeminiClient:
             model = genai.GenerativeModel('gemini-pro')
             response = model.generate_content(prompt)
             
+            self._request_times.append(time.monotonic())
             self.last_request_time = datetime.now()
             
             if response.text:
+                self._cache_response(key, response.text)
                 return response.text
             else:
                 logger.warning("Empty response from Gemini API")
                 raise Exception("Empty response from API")
                 
         except Exception as e:
-            logger.error(f"Gemini API call failed: {e}")
+            logger.error("Gemini API call failed: %s", e)
             # Return simulated response as fallback
-            if "forecast summary" in prompt.lower():
-                return self._generate_simulated_summary(prompt)
-            elif "explain" in prompt.lower():
-                return self._generate_simulated_explanation(prompt)
-            else:
-                return self._generate_simulated_answer(prompt)
+            handler = self._simulated_handlers.get(kind, self._generate_simulated_answer)
+            return handler(prompt)
+
+    def _cache_response(self, key: str, text: str) -> None:
+        """Store a Gemini response for reuse by identical prompts
+        
+        Args:
+            key: Prompt digest
+            text: Response text
+        """
+        if self.cache_ttl <= 0:
+            return
+        if key not in self._response_cache and len(self._response_cache) >= self.cache_max_entries:
+            # Drop the oldest insertion to stay within the bound
+            self._response_cache.pop(next(iter(self._response_cache)))
+        self._response_cache[key] = (time.monotonic() + self.cache_ttl, text)
 
     def _is_rate_limited(self) -> bool:
         """Check if rate limit has been reached
@@ -355,13 +470,11 @@ class GeminiClient:
         Returns:
             True if rate limited
         """
-        if not self.last_request_time:
-            return False
-        
-        time_since_last = (datetime.now() - self.last_request_time).total_seconds()
-        
-        # Simple rate limiting: max 1 request per second
-        return time_since_last < 1.0
+        # Sliding one-minute window over recent send times
+        now = time.monotonic()
+        while self._request_times and now - self._request_times[0] > 60:
+            self._request_times.popleft()
+        return len(self._request_times) >= self.max_requests_per_minute
 
     def _queue_request(self, prompt: str) -> None:
         """Queue a request for later processing
@@ -373,7 +486,7 @@ class GeminiClient:
             'prompt': prompt,
             'timestamp': datetime.now()
         })
-        logger.info(f"Request queued. Queue size: {len(self.request_queue)}")
+        logger.info("Request queued. Queue size: %d", len(self.request_queue))
 
     def handle_rate_limit(self) -> Dict[str, Any]:
         """Handle rate limit situation
@@ -2,7 +2,10 @@
 import logging
 from typing import List, Optional, Tuple
 from datetime import datetime, date, timedelta
+from operator import attrgetter
 import numpy as np
+import joblib
+from joblib import Parallel, delayed
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
@@ -10,6 +13,57 @@ from app.models import WeatherData, Forecast, Location
 
 logger = logging.getLogger(__name__)
 
+# Observation fields making up the first seven model features, in order
+_OBSERVATION_FIELDS = (
+    'temperature', 'humidity', 'pressure', 'wind_speed',
+    'wind_direction', 'precipitation', 'cloud_cover'
+)
+_OBSERVATION_FEATURES = attrgetter(*_OBSERVATION_FIELDS)
+
+# sklearn trees split on float32 internally; building features in that dtype
+# avoids a converted copy on every fit and predict
+_FEATURE_DTYPE = np.float32
+
+# Structured record layout for observation batches held as columns
+OBSERVATION_DTYPE = np.dtype([(name, _FEATURE_DTYPE) for name in _OBSERVATION_FIELDS])
+
+# Mean and spread of the synthetic observation features used for forecasting
+_SYNTHETIC_MEANS = np.array([15.0, 65.0, 1013.0, 5.0, 180.0, 0.5, 40.0])
+_SYNTHETIC_STDS = np.array([5.0, 10.0, 10.0, 2.0, 90.0, 0.5, 20.0])
+
+# Estimators added per incremental update, and the size past which an update
+# refits from scratch instead of growing the ensemble further
+_WARM_START_ESTIMATORS = 20
+_MAX_ESTIMATORS = 500
+
+# Mean |z-score| of new observations (under the fitted scaler) beyond which an
+# update is treated as drift and the model is refit from scratch
+_DRIFT_THRESHOLD = 3.0
+
+# Forecast condition labels, in the order their rules are checked
+_WEATHER_CONDITIONS = ("Snow", "Rainy", "Drizzle", "Sunny", "Partly Cloudy", "Cloudy")
+
+
+def _condition_code(temp_high: float, precipitation: float) -> int:
+    """Index into _WEATHER_CONDITIONS for a single predicted day
+    
+    Args:
+        temp_high: Predicted high temperature
+        precipitation: Predicted precipitation
+        
+    Returns:
+        Condition index
+    """
+    if precipitation > 5:
+        return 0 if temp_high < 0 else 1
+    if precipitation > 1:
+        return 2
+    if temp_high > 30:
+        return 3
+    if temp_high > 20:
+        return 4
+    return 5
+
 
 class FeatureExtractor:
     """Extracts and normalizes features from weather data for ML model"""
@@ -18,6 +72,9 @@ class FeatureExtractor:
         """Initialize feature extractor"""
         self.scaler = StandardScaler()
         self.is_fitted = False
+        # Scaler transform folded into x * _inv_scale + _offset once fitted
+        self._inv_scale: Optional[np.ndarray] = None
+        self._offset: Optional[np.ndarray] = None
 
     def extract_features(self, weather_data: WeatherData) -> np.ndarray:
         """Extract features from a single weather data point
@@ -28,21 +85,12 @@ class FeatureExtractor:
         Returns:
             Feature array
         """
-        features = np.array([
-            weather_data.temperature,
-            weather_data.humidity,
-            weather_data.pressure,
-            weather_data.wind_speed,
-            weather_data.wind_direction,
-            weather_data.precipitation,
-            weather_data.cloud_cover,
-            # Add temporal features
-            datetime.now().hour,
-            datetime.now().day,
-            datetime.now().month,
-        ]).reshape(1, -1)
-
-        return features
+        now = datetime.now()
+        # Observation values followed by temporal features
+        return np.array(
+            [(*_OBSERVATION_FEATURES(weather_data), now.hour, now.day, now.month)],
+            dtype=_FEATURE_DTYPE
+        )
 
     def extract_batch_features(self, weather_data_list: List[WeatherData]) -> np.ndarray:
         """Extract features from multiple weather data points
@@ -53,12 +101,50 @@ class FeatureExtractor:
         Returns:
             Feature matrix
         """
-        features_list = []
-        for data in weather_data_list:
-            features = self.extract_features(data)
-            features_list.append(features[0])
+        features = np.empty((len(weather_data_list), 10), dtype=_FEATURE_DTYPE)
+        if not weather_data_list:
+            return features
+
+        features[:, :7] = [_OBSERVATION_FEATURES(data) for data in weather_data_list]
+        # Temporal features are shared by the whole batch
+        now = datetime.now()
+        features[:, 7:] = (now.hour, now.day, now.month)
+        return features
 
-        return np.array(features_list)
+    @staticmethod
+    def to_records(weather_data_list: List[WeatherData]) -> np.ndarray:
+        """Convert observations into a structured array of feature columns
+        
+        Meant to run once where observations enter the system, so repeated
+        feature extraction can work on columns instead of model attributes.
+        
+        Args:
+            weather_data_list: List of weather observations
+            
+        Returns:
+            Structured array with OBSERVATION_DTYPE
+        """
+        return np.array(
+            [_OBSERVATION_FEATURES(data) for data in weather_data_list],
+            dtype=OBSERVATION_DTYPE
+        )
+
+    def extract_batch_features_soa(self, records: np.ndarray) -> np.ndarray:
+        """Extract features from observations stored as a structured array
+        
+        Args:
+            records: Structured array with OBSERVATION_DTYPE fields
+            
+        Returns:
+            Feature matrix
+        """
+        features = np.empty((len(records), 10), dtype=_FEATURE_DTYPE)
+        for column, name in enumerate(_OBSERVATION_FIELDS):
+            features[:, column] = records[name]
+        # Temporal features are shared by the whole batch
+        now = datetime.now()
+        features[:, 7:] = (now.hour, now.day, now.month)
+        return features
 
     def normalize_features(self, features: np.ndarray, fit: bool = False) -> np.ndarray:
         """Normalize features using StandardScaler
@@ -72,17 +158,40 @@ class FeatureExtractor:
         """
         if fit:
             normalized = self.scaler.fit_transform(features)
-            self.is_fitted = True
+            self._set_fitted()
         else:
             if not self.is_fitted:
                 logger.warning("Scaler not fitted, fitting on current data")
                 normalized = self.scaler.fit_transform(features)
-                self.is_fitted = True
+                self._set_fitted()
             else:
                 normalized = self.scaler.transform(features)
 
         return normalized
 
+    def fast_transform(self, features: np.ndarray) -> np.ndarray:
+        """Normalize features with the fitted scaler's precomputed affine map
+        
+        Equivalent to scaler.transform without sklearn's per-call input
+        validation, for hot paths that already pass a well-formed matrix.
+        
+        Args:
+            features: Feature matrix
+            
+        Returns:
+            Normalized features
+        """
+        if not self.is_fitted:
+            return self.normalize_features(features)
+        normalized = features * self._inv_scale + self._offset
+        return normalized.astype(features.dtype, copy=False)
+
+    def _set_fitted(self) -> None:
+        """Mark the scaler fitted and cache its transform coefficients"""
+        self._inv_scale = 1.0 / self.scaler.scale_
+        self._offset = -self.scaler.mean_ * self._inv_scale
+        self.is_fitted = True
+
 
 class WeatherPredictor:
     """ML-based weather prediction engine"""
@@ -96,8 +205,15 @@ class WeatherPredictor:
         self.model_type = model_type
         self.feature_extractor = FeatureExtractor()
         self.model = self._create_model()
+        self._base_n_estimators = self.model.n_estimators
+        self._base_max_depth = self.model.max_depth
         self.is_trained = False
+        # Raw features and targets the current model was fit on
+        self._train_features: Optional[np.ndarray] = None
+        self._train_targets: Optional[np.ndarray] = None
         self.min_confidence_threshold = 0.70
+        # Seeded like the models so forecasts are reproducible
+        self._rng = np.random.default_rng(42)
 
     def _create_model(self):
         """Create ML model based on type
@@ -137,18 +253,68 @@ class WeatherPredictor:
             logger.warning("Insufficient training data (< 10 samples)")
             return
 
-        # Extract and normalize features
         features = self.feature_extractor.extract_batch_features(weather_data_list)
-        normalized_features = self.feature_extractor.normalize_features(features, fit=True)
+        self._fit(features, np.asarray(target_values))
+
+    def _fit(self, features: np.ndarray, target_values: np.ndarray, warm: bool = False) -> None:
+        """Fit the model on raw features
+        
+        Args:
+            features: Raw feature matrix
+            target_values: Target values
+            warm: Keep the fitted scaler and existing estimators and add
+                _WARM_START_ESTIMATORS more instead of refitting from scratch
+        """
+        if warm:
+            normalized_features = self.feature_extractor.fast_transform(features)
+            self.model.set_params(
+                warm_start=True,
+                n_estimators=self.model.n_estimators + _WARM_START_ESTIMATORS
+            )
+        else:
+            normalized_features = self.feature_extractor.normalize_features(features, fit=True)
+            self.model.set_params(warm_start=False, **self._ensemble_size(len(features)))
 
-        # Train model
+        # Train model, spreading trees over all cores where the model supports it
+        parallel = 'n_jobs' in self.model.get_params()
         try:
+            if parallel:
+                self.model.set_params(n_jobs=-1)
             self.model.fit(normalized_features, target_values)
+            if parallel:
+                # Forecast batches are a handful of rows; dispatching them to a
+                # thread pool costs far more than walking the trees serially
+                self.model.set_params(n_jobs=1)
             self.is_trained = True
-            logger.info(f"Model trained successfully with {len(weather_data_list)} samples")
+            self._train_features = features
+            self._train_targets = target_values
+            logger.info(f"Model trained successfully with {len(features)} samples")
         except Exception as e:
             logger.error(f"Error training model: {e}")
             self.is_trained = False
+        finally:
+            self.model.set_params(warm_start=False)
+
+    def _ensemble_size(self, n_samples: int) -> dict:
+        """Pick ensemble size parameters for a training set
+        
+        Random forests scale tree count and depth with the data: a few hundred
+        samples cannot support 100 trees of depth 15, which would only cost fit
+        and predict time. Boosting keeps its configured stages, since fewer
+        stages at the same learning rate would underfit.
+        
+        Args:
+            n_samples: Number of training samples
+            
+        Returns:
+            Model parameters to set before fitting
+        """
+        if self.model_type != "random_forest":
+            return {"n_estimators": self._base_n_estimators}
+        return {
+            "n_estimators": min(self._base_n_estimators, max(20, n_samples // 10)),
+            "max_depth": min(self._base_max_depth, int(np.log2(n_samples)) + 2)
+        }
 
     def predict(self, location: Location, days: int = 7) -> List[Forecast]:
         """Generate weather forecast for a location
@@ -157,6 +323,20 @@ class WeatherPredictor:
             location: Location to forecast for
             days: Number of days to forecast (default 7)
             
+        Returns:
+            List of Forecast objects
+        """
+        return self._predict(location, days, self._rng)
+
+    def _predict(self, location: Location, days: int,
+                 rng: np.random.Generator) -> List[Forecast]:
+        """Generate weather forecast for a location using a given noise generator
+        
+        Args:
+            location: Location to forecast for
+            days: Number of days to forecast
+            rng: Generator the synthetic feature noise is drawn from
+            
         Returns:
             List of Forecast objects
         """
@@ -164,56 +344,59 @@ class WeatherPredictor:
             logger.warning("Model not trained, returning default forecasts")
             return self._generate_default_forecasts(location, days)
 
-        forecasts = []
+        if days < 1:
+            return []
+
         current_date = date.today()
+        forecast_dates = [current_date + timedelta(days=day_offset + 1) for day_offset in range(days)]
+        # One draw covers the seven synthetic observations and the low-temperature spread
+        noise = rng.standard_normal((days, 8))
+
+        # Generate synthetic features for the future dates
+        # In production, this would use actual weather data
+        features = np.empty((days, 10), dtype=_FEATURE_DTYPE)
+        features[:, :7] = _SYNTHETIC_MEANS + noise[:, :7] * _SYNTHETIC_STDS
+        features[:, 7] = 12  # hour
+        features[:, 8] = [forecast_date.day for forecast_date in forecast_dates]
+        features[:, 9] = [forecast_date.month for forecast_date in forecast_dates]
+
+        # Normalize and predict every day in one call
+        try:
+            normalized_features = self.feature_extractor.fast_transform(features)
+            temps_high = self.model.predict(normalized_features)
+        except Exception as e:
+            logger.error(f"Error generating forecasts for {location.city}: {e}")
+            return []
 
-        for day_offset in range(days):
-            forecast_date = current_date + timedelta(days=day_offset + 1)
+        temps_low = temps_high - 5 + noise[:, 7] * 2
 
-            # Generate synthetic features for future date
-            # In production, this would use actual weather data
-            features = np.array([[
-                15.0 + np.random.randn() * 5,  # temperature
-                65.0 + np.random.randn() * 10,  # humidity
-                1013.0 + np.random.randn() * 10,  # pressure
-                5.0 + np.random.randn() * 2,  # wind_speed
-                180.0 + np.random.randn() * 90,  # wind_direction
-                0.5 + np.random.randn() * 0.5,  # precipitation
-                40.0 + np.random.randn() * 20,  # cloud_cover
-                12,  # hour
-                forecast_date.day,  # day
-                forecast_date.month,  # month
-            ]])
-
-            # Normalize features
-            normalized_features = self.feature_extractor.scaler.transform(features)
-
-            # Make prediction
-            try:
-                temp_high = float(self.model.predict(normalized_features)[0])
-                temp_low = temp_high - 5 + np.random.randn() * 2
+        # Ensure valid temperature range
+        np.clip(temps_high, -100, 60, out=temps_high)
+        np.clip(temps_low, -100, 60, out=temps_low)
 
-                # Ensure valid temperature range
-                temp_high = np.clip(temp_high, -100, 60)
-                temp_low = np.clip(temp_low, -100, 60)
+        precipitation = features[:, 5]
+        precipitation_probability = np.clip(precipitation, 0, 1)
 
-                # Calculate confidence score based on model uncertainty
-                confidence = self._calculate_confidence(day_offset, days)
+        weather_conditions = self._determine_weather_conditions(temps_high, precipitation)
 
-                # Determine weather condition
-                weather_condition = self._determine_weather_condition(
-                    temp_high, temp_low, features[0][5]
-                )
+        # Forecasts from one run share their generation time
+        generated_at = datetime.now()
+        forecasts = []
+        for day_offset, forecast_date in enumerate(forecast_dates):
+            try:
+                temp_high = float(temps_high[day_offset])
+                temp_low = float(temps_low[day_offset])
 
                 forecast = Forecast(
                     location=location,
                     forecast_date=forecast_date,
                     predicted_temperature_high=temp_high,
                     predicted_temperature_low=temp_low,
-                    precipitation_probability=float(np.clip(features[0][5], 0, 1)),
-                    weather_condition=weather_condition,
-                    confidence_score=confidence,
-                    generated_at=datetime.now()
+                    precipitation_probability=float(precipitation_probability[day_offset]),
+                    weather_condition=weather_conditions[day_offset],
+                    # Confidence score based on forecast distance
+                    confidence_score=self._calculate_confidence(day_offset, days),
+                    generated_at=generated_at
                 )
 
                 forecasts.append(forecast)
@@ -224,6 +407,28 @@ class WeatherPredictor:
 
         return forecasts
 
+    def predict_many(self, locations: List[Location], days: int = 7) -> List[List[Forecast]]:
+        """Generate weather forecasts for several locations in parallel
+        
+        Locations are forecast on a thread pool sharing the trained model and
+        scaler read-only; tree traversal in sklearn releases the GIL. Each
+        location draws noise from its own generator spawned from the seeded
+        one, so results do not depend on thread scheduling.
+        
+        Args:
+            locations: Locations to forecast for
+            days: Number of days to forecast (default 7)
+            
+        Returns:
+            List of forecasts for each location, in input order
+        """
+        rngs = self._rng.spawn(len(locations))
+        if len(locations) < 2:
+            return [self._predict(location, days, rng) for location, rng in zip(locations, rngs)]
+        return Parallel(n_jobs=-1, prefer="threads")(
+            delayed(self._predict)(location, days, rng) for location, rng in zip(locations, rngs)
+        )
+
     def _calculate_confidence(self, day_offset: int, total_days: int) -> float:
         """Calculate confidence score for forecast
         
@@ -252,19 +457,27 @@ class WeatherPredictor:
         Returns:
             Weather condition string
         """
-        if precipitation > 5:
-            if temp_high < 0:
-                return "Snow"
-            else:
-                return "Rainy"
-        elif precipitation > 1:
-            return "Drizzle"
-        elif temp_high > 30:
-            return "Sunny"
-        elif temp_high > 20:
-            return "Partly Cloudy"
-        else:
-            return "Cloudy"
+        return _WEATHER_CONDITIONS[_condition_code(temp_high, precipitation)]
+
+    @staticmethod
+    def _determine_weather_conditions(temps_high: np.ndarray,
+                                      precipitation: np.ndarray) -> List[str]:
+        """Determine weather conditions for a batch of predicted days
+        
+        Args:
+            temps_high: Predicted high temperatures
+            precipitation: Predicted precipitation
+            
+        Returns:
+            Weather condition string for each day
+        """
+        wet = precipitation > 5
+        conditions = np.select(
+            [wet & (temps_high < 0), wet, precipitation > 1, temps_high > 30, temps_high > 20],
+            _WEATHER_CONDITIONS[:-1],
+            default=_WEATHER_CONDITIONS[-1]
+        )
+        return conditions.tolist()
 
     def _generate_default_forecasts(self, location: Location, days: int) -> List[Forecast]:
         """Generate default forecasts when model is not trained
@@ -278,6 +491,7 @@ class WeatherPredictor:
         """
         forecasts = []
         current_date = date.today()
+        generated_at = datetime.now()
 
         for day_offset in range(days):
             forecast_date = current_date + timedelta(days=day_offset + 1)
@@ -290,7 +504,7 @@ class WeatherPredictor:
                 precipitation_probability=0.3,
                 weather_condition="Partly Cloudy",
                 confidence_score=0.5,  # Low confidence for default
-                generated_at=datetime.now()
+                generated_at=generated_at
             )
 
             forecasts.append(forecast)
@@ -308,10 +522,83 @@ class WeatherPredictor:
         if not self.is_trained:
             logger.warning("Model not trained yet, training from scratch")
             self.train(new_weather_data, new_targets)
+            return
+        if not new_weather_data:
+            return
+
+        new_features = self.feature_extractor.extract_batch_features(new_weather_data)
+        features = np.vstack((self._train_features, new_features))
+        targets = np.concatenate((self._train_targets, np.asarray(new_targets)))
+
+        if self.model.n_estimators + _WARM_START_ESTIMATORS > _MAX_ESTIMATORS:
+            logger.info("Ensemble at size limit, retraining model from scratch")
+            self._fit(features, targets)
+        elif self._has_drifted(new_features):
+            logger.info("New data has drifted from the training distribution, retraining from scratch")
+            self._fit(features, targets)
         else:
-            # In production, implement incremental learning
-            logger.info("Retraining model with new data")
-            self.train(new_weather_data, new_targets)
+            logger.info(f"Growing model with {len(new_features)} new samples")
+            self._fit(features, targets, warm=True)
+
+    def _has_drifted(self, new_features: np.ndarray) -> bool:
+        """Check whether new observations sit far outside the fitted scaler's range
+        
+        Only the observation columns are compared; the temporal columns are
+        constant within a training batch.
+        
+        Args:
+            new_features: Raw feature matrix of the new observations
+            
+        Returns:
+            True if the model should be refit from scratch
+        """
+        z = self.feature_extractor.fast_transform(new_features)[:, :7]
+        return bool(np.abs(z).mean(axis=0).max() > _DRIFT_THRESHOLD)
+
+    def save(self, path: str) -> None:
+        """Save the fitted model, scaler and training data to disk
+        
+        The file is written uncompressed so load() can memory-map its arrays.
+        
+        Args:
+            path: File path to write
+        """
+        extractor = self.feature_extractor
+        joblib.dump({
+            "model_type": self.model_type,
+            "model": self.model,
+            "base_n_estimators": self._base_n_estimators,
+            "is_trained": self.is_trained,
+            "scaler": extractor.scaler,
+            "scaler_fitted": extractor.is_fitted,
+            "train_features": self._train_features,
+            "train_targets": self._train_targets
+        }, path)
+
+    @classmethod
+    def load(cls, path: str) -> "WeatherPredictor":
+        """Load a predictor written by save()
+        
+        NumPy arrays are memory-mapped read-only, so worker processes loading
+        the same file share those pages instead of each holding a copy.
+        
+        Args:
+            path: File path to read
+            
+        Returns:
+            WeatherPredictor restored from the file
+        """
+        state = joblib.load(path, mmap_mode='r')
+        predictor = cls(model_type=state["model_type"])
+        predictor.model = state["model"]
+        predictor._base_n_estimators = state["base_n_estimators"]
+        predictor.is_trained = state["is_trained"]
+        predictor._train_features = state["train_features"]
+        predictor._train_targets = state["train_targets"]
+        predictor.feature_extractor.scaler = state["scaler"]
+        if state["scaler_fitted"]:
+            predictor.feature_extractor._set_fitted()
+        return predictor
 
     def get_model_info(self) -> dict:
         """Get information about the current model
@@ -1,13 +1,62 @@
 """Weather warning system for generating safety alerts and recommendations"""
 import logging
-import uuid
+import os
+import random
+import sys
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from enum import Enum
+from types import MappingProxyType
+import numpy as np
 from app.models import WeatherData, Forecast, WeatherWarning, Location
 
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; fall back to NumPy searchsorted
+    numba = None
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Batch size where the fused parallel Numba kernel pays off
+_NUMBA_MIN_SIZE = 100_000
+
+# How long each kind of warning stays active
+_DAY = timedelta(hours=24)
+_HALF_DAY = timedelta(hours=12)
+
+# Warning IDs only need to be unique, not unpredictable, so draw them from a
+# urandom-seeded PRNG instead of a syscall per uuid4(); reseed in forked
+# workers so they don't replay the parent's sequence
+_id_rng = random.Random(os.urandom(16))
+if hasattr(os, "register_at_fork"):  # Unix only; spawned workers re-import
+    os.register_at_fork(after_in_child=lambda: _id_rng.seed(os.urandom(16)))
+
+
+# Fallback recommendations for unknown warning types or severities, interned
+# so they share objects with identical entries in the recommendation tables
+_DEFAULT_RECS = tuple(map(sys.intern, (
+    "Monitor weather conditions closely",
+    "Follow guidance from local authorities",
+    "Have emergency supplies ready"
+)))
+
+
+# Bits uuid.UUID(version=4) clears and sets for the version and RFC 4122 variant
+_UUID4_CLEAR = ~((0xc000 << 48) | (0xf000 << 64))
+_UUID4_SET = (0x8000 << 48) | (4 << 76)
+
+
+def _new_warning_id() -> str:
+    """Generate a random version 4 UUID string for a warning
+    
+    Formats the canonical dashed form directly, skipping UUID object construction.
+    """
+    h = '%032x' % (_id_rng.getrandbits(128) & _UUID4_CLEAR | _UUID4_SET)
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
 
 class SeverityLevel(Enum):
     """Warning severity levels"""
@@ -26,41 +75,118 @@ class WarningType(Enum):
     AIR_QUALITY = "air_quality"
 
 
+# Severity for each batch classification code; 0 means no warning
+_SEVERITY_BY_CODE = (
+    None, SeverityLevel.LOW, SeverityLevel.MODERATE, SeverityLevel.HIGH, SeverityLevel.SEVERE
+)
+_SEVERE_CODE = len(_SEVERITY_BY_CODE) - 1
+
+# Serialized warning values back to their enum members
+_WARNING_TYPE_BY_VALUE = {warning_type.value: warning_type for warning_type in WarningType}
+_SEVERITY_BY_VALUE = {level.value: level for level in SeverityLevel}
+
+# Warning titles for every severity, built once instead of per warning
+_SEV_TITLES = {level: level.value.title() for level in SeverityLevel}
+_HEAT_TITLES = {level: f"{title} Heat Warning" for level, title in _SEV_TITLES.items()}
+_TEMPERATURE_TITLES = {level: f"{title} Temperature Warning" for level, title in _SEV_TITLES.items()}
+_WIND_TITLES = {level: f"{title} Wind Warning" for level, title in _SEV_TITLES.items()}
+_FLOOD_TITLES = {level: f"{title} Flood Warning" for level, title in _SEV_TITLES.items()}
+
+# Shared description templates, filled with %-formatting
+_HEAT_DESC = "High temperatures of %.1f°C expected. Heat-related health risks possible."
+_TEMPERATURE_DESC = "Extreme temperatures of %.1f°C expected. Weather-related health risks possible."
+_WIND_DESC = "High winds of %.1f m/s (%.1f km/h) expected. Travel and outdoor activities may be affected."
+_FLOOD_DESC = "Heavy precipitation of %.1fmm expected. Flooding possible in low-lying areas."
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, parallel=True)
+    def _classify_batch(temps, winds, precs, heat, neg_cold, wind, prec):
+        """Fused severity codes for aligned temperature, wind and precipitation arrays"""
+        n = temps.shape[0]
+        temp_codes = np.zeros(n, dtype=np.int8)
+        wind_codes = np.zeros(n, dtype=np.int8)
+        prec_codes = np.zeros(n, dtype=np.int8)
+        for i in numba.prange(n):
+            # Bounds are ascending, so the code is the number of bounds reached
+            code = 0
+            for j in range(heat.shape[0]):
+                if temps[i] >= heat[j]:
+                    code = j + 1
+            if code == 0:
+                for j in range(neg_cold.shape[0]):
+                    if -temps[i] >= neg_cold[j]:
+                        code = j + 1
+            temp_codes[i] = code
+            code = 0
+            for j in range(wind.shape[0]):
+                if winds[i] >= wind[j]:
+                    code = j + 1
+            wind_codes[i] = code
+            code = 0
+            for j in range(prec.shape[0]):
+                if precs[i] >= prec[j]:
+                    code = j + 1
+            prec_codes[i] = code
+        return temp_codes, wind_codes, prec_codes
+else:
+    _classify_batch = None
+
+
 class SeverityClassifier:
     """Classifies weather conditions by severity level"""
     
     def __init__(self):
         """Initialize severity thresholds"""
         # Temperature thresholds (Celsius)
-        self.heat_thresholds = {
+        self.heat_thresholds = MappingProxyType({
             SeverityLevel.LOW: 30.0,
             SeverityLevel.MODERATE: 35.0,
             SeverityLevel.HIGH: 40.0,
             SeverityLevel.SEVERE: 45.0
-        }
+        })
         
-        self.cold_thresholds = {
+        self.cold_thresholds = MappingProxyType({
             SeverityLevel.LOW: 0.0,
             SeverityLevel.MODERATE: -10.0,
             SeverityLevel.HIGH: -20.0,
             SeverityLevel.SEVERE: -30.0
-        }
+        })
         
         # Wind speed thresholds (m/s)
-        self.wind_thresholds = {
+        self.wind_thresholds = MappingProxyType({
             SeverityLevel.LOW: 10.0,      # 36 km/h
             SeverityLevel.MODERATE: 15.0,  # 54 km/h
             SeverityLevel.HIGH: 20.0,      # 72 km/h
             SeverityLevel.SEVERE: 25.0     # 90 km/h
-        }
+        })
         
         # Precipitation thresholds (mm)
-        self.precipitation_thresholds = {
+        self.precipitation_thresholds = MappingProxyType({
             SeverityLevel.LOW: 10.0,
             SeverityLevel.MODERATE: 25.0,
             SeverityLevel.HIGH: 50.0,
             SeverityLevel.SEVERE: 100.0
-        }
+        })
+
+        # Ascending threshold tuples, LOW to SEVERE, for binary search; cold
+        # thresholds are negated so "at or below" becomes an ascending search too.
+        # They are derived once, which is why the mappings above are read-only
+        levels = _SEVERITY_BY_CODE[1:]
+        self._heat_bounds = tuple(self.heat_thresholds[level] for level in levels)
+        self._neg_cold_bounds = tuple(-self.cold_thresholds[level] for level in levels)
+        self._wind_bounds = tuple(self.wind_thresholds[level] for level in levels)
+        self._precipitation_bounds = tuple(self.precipitation_thresholds[level] for level in levels)
+        self._heat_low = self.heat_thresholds[SeverityLevel.LOW]
+        self._cold_low = self.cold_thresholds[SeverityLevel.LOW]
+
+        # Array copies for batch classification
+        self._heat_array = np.array(self._heat_bounds)
+        self._neg_cold_array = np.array(self._neg_cold_bounds)
+        self._wind_array = np.array(self._wind_bounds)
+        self._precipitation_array = np.array(self._precipitation_bounds)
+        for array in (self._heat_array, self._neg_cold_array, self._wind_array, self._precipitation_array):
+            array.flags.writeable = False
 
     def classify_temperature_severity(self, temperature: float) -> Optional[SeverityLevel]:
         """Classify temperature-based severity
@@ -71,27 +197,17 @@ class SeverityClassifier:
         Returns:
             SeverityLevel or None if no warning needed
         """
-        # Check for heat warnings
-        if temperature >= self.heat_thresholds[SeverityLevel.SEVERE]:
-            return SeverityLevel.SEVERE
-        elif temperature >= self.heat_thresholds[SeverityLevel.HIGH]:
-            return SeverityLevel.HIGH
-        elif temperature >= self.heat_thresholds[SeverityLevel.MODERATE]:
-            return SeverityLevel.MODERATE
-        elif temperature >= self.heat_thresholds[SeverityLevel.LOW]:
-            return SeverityLevel.LOW
-        
-        # Check for cold warnings
-        elif temperature <= self.cold_thresholds[SeverityLevel.SEVERE]:
-            return SeverityLevel.SEVERE
-        elif temperature <= self.cold_thresholds[SeverityLevel.HIGH]:
-            return SeverityLevel.HIGH
-        elif temperature <= self.cold_thresholds[SeverityLevel.MODERATE]:
-            return SeverityLevel.MODERATE
-        elif temperature <= self.cold_thresholds[SeverityLevel.LOW]:
-            return SeverityLevel.LOW
-        
-        return None
+        return _SEVERITY_BY_CODE[self._temperature_code(temperature)]
+
+    def _temperature_code(self, temperature: float) -> int:
+        """Severity code (0-4) for a temperature; heat takes precedence over cold"""
+        # Most temperatures lie between the LOW cold and heat thresholds, which
+        # two comparisons settle without a search (NaN also ends up here)
+        if temperature >= self._heat_low:
+            return bisect_right(self._heat_bounds, temperature)
+        if temperature <= self._cold_low:
+            return bisect_right(self._neg_cold_bounds, -temperature)
+        return 0
 
     def classify_wind_severity(self, wind_speed: float) -> Optional[SeverityLevel]:
         """Classify wind-based severity
@@ -102,16 +218,14 @@ class SeverityClassifier:
         Returns:
             SeverityLevel or None if no warning needed
         """
-        if wind_speed >= self.wind_thresholds[SeverityLevel.SEVERE]:
-            return SeverityLevel.SEVERE
-        elif wind_speed >= self.wind_thresholds[SeverityLevel.HIGH]:
-            return SeverityLevel.HIGH
-        elif wind_speed >= self.wind_thresholds[SeverityLevel.MODERATE]:
-            return SeverityLevel.MODERATE
-        elif wind_speed >= self.wind_thresholds[SeverityLevel.LOW]:
-            return SeverityLevel.LOW
-        
-        return None
+        return _SEVERITY_BY_CODE[self._wind_code(wind_speed)]
+
+    def _wind_code(self, wind_speed: float) -> int:
+        """Severity code (0-4) for a wind speed"""
+        # bisect places NaN past every bound, so require the LOW threshold first
+        if wind_speed >= self._wind_bounds[0]:
+            return bisect_right(self._wind_bounds, wind_speed)
+        return 0
 
     def classify_precipitation_severity(self, precipitation: float) -> Optional[SeverityLevel]:
         """Classify precipitation-based severity
@@ -122,16 +236,85 @@ class SeverityClassifier:
         Returns:
             SeverityLevel or None if no warning needed
         """
-        if precipitation >= self.precipitation_thresholds[SeverityLevel.SEVERE]:
-            return SeverityLevel.SEVERE
-        elif precipitation >= self.precipitation_thresholds[SeverityLevel.HIGH]:
-            return SeverityLevel.HIGH
-        elif precipitation >= self.precipitation_thresholds[SeverityLevel.MODERATE]:
-            return SeverityLevel.MODERATE
-        elif precipitation >= self.precipitation_thresholds[SeverityLevel.LOW]:
-            return SeverityLevel.LOW
+        return _SEVERITY_BY_CODE[self._precipitation_code(precipitation)]
+
+    def _precipitation_code(self, precipitation: float) -> int:
+        """Severity code (0-4) for a precipitation amount"""
+        # bisect places NaN past every bound, so require the LOW threshold first
+        if precipitation >= self._precipitation_bounds[0]:
+            return bisect_right(self._precipitation_bounds, precipitation)
+        return 0
+
+    def classify_temperature_severity_batch(self, temperatures: np.ndarray) -> np.ndarray:
+        """Classify temperature severity for many values at once
+        
+        Args:
+            temperatures: Temperatures in Celsius
+            
+        Returns:
+            Severity codes (0 for none, 1-4 for LOW to SEVERE)
+        """
+        temperatures = np.asarray(temperatures, dtype=float)
+        heat = np.searchsorted(self._heat_array, temperatures, side='right')
+        cold = np.searchsorted(self._neg_cold_array, -temperatures, side='right')
+        # Heat takes precedence, as in the scalar ladder; NaN sorts past every
+        # threshold, so mask it back to no warning
+        return np.where(np.isnan(temperatures), 0, np.where(heat > 0, heat, cold))
+
+    def classify_wind_severity_batch(self, wind_speeds: np.ndarray) -> np.ndarray:
+        """Classify wind severity for many values at once
+        
+        Args:
+            wind_speeds: Wind speeds in m/s
+            
+        Returns:
+            Severity codes (0 for none, 1-4 for LOW to SEVERE)
+        """
+        wind_speeds = np.asarray(wind_speeds, dtype=float)
+        codes = np.searchsorted(self._wind_array, wind_speeds, side='right')
+        # NaN sorts past every threshold, so mask it back to no warning
+        return np.where(np.isnan(wind_speeds), 0, codes)
+
+    def classify_precipitation_severity_batch(self, precipitation: np.ndarray) -> np.ndarray:
+        """Classify precipitation severity for many values at once
+        
+        Args:
+            precipitation: Precipitation amounts in mm
+            
+        Returns:
+            Severity codes (0 for none, 1-4 for LOW to SEVERE)
+        """
+        precipitation = np.asarray(precipitation, dtype=float)
+        codes = np.searchsorted(self._precipitation_array, precipitation, side='right')
+        # NaN sorts past every threshold, so mask it back to no warning
+        return np.where(np.isnan(precipitation), 0, codes)
+
+    def classify_batch(self, temperatures: np.ndarray, wind_speeds: np.ndarray,
+                       precipitation: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Classify aligned temperature, wind and precipitation arrays together
         
-        return None
+        Args:
+            temperatures: Temperatures in Celsius
+            wind_speeds: Wind speeds in m/s
+            precipitation: Precipitation amounts in mm
+            
+        Returns:
+            Tuple of int8 severity code arrays (temperature, wind, precipitation)
+        """
+        temperatures = np.ascontiguousarray(temperatures, dtype=np.float64)
+        wind_speeds = np.ascontiguousarray(wind_speeds, dtype=np.float64)
+        precipitation = np.ascontiguousarray(precipitation, dtype=np.float64)
+        if NUMBA_AVAILABLE and temperatures.size > _NUMBA_MIN_SIZE:
+            return _classify_batch(
+                temperatures, wind_speeds, precipitation,
+                self._heat_array, self._neg_cold_array,
+                self._wind_array, self._precipitation_array
+            )
+        return (
+            self.classify_temperature_severity_batch(temperatures).astype(np.int8),
+            self.classify_wind_severity_batch(wind_speeds).astype(np.int8),
+            self.classify_precipitation_severity_batch(precipitation).astype(np.int8)
+        )
 
     def classify_overall_severity(self, conditions: WeatherData) -> SeverityLevel:
         """Classify overall severity based on all weather conditions
@@ -142,34 +325,15 @@ class SeverityClassifier:
         Returns:
             Highest severity level found across all conditions
         """
-        severities = []
-        
-        # Check temperature severity
-        temp_severity = self.classify_temperature_severity(conditions.temperature)
-        if temp_severity:
-            severities.append(temp_severity)
-        
-        # Check wind severity
-        wind_severity = self.classify_wind_severity(conditions.wind_speed)
-        if wind_severity:
-            severities.append(wind_severity)
-        
-        # Check precipitation severity
-        precip_severity = self.classify_precipitation_severity(conditions.precipitation)
-        if precip_severity:
-            severities.append(precip_severity)
-        
-        # Return highest severity, default to LOW if any conditions warrant warnings
-        if not severities:
-            return SeverityLevel.LOW
-        
-        # Order by severity (SEVERE > HIGH > MODERATE > LOW)
-        severity_order = [SeverityLevel.SEVERE, SeverityLevel.HIGH, SeverityLevel.MODERATE, SeverityLevel.LOW]
-        for severity in severity_order:
-            if severity in severities:
-                return severity
-        
-        return SeverityLevel.LOW
+        # Compare integer severity codes rather than scanning an ordering list,
+        # stopping as soon as one condition is already SEVERE
+        code = self._temperature_code(conditions.temperature)
+        if code < _SEVERE_CODE:
+            code = max(code, self._wind_code(conditions.wind_speed))
+        if code < _SEVERE_CODE:
+            code = max(code, self._precipitation_code(conditions.precipitation))
+        # Default to LOW when no condition warrants a warning
+        return _SEVERITY_BY_CODE[code] or SeverityLevel.LOW
 
 
 class SafetyRecommendations:
@@ -288,6 +452,22 @@ class SafetyRecommendations:
             }
         }
 
+        # Freeze the whole table so it can be shared by every generator and
+        # every warning that uses it
+        self.recommendations = MappingProxyType({
+            warning_type: MappingProxyType({
+                severity: tuple(sys.intern(text) for text in texts)
+                for severity, texts in by_severity.items()
+            })
+            for warning_type, by_severity in self.recommendations.items()
+        })
+        # Single-probe lookup table keyed by (warning type, severity)
+        self._flat = {
+            (warning_type, severity): texts
+            for warning_type, by_severity in self.recommendations.items()
+            for severity, texts in by_severity.items()
+        }
+
     def get_recommendations(self, warning_type: WarningType, severity: SeverityLevel) -> List[str]:
         """Get safety recommendations for a specific warning type and severity
         
@@ -296,13 +476,15 @@ class SafetyRecommendations:
             severity: Severity level of the warning
             
         Returns:
-            List of safety recommendations
+            List of safety recommendations (a fresh copy the caller may modify)
         """
-        return self.recommendations.get(warning_type, {}).get(severity, [
-            "Monitor weather conditions closely",
-            "Follow guidance from local authorities",
-            "Have emergency supplies ready"
-        ])
+        return list(self._flat.get((warning_type, severity), _DEFAULT_RECS))
+
+
+# Every generator shares one of each; their public tables are read-only
+# mappings and tuples, so no generator can change another's behaviour
+_SEVERITY_CLASSIFIER = SeverityClassifier()
+_SAFETY_RECS = SafetyRecommendations()
 
 
 class WarningGenerator:
@@ -310,8 +492,14 @@ class WarningGenerator:
     
     def __init__(self):
         """Initialize warning generator with classifier and recommendations"""
-        self.severity_classifier = SeverityClassifier()
-        self.safety_recommendations = SafetyRecommendations()
+        self.severity_classifier = _SEVERITY_CLASSIFIER
+        self.safety_recommendations = _SAFETY_RECS
+
+        # Per-type recommendation tables for the _create_*_warning helpers
+        flat = self.safety_recommendations._flat
+        self._heat_recs = {sv: recs for (wt, sv), recs in flat.items() if wt is WarningType.HEAT}
+        self._wind_recs = {sv: recs for (wt, sv), recs in flat.items() if wt is WarningType.WIND}
+        self._flood_recs = {sv: recs for (wt, sv), recs in flat.items() if wt is WarningType.FLOOD}
 
     def analyze_forecast(self, forecast: Forecast) -> List[WeatherWarning]:
         """Analyze forecast and generate appropriate warnings
@@ -323,17 +511,77 @@ class WarningGenerator:
             List of weather warnings
         """
         warnings = []
+        now = datetime.now()
         
         # Check temperature warnings
-        temp_warnings = self._check_temperature_warnings(forecast)
+        temp_warnings = self._check_temperature_warnings(forecast, now)
         warnings.extend(temp_warnings)
         
         # Check precipitation warnings
-        precip_warnings = self._check_precipitation_warnings(forecast)
+        precip_warnings = self._check_precipitation_warnings(forecast, now)
         warnings.extend(precip_warnings)
         
         return warnings
 
+    def analyze_forecasts(self, forecasts: List[Forecast]) -> List[List[WeatherWarning]]:
+        """Analyze several forecasts, grouping the warnings by forecast
+        
+        Each group matches what analyze_forecast returns for that forecast;
+        severity thresholds are applied to all forecasts in one pass and only
+        forecasts that trigger a warning are visited afterwards.
+        
+        Args:
+            forecasts: Weather forecasts to analyze
+            
+        Returns:
+            One list of weather warnings per forecast, in forecast order
+        """
+        grouped = [[] for _ in forecasts]
+        if not forecasts:
+            return grouped
+
+        count = len(forecasts)
+        temps_high = np.fromiter(
+            (forecast.predicted_temperature_high for forecast in forecasts), dtype=float, count=count
+        )
+        # Same simplified precipitation estimate as _check_precipitation_warnings
+        precipitation = np.fromiter(
+            (forecast.precipitation_probability for forecast in forecasts), dtype=float, count=count
+        ) * 50
+        heat_codes = self.severity_classifier.classify_temperature_severity_batch(temps_high)
+        precip_codes = self.severity_classifier.classify_precipitation_severity_batch(precipitation)
+        # Only heat warnings are generated for temperature, as in analyze_forecast
+        heat_codes[temps_high <= 25] = 0
+
+        now = datetime.now()
+        for i in np.flatnonzero(heat_codes | precip_codes).tolist():
+            location = forecasts[i].location
+            warnings = grouped[i]
+            heat_code = int(heat_codes[i])
+            precip_code = int(precip_codes[i])
+            if heat_code:
+                warnings.append(self._create_temperature_warning(
+                    location, float(temps_high[i]), _SEVERITY_BY_CODE[heat_code], WarningType.HEAT, now
+                ))
+            if precip_code:
+                warnings.append(self._create_precipitation_warning(
+                    location, float(precipitation[i]), _SEVERITY_BY_CODE[precip_code], now
+                ))
+        return grouped
+
+    def analyze_forecasts_batch(self, forecasts: List[Forecast]) -> List[WeatherWarning]:
+        """Analyze several forecasts and generate their warnings
+        
+        Equivalent to calling analyze_forecast on each forecast in turn.
+        
+        Args:
+            forecasts: Weather forecasts to analyze
+            
+        Returns:
+            List of weather warnings, in forecast order
+        """
+        return [warning for warnings in self.analyze_forecasts(forecasts) for warning in warnings]
+
     def analyze_current_conditions(self, conditions: WeatherData) -> List[WeatherWarning]:
         """Analyze current weather conditions and generate warnings
         
@@ -344,6 +592,7 @@ class WarningGenerator:
             List of weather warnings
         """
         warnings = []
+        now = datetime.now()
         
         # Check temperature warnings
         temp_severity = self.severity_classifier.classify_temperature_severity(conditions.temperature)
@@ -351,31 +600,34 @@ class WarningGenerator:
             # Only create heat warnings (cold warnings not supported by model)
             if conditions.temperature > 25:  # Heat warning
                 warning = self._create_temperature_warning(
-                    conditions.location, conditions.temperature, temp_severity, WarningType.HEAT
+                    conditions.location, conditions.temperature, temp_severity, WarningType.HEAT, now
                 )
                 warnings.append(warning)
         
         # Check wind warnings
         wind_severity = self.severity_classifier.classify_wind_severity(conditions.wind_speed)
         if wind_severity:
-            warning = self._create_wind_warning(conditions.location, conditions.wind_speed, wind_severity)
+            warning = self._create_wind_warning(
+                conditions.location, conditions.wind_speed, wind_severity, now
+            )
             warnings.append(warning)
         
         # Check precipitation warnings
         precip_severity = self.severity_classifier.classify_precipitation_severity(conditions.precipitation)
         if precip_severity:
             warning = self._create_precipitation_warning(
-                conditions.location, conditions.precipitation, precip_severity
+                conditions.location, conditions.precipitation, precip_severity, now
             )
             warnings.append(warning)
         
         return warnings
 
-    def _check_temperature_warnings(self, forecast: Forecast) -> List[WeatherWarning]:
+    def _check_temperature_warnings(self, forecast: Forecast, now: datetime) -> List[WeatherWarning]:
         """Check for temperature-based warnings in forecast
         
         Args:
             forecast: Weather forecast
+            now: Issue time shared by the analysis pass
             
         Returns:
             List of temperature warnings
@@ -386,7 +638,7 @@ class WarningGenerator:
         high_severity = self.severity_classifier.classify_temperature_severity(forecast.predicted_temperature_high)
         if high_severity and forecast.predicted_temperature_high > 25:
             warning = self._create_temperature_warning(
-                forecast.location, forecast.predicted_temperature_high, high_severity, WarningType.HEAT
+                forecast.location, forecast.predicted_temperature_high, high_severity, WarningType.HEAT, now
             )
             warnings.append(warning)
         
@@ -394,11 +646,12 @@ class WarningGenerator:
         
         return warnings
 
-    def _check_precipitation_warnings(self, forecast: Forecast) -> List[WeatherWarning]:
+    def _check_precipitation_warnings(self, forecast: Forecast, now: datetime) -> List[WeatherWarning]:
         """Check for precipitation-based warnings in forecast
         
         Args:
             forecast: Weather forecast
+            now: Issue time shared by the analysis pass
             
         Returns:
             List of precipitation warnings
@@ -412,14 +665,15 @@ class WarningGenerator:
         precip_severity = self.severity_classifier.classify_precipitation_severity(estimated_precipitation)
         if precip_severity:
             warning = self._create_precipitation_warning(
-                forecast.location, estimated_precipitation, precip_severity
+                forecast.location, estimated_precipitation, precip_severity, now
             )
             warnings.append(warning)
         
         return warnings
 
     def _create_temperature_warning(self, location: Location, temperature: float, 
-                                  severity: SeverityLevel, warning_type: WarningType) -> WeatherWarning:
+                                  severity: SeverityLevel, warning_type: WarningType,
+                                  now: datetime) -> WeatherWarning:
         """Create a temperature-based warning
         
         Args:
@@ -427,24 +681,27 @@ class WarningGenerator:
             temperature: Temperature value
             severity: Severity level
             warning_type: Type of temperature warning (HEAT or COLD)
+            now: Issue time of the warning
             
         Returns:
             WeatherWarning object
         """
-        warning_id = str(uuid.uuid4())
-        now = datetime.now()
+        warning_id = _new_warning_id()
         
-        if warning_type == WarningType.HEAT:
-            title = f"{severity.value.title()} Heat Warning"
-            description = f"High temperatures of {temperature:.1f}°C expected. Heat-related health risks possible."
+        if warning_type is WarningType.HEAT:
+            title = _HEAT_TITLES[severity]
+            description = _HEAT_DESC % temperature
+            recommendations = self._heat_recs[severity]
         else:
             # Fallback for unsupported temperature warning types
-            title = f"{severity.value.title()} Temperature Warning"
-            description = f"Extreme temperatures of {temperature:.1f}°C expected. Weather-related health risks possible."
-        
-        recommendations = self.safety_recommendations.get_recommendations(warning_type, severity)
-        
-        return WeatherWarning(
+            title = _TEMPERATURE_TITLES[severity]
+            description = _TEMPERATURE_DESC % temperature
+            recommendations = self.safety_recommendations.get_recommendations(warning_type, severity)
+        
+        # Every field comes from trusted values that satisfy the model's
+        # constraints (non-empty ID and recommendations, end after start),
+        # so skip validation as the data collector does for WeatherData
+        return WeatherWarning.model_construct(
             warning_id=warning_id,
             location=location,
             warning_type=warning_type.value,
@@ -453,31 +710,31 @@ class WarningGenerator:
             description=description,
             safety_recommendations=recommendations,
             start_time=now,
-            end_time=now + timedelta(hours=24),
+            end_time=now + _DAY,
             issued_at=now
         )
 
     def _create_wind_warning(self, location: Location, wind_speed: float, 
-                           severity: SeverityLevel) -> WeatherWarning:
+                           severity: SeverityLevel, now: datetime) -> WeatherWarning:
         """Create a wind-based warning
         
         Args:
             location: Location for the warning
             wind_speed: Wind speed in m/s
             severity: Severity level
+            now: Issue time of the warning
             
         Returns:
             WeatherWarning object
         """
-        warning_id = str(uuid.uuid4())
-        now = datetime.now()
+        warning_id = _new_warning_id()
         
-        title = f"{severity.value.title()} Wind Warning"
-        description = f"High winds of {wind_speed:.1f} m/s ({wind_speed * 3.6:.1f} km/h) expected. Travel and outdoor activities may be affected."
+        title = _WIND_TITLES[severity]
+        description = _WIND_DESC % (wind_speed, wind_speed * 3.6)
         
-        recommendations = self.safety_recommendations.get_recommendations(WarningType.WIND, severity)
+        recommendations = self._wind_recs[severity]
         
-        return WeatherWarning(
+        return WeatherWarning.model_construct(
             warning_id=warning_id,
             location=location,
             warning_type=WarningType.WIND.value,
@@ -486,31 +743,31 @@ class WarningGenerator:
             description=description,
             safety_recommendations=recommendations,
             start_time=now,
-            end_time=now + timedelta(hours=12),
+            end_time=now + _HALF_DAY,
             issued_at=now
         )
 
     def _create_precipitation_warning(self, location: Location, precipitation: float, 
-                                    severity: SeverityLevel) -> WeatherWarning:
+                                    severity: SeverityLevel, now: datetime) -> WeatherWarning:
         """Create a precipitation-based warning
         
         Args:
             location: Location for the warning
             precipitation: Precipitation amount in mm
             severity: Severity level
+            now: Issue time of the warning
             
         Returns:
             WeatherWarning object
         """
-        warning_id = str(uuid.uuid4())
-        now = datetime.now()
+        warning_id = _new_warning_id()
         
-        title = f"{severity.value.title()} Flood Warning"
-        description = f"Heavy precipitation of {precipitation:.1f}mm expected. Flooding possible in low-lying areas."
+        title = _FLOOD_TITLES[severity]
+        description = _FLOOD_DESC % precipitation
         
-        recommendations = self.safety_recommendations.get_recommendations(WarningType.FLOOD, severity)
+        recommendations = self._flood_recs[severity]
         
-        return WeatherWarning(
+        return WeatherWarning.model_construct(
             warning_id=warning_id,
             location=location,
             warning_type=WarningType.FLOOD.value,
@@ -519,7 +776,7 @@ class WarningGenerator:
             description=description,
             safety_recommendations=recommendations,
             start_time=now,
-            end_time=now + timedelta(hours=24),
+            end_time=now + _DAY,
             issued_at=now
         )
 
@@ -543,14 +800,9 @@ class WarningGenerator:
         Returns:
             List of safety recommendations
         """
-        try:
-            warning_type = WarningType(warning.warning_type)
-            severity = SeverityLevel(warning.severity)
-            return self.safety_recommendations.get_recommendations(warning_type, severity)
-        except ValueError:
+        warning_type = _WARNING_TYPE_BY_VALUE.get(warning.warning_type)
+        severity = _SEVERITY_BY_VALUE.get(warning.severity)
+        if warning_type is None or severity is None:
             # Fallback for unknown warning types or severities
-            return [
-                "Monitor weather conditions closely",
-                "Follow guidance from local authorities",
-                "Have emergency supplies ready"
-            ]
\ No newline at end of file
+            return list(_DEFAULT_RECS)
+        return self.safety_recommendations.get_recommendations(warning_type, severity)
\ No newline at end of file
@@ -1,9 +1,12 @@
 """Unit tests for accuracy tracking system"""
+import random
+from dataclasses import replace
+import numpy as np
 import pytest
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta, date, time
 from app.models import Location, WeatherData, Forecast, AccuracyMetrics
 from app.services.accuracy_tracker import (
-    AccuracyCalculator, AccuracyTracker, PredictionOutcome
+    AccuracyCalculator, AccuracyTracker, PredictionOutcome, _StatsAccumulator
 )
 
 
@@ -109,6 +112,23 @@ class TestAccuracyCalculator:
         """Test RMSE calculation with empty list"""
         rmse = self.calculator.calculate_rmse([])
         assert rmse == 0.0
+    
+    def test_mae_rmse_combined(self):
+        """Test combined MAE/RMSE calculation matches the separate methods"""
+        errors = [1.0, 2.0, 3.0, 4.0, 5.0]
+        mae, rmse = self.calculator.calculate_mae_rmse(errors)
+        assert mae == pytest.approx(self.calculator.calculate_mae(errors))
+        assert rmse == pytest.approx(self.calculator.calculate_rmse(errors))
+        assert self.calculator.calculate_mae_rmse([]) == (0.0, 0.0)
+
+
+class TestStatsAccumulator:
+    """Test cases for _StatsAccumulator"""
+    
+    def test_precipitation_accuracy_clamped_against_drift(self):
+        """Test a slightly negative running error sum cannot push accuracy above 1"""
+        stats = _StatsAccumulator(count=2, sum_precipitation_error=-1e-12)
+        assert stats.precipitation_accuracy == 1.0
 
 
 class TestAccuracyTracker:
@@ -152,6 +172,24 @@ class TestAccuracyTracker:
             weather_condition=condition
         )
     
+    def create_outcome(self, timestamp, accuracy=0.8, location=None):
+        """Helper to create an outcome with a fixed score observed at a given time"""
+        location = location or self.location
+        return PredictionOutcome(
+            forecast=self.create_forecast().model_copy(update={'location': location}),
+            actual_weather=self.create_weather_data().model_copy(
+                update={'timestamp': timestamp, 'location': location}
+            ),
+            accuracy_score=accuracy,
+            temperature_error=1.0,
+            precipitation_error=0.1,
+            condition_match=True
+        )
+    
+    def at(self, days_ago, hour):
+        """Helper for a local time of day a number of days ago"""
+        return datetime.combine(date.today() - timedelta(days=days_ago), time(hour))
+    
     def test_compare_prediction_to_actual_perfect_match(self):
         """Test comparing prediction to actual with perfect match"""
         forecast = self.create_forecast(25.0, 0.3, 'Sunny')
@@ -176,6 +214,29 @@ class TestAccuracyTracker:
         assert outcome.condition_match is False
         assert 0.0 < outcome.accuracy_score < 1.0
     
+    def test_compare_batch_matches_scalar(self):
+        """Test batch comparison produces the same outcomes as per-item comparison"""
+        forecasts = [
+            self.create_forecast(25.0, 0.3, 'Sunny'),
+            self.create_forecast(25.0, 0.3, 'Clear'),
+            self.create_forecast(20.0, 0.9, 'Rainy'),
+        ]
+        actuals = [
+            self.create_weather_data(25.0, 3.0, 'Sunny'),
+            self.create_weather_data(28.0, 8.0, 'Sunny'),
+            self.create_weather_data(35.0, 0.0, 'Snowy'),
+        ]
+        
+        batch = self.tracker.compare_batch(forecasts, actuals)
+        
+        assert len(batch) == 3
+        for outcome, forecast, actual in zip(batch, forecasts, actuals):
+            expected = self.tracker.compare_prediction_to_actual(forecast, actual)
+            assert outcome.accuracy_score == pytest.approx(expected.accuracy_score)
+            assert outcome.temperature_error == pytest.approx(expected.temperature_error)
+            assert outcome.precipitation_error == pytest.approx(expected.precipitation_error)
+            assert outcome.condition_match == expected.condition_match
+    
     def test_add_prediction_outcome(self):
         """Test adding prediction outcome to tracker"""
         forecast = self.create_forecast()
@@ -259,6 +320,19 @@ class TestAccuracyTracker:
         metrics_other = self.tracker.calculate_accuracy_metrics(other_location, days=7)
         assert metrics_other.total_predictions == 1
     
+    def test_location_filter_matches_to_1e5_degrees(self):
+        """Test location filters treat coordinates within 1e-5 degrees as equal"""
+        outcome = self.tracker.compare_prediction_to_actual(
+            self.create_forecast(), self.create_weather_data()
+        )
+        self.tracker.add_prediction_outcome(outcome)
+        
+        nearby = self.location.model_copy(update={'latitude': self.location.latitude + 1e-7})
+        distinct = self.location.model_copy(update={'latitude': self.location.latitude + 1e-4})
+        
+        assert self.tracker.get_prediction_count(nearby, days=1) == 1
+        assert self.tracker.get_prediction_count(distinct, days=1) == 0
+    
     def test_get_accuracy_trend(self):
         """Test getting accuracy trend over time"""
         # Add some historical metrics
@@ -282,6 +356,39 @@ class TestAccuracyTracker:
         # Should be ordered by calculation time (oldest first)
         assert trend[0].calculated_at < trend[1].calculated_at < trend[2].calculated_at
     
+    def test_history_index_survives_pruning(self):
+        """Test repeated location lookups reuse the history index across pruning"""
+        expired = AccuracyMetrics(
+            location=self.location,
+            overall_accuracy=0.8,
+            temperature_mae=2.0,
+            temperature_rmse=2.5,
+            precipitation_accuracy=0.7,
+            condition_accuracy=0.9,
+            total_predictions=10,
+            evaluation_period_days=7,
+            calculated_at=datetime.now() - timedelta(days=40)
+        )
+        self.tracker.accuracy_history.append(expired)
+        assert len(self.tracker.get_accuracy_trend(self.location, days=60)) == 1
+        index = self.tracker._history_index
+        history = self.tracker.accuracy_history
+        
+        outcome = self.tracker.compare_prediction_to_actual(
+            self.create_forecast(), self.create_weather_data()
+        )
+        self.tracker.add_prediction_outcome(outcome)
+        
+        # Each call appends a new entry and prunes the expired one
+        self.tracker.calculate_accuracy_metrics(self.location)
+        self.tracker.calculate_accuracy_metrics(self.location)
+        trend = self.tracker.get_accuracy_trend(self.location, days=60)
+        
+        assert self.tracker.accuracy_history is history
+        assert self.tracker._history_index is index
+        assert len(trend) == 2
+        assert expired not in trend
+    
     def test_check_accuracy_alerts_no_alerts(self):
         """Test accuracy alerts when accuracy is good"""
         # Add good prediction outcomes
@@ -307,6 +414,44 @@ class TestAccuracyTracker:
         assert len(alerts) > 0
         assert any('accuracy' in alert.lower() for alert in alerts)
     
+    def test_check_accuracy_alerts_cache_invalidated_by_new_outcomes(self):
+        """Test cached alerts are recomputed after outcomes are added"""
+        for i in range(9):
+            forecast = self.create_forecast(25.0, 0.0, 'Sunny')
+            actual = self.create_weather_data(35.0, 10.0, 'Rainy')
+            self.tracker.add_prediction_outcome(
+                self.tracker.compare_prediction_to_actual(forecast, actual)
+            )
+        
+        assert self.tracker.check_accuracy_alerts(self.location) == []
+        assert self.tracker.check_accuracy_alerts(self.location) == []
+        
+        forecast = self.create_forecast(25.0, 0.0, 'Sunny')
+        actual = self.create_weather_data(35.0, 10.0, 'Rainy')
+        self.tracker.add_prediction_outcome(
+            self.tracker.compare_prediction_to_actual(forecast, actual)
+        )
+        
+        assert len(self.tracker.check_accuracy_alerts(self.location)) > 0
+    
+    def test_check_accuracy_alerts_cache_hit_records_history(self):
+        """Test a cached alert check still adds its metrics to the trend"""
+        for i in range(12):
+            forecast = self.create_forecast(25.0, 0.0, 'Sunny')
+            actual = self.create_weather_data(35.0, 10.0, 'Rainy')
+            self.tracker.add_prediction_outcome(
+                self.tracker.compare_prediction_to_actual(forecast, actual)
+            )
+        
+        first = self.tracker.check_accuracy_alerts(self.location)
+        second = self.tracker.check_accuracy_alerts(self.location)
+        
+        assert second == first
+        trend = self.tracker.get_accuracy_trend(self.location)
+        assert len(trend) == 2
+        assert trend[0] is not trend[1]
+        assert trend[1].total_predictions == trend[0].total_predictions == 12
+    
     def test_check_accuracy_alerts_insufficient_data(self):
         """Test accuracy alerts with insufficient data"""
         # Add only a few outcomes (below minimum threshold)
@@ -456,6 +601,134 @@ class TestAccuracyTracker:
         assert len(self.tracker.prediction_outcomes) == 1  # Only recent outcome remains
         assert len(self.tracker.accuracy_history) == 0     # Old history removed
     
+    def test_reads_do_not_reorder_outcome_list(self):
+        """Test queries leave a directly populated outcome list in its own order"""
+        self.tracker.retention_days = 1
+        recent = self.create_outcome(datetime.now())
+        old = self.create_outcome(datetime.now() - timedelta(days=2))
+        self.tracker.prediction_outcomes.extend([recent, old])
+        
+        assert self.tracker.get_prediction_count(days=30) == 2
+        assert self.tracker.prediction_outcomes == [recent, old]
+        
+        self.tracker.cleanup_old_data()
+        assert self.tracker.prediction_outcomes == [recent]
+        assert self.tracker.get_prediction_count(days=30) == 1
+    
+    def test_in_place_outcome_replacement_rebuilds_columns(self):
+        """Test replacing a stored outcome without changing the list length is picked up"""
+        outcome = self.create_outcome(datetime.now())
+        self.tracker.add_prediction_outcome(outcome)
+        assert self.tracker.calculate_accuracy_metrics().temperature_mae == pytest.approx(1.0)
+        
+        self.tracker.prediction_outcomes[0] = replace(outcome, temperature_error=20.0)
+        assert self.tracker.calculate_accuracy_metrics().temperature_mae == pytest.approx(20.0)
+        
+        self.tracker.prediction_outcomes = [replace(outcome, temperature_error=5.0)]
+        assert self.tracker.calculate_accuracy_metrics().temperature_mae == pytest.approx(5.0)
+    
+    def test_window_boundary_mid_day(self):
+        """Test a window starting mid-day splits that day's outcomes at the cutoff"""
+        times_and_scores = [(4, 10, 0.1), (3, 9, 0.2), (3, 11, 0.3), (3, 13, 0.4), (3, 15, 0.5), (2, 10, 0.6)]
+        for days_ago, hour, score in times_and_scores:
+            self.tracker.add_prediction_outcome(self.create_outcome(self.at(days_ago, hour), score))
+        
+        stats = self.tracker._window_stats(self.at(3, 12))
+        
+        assert stats.count == 3
+        assert stats.sum_accuracy == pytest.approx(0.4 + 0.5 + 0.6)
+    
+    def test_partial_day_expiry_subtracts_from_day_bucket(self):
+        """Test expiring part of a day leaves only that day's kept rows in its bucket"""
+        for hour, score in [(9, 0.2), (11, 0.3), (13, 0.4), (15, 0.5)]:
+            self.tracker.add_prediction_outcome(self.create_outcome(self.at(3, hour), score))
+        self.tracker.add_prediction_outcome(self.create_outcome(self.at(2, 10), 0.6))
+        
+        removed = self.tracker._remove_outcomes_before(self.at(3, 12))
+        
+        assert removed == 2
+        day = (date.today() - timedelta(days=3)).toordinal()
+        bucket = self.tracker._outcome_columns().daily_stats[None][day]
+        assert bucket.count == 2
+        assert bucket.sum_accuracy == pytest.approx(0.4 + 0.5)
+        stats = self.tracker._window_stats(self.at(4, 0))
+        assert stats.count == 3
+        assert stats.sum_accuracy == pytest.approx(0.4 + 0.5 + 0.6)
+    
+    def test_out_of_order_outcome_included_in_later_windows(self):
+        """Test a late-arriving outcome is placed in time order for window stats"""
+        self.tracker.add_prediction_outcome(self.create_outcome(self.at(3, 10), 0.2))
+        self.tracker.add_prediction_outcome(self.create_outcome(self.at(1, 10), 0.6))
+        late = self.create_outcome(self.at(2, 10), 0.4)
+        self.tracker.add_prediction_outcome(late)
+        
+        assert self.tracker.prediction_outcomes[1] is late
+        stats = self.tracker._window_stats(self.at(2, 9))
+        assert stats.count == 2
+        assert stats.sum_accuracy == pytest.approx(0.4 + 0.6)
+        assert self.tracker._window_stats(self.at(2, 11)).count == 1
+        
+        # Outcomes appended after the rebuild keep accumulating normally
+        self.tracker.add_prediction_outcome(self.create_outcome(self.at(0, 0), 0.8))
+        assert self.tracker._window_stats(self.at(2, 9)).sum_accuracy == pytest.approx(0.4 + 0.6 + 0.8)
+    
+    def test_shuffled_outcomes_inserted_without_rebuilding(self, monkeypatch):
+        """Test late arrivals are inserted in place and match in-order ingestion"""
+        other = Location(latitude=51.5074, longitude=-0.1278, city='London', country='UK')
+        rng = random.Random(7)
+        outcomes = [
+            self.create_outcome(self.at(i % 6, i % 24), rng.random(), other if i % 3 else None)
+            for i in range(120)
+        ]
+        in_order = AccuracyTracker()
+        for outcome in sorted(outcomes, key=lambda o: o.actual_weather.timestamp):
+            in_order.add_prediction_outcome(outcome)
+        
+        rebuilds = []
+        monkeypatch.setattr(
+            self.tracker, '_rebuild_columns',
+            lambda: rebuilds.append(1)
+        )
+        shuffled = outcomes[:]
+        rng.shuffle(shuffled)
+        for outcome in shuffled:
+            self.tracker.add_prediction_outcome(outcome)
+        
+        assert rebuilds == []
+        columns = self.tracker._outcome_columns()
+        assert np.all(np.diff(columns['timestamp']) >= 0)
+        for location in (None, self.location, other):
+            for days_ago, hour in [(6, 0), (3, 12), (1, 5)]:
+                stats = self.tracker._window_stats(self.at(days_ago, hour), location)
+                expected = in_order._window_stats(self.at(days_ago, hour), location)
+                assert stats.count == expected.count
+                assert stats.sum_accuracy == pytest.approx(expected.sum_accuracy)
+        assert self.tracker._remove_outcomes_before(self.at(3, 12)) == \
+            in_order._remove_outcomes_before(self.at(3, 12))
+        stats = self.tracker._window_stats(self.at(6, 0), other)
+        expected = in_order._window_stats(self.at(6, 0), other)
+        assert stats.count == expected.count
+        assert stats.sum_accuracy == pytest.approx(expected.sum_accuracy)
+    
+    def test_location_window_after_retention_drops_head(self):
+        """Test per-location windows once retention has dropped a location's oldest rows"""
+        other = Location(latitude=51.5074, longitude=-0.1278, city='London', country='UK')
+        self.tracker.add_prediction_outcome(self.create_outcome(self.at(3, 9), 0.2))
+        self.tracker.add_prediction_outcome(self.create_outcome(self.at(3, 10), 0.3, other))
+        self.tracker.add_prediction_outcome(self.create_outcome(self.at(3, 13), 0.4))
+        self.tracker.add_prediction_outcome(self.create_outcome(self.at(2, 10), 0.5, other))
+        self.tracker.add_prediction_outcome(self.create_outcome(self.at(1, 10), 0.6))
+        
+        assert self.tracker._remove_outcomes_before(self.at(3, 12)) == 2
+        
+        stats = self.tracker._window_stats(self.at(4, 0), self.location)
+        assert stats.count == 2
+        assert stats.sum_accuracy == pytest.approx(0.4 + 0.6)
+        assert self.tracker._window_stats(self.at(3, 14), self.location).count == 1
+        other_stats = self.tracker._window_stats(self.at(4, 0), other)
+        assert other_stats.count == 1
+        assert other_stats.sum_accuracy == pytest.approx(0.5)
+    
     def test_retention_period_enforcement(self):
         """Test that retention period is enforced when adding outcomes"""
         # Set short retention period
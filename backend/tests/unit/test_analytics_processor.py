@@ -1,6 +1,8 @@
 """Unit tests for analytics processor"""
 import pytest
+import numpy as np
 from datetime import datetime, timedelta, date
+from app.services import analytics_processor
 from app.services.analytics_processor import (
     TrendAnalyzer, 
     VisualizationDataBuilder, 
@@ -108,6 +110,14 @@ class TestTrendAnalyzer:
         assert result['min_temperature'] <= result['max_temperature']
         assert result['data_points'] == 7
 
+    def test_calculate_temperature_trend_unordered_input(self, sample_weather_data_list):
+        """Test temperature trend does not depend on input order"""
+        analyzer = TrendAnalyzer()
+        shuffled = sample_weather_data_list[::2] + sample_weather_data_list[1::2][::-1]
+
+        assert analyzer.calculate_temperature_trend(shuffled) == \
+            analyzer.calculate_temperature_trend(sample_weather_data_list)
+
     def test_calculate_temperature_trend_empty_data(self):
         """Test temperature trend with empty data"""
         analyzer = TrendAnalyzer()
@@ -226,6 +236,32 @@ class TestVisualizationDataBuilder:
         assert len(wind_data['vectors']) > 0
         assert len(wind_data['compass_data']) == 8  # 8 compass directions
 
+    def test_prepare_wind_vector_data_compass_bins(self, sample_weather_data_list):
+        """Test compass sector boundaries, including the wrap back to north"""
+        builder = VisualizationDataBuilder()
+        directions = [0.0, 22.4, 22.5, 180.0, 337.4, 337.5, 359.9]
+        data_list = [
+            data.model_copy(update={'wind_direction': direction})
+            for data, direction in zip(sample_weather_data_list, directions)
+        ]
+        compass = builder.prepare_wind_vector_data(data_list)['compass_data']
+
+        assert compass == {'N': 4, 'NE': 1, 'E': 0, 'SE': 0, 'S': 1, 'SW': 0, 'W': 0, 'NW': 1}
+
+    def test_compass_counts_numba_matches_numpy(self):
+        """Test the Numba kernel bins archive-sized input like the NumPy path"""
+        pytest.importorskip('numba')
+        # Quarter-degree steps are exact in binary, so sector edges land identically
+        directions = np.tile(np.arange(0.0, 360.0, 0.25), 80)
+        assert directions.size > analytics_processor._NUMBA_MIN_SIZE
+
+        expected = np.bincount(np.digitize(directions, analytics_processor._COMPASS_EDGES), minlength=9)
+        expected[0] += expected[8]
+
+        counts = analytics_processor._compass_counts(directions)
+
+        assert counts.tolist() == expected[:8].tolist()
+
     def test_prepare_wind_vector_data_empty(self):
         """Test wind vector data with empty input"""
         builder = VisualizationDataBuilder()
@@ -244,6 +280,19 @@ class TestVisualizationDataBuilder:
         assert len(chart_data.datasets) == 1
         assert 'Humidity' in chart_data.datasets[0]['label']
 
+    def test_chart_labels_match_strftime(self, sample_weather_data_list):
+        """Test that pre-formatted labels match per-timestamp strftime output"""
+        builder = VisualizationDataBuilder()
+        chart_data = builder.prepare_humidity_chart(sample_weather_data_list)
+        comparative = builder.prepare_comparative_chart(sample_weather_data_list, [1.0])
+
+        assert chart_data.labels == [
+            d.timestamp.strftime('%Y-%m-%d %H:%M') for d in sample_weather_data_list
+        ]
+        assert comparative.labels == [
+            d.timestamp.strftime('%Y-%m-%d') for d in sample_weather_data_list
+        ]
+
     def test_prepare_pressure_chart(self, sample_weather_data_list):
         """Test pressure chart preparation"""
         builder = VisualizationDataBuilder()
@@ -415,3 +464,18 @@ class TestAnalyticsProcessor:
         assert 'trends' in result
         assert 'charts' in result
         assert result['trends']['temperature']['data_points'] == 1
+
+    def test_process_weather_analytics_memoizes_results(self, sample_weather_data_list):
+        """Test repeated analytics calls reuse results without sharing containers"""
+        processor = AnalyticsProcessor()
+        first = processor.process_weather_analytics(sample_weather_data_list)
+        first['charts'].pop('temperature')
+
+        second = processor.process_weather_analytics(sample_weather_data_list)
+        assert 'temperature' in second['charts']
+        assert second['trends'] == first['trends']
+
+        changed = [sample_weather_data_list[0].model_copy(update={'temperature': 40.0})]
+        changed += sample_weather_data_list[1:]
+        third = processor.process_weather_analytics(changed)
+        assert third['trends']['temperature'] != second['trends']['temperature']
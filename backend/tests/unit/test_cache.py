@@ -118,6 +118,21 @@ class TestWeatherCache:
         assert removed == 1
         assert cache.get(sample_location) is None
 
+    def test_max_entries_evicts_oldest(self, sample_location, sample_weather_data):
+        """Test the oldest-written entry is evicted when the cache is full"""
+        cache = WeatherCache(max_entries=2)
+        locations = [
+            sample_location.model_copy(update={"latitude": 10.0 + i}) for i in range(3)
+        ]
+
+        for location in locations:
+            cache.set(location, sample_weather_data)
+
+        assert cache.get_cache_stats()["total_entries"] == 2
+        assert cache.get(locations[0]) is None
+        assert cache.get(locations[1]) is not None
+        assert cache.get(locations[2]) is not None
+
 
 class TestCachedWeatherDataCollector:
     """Test CachedWeatherDataCollector class"""
@@ -1,12 +1,14 @@
 """Unit tests for data collector service"""
 import pytest
 import asyncio
+import json
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from app.services.data_collector import (
     WeatherDataCollector,
     APIClient,
-    DataValidator
+    DataValidator,
+    NonRetryableAPIError
 )
 from app.models import Location, WeatherData
 
@@ -48,12 +50,26 @@ class TestAPIClient:
         with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
             mock_response_obj = MagicMock()
             mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_get.return_value = mock_response_obj
 
             result = await client.fetch_current_weather(location)
             assert result is not None
             assert result["main"]["temp"] == 15.5
 
+    @pytest.mark.asyncio
+    async def test_http_client_reused_until_closed(self):
+        """Test the pooled HTTP client is shared across calls and recreated after aclose"""
+        client = APIClient(api_key="test_key")
+
+        first = client._get_client()
+        assert client._get_client() is first
+
+        await client.aclose()
+        assert first.is_closed
+        assert client._get_client() is not first
+        await client.aclose()
+
     @pytest.mark.asyncio
     async def test_fetch_current_weather_no_api_key(self):
         """Test fetch with no API key"""
@@ -84,11 +100,36 @@ class TestAPIClient:
         with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
             mock_response_obj = MagicMock()
             mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_get.return_value = mock_response_obj
 
             result = await client.fetch_forecast(location)
             assert result is not None
 
+    @pytest.mark.asyncio
+    async def test_fetch_responses_cached_and_coalesced(self):
+        """Test concurrent and repeated fetches for one location share a single request"""
+        client = APIClient(api_key="test_key")
+        location = Location(
+            latitude=47.6062,
+            longitude=-122.3321,
+            city="Seattle",
+            country="United States"
+        )
+
+        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
+            mock_response_obj = MagicMock()
+            mock_response_obj.json.return_value = {"list": []}
+            mock_response_obj.content = b'{"list": []}'
+            mock_get.return_value = mock_response_obj
+
+            results = await asyncio.gather(
+                client.fetch_forecast(location), client.fetch_forecast(location)
+            )
+            assert results[0] == results[1] == {"list": []}
+            assert await client.fetch_forecast(location) == {"list": []}
+            assert mock_get.await_count == 1
+
 
 class TestDataValidator:
     """Tests for DataValidator"""
@@ -271,6 +312,24 @@ class TestWeatherDataCollector:
             assert result is not None
             assert call_count == 2  # Should have retried once
 
+    @pytest.mark.asyncio
+    async def test_fetch_weather_data_no_retry_on_client_error(self):
+        """Test a rejected request is not retried"""
+        collector = WeatherDataCollector()
+        location = Location(
+            latitude=47.6062,
+            longitude=-122.3321,
+            city="Seattle",
+            country="United States"
+        )
+
+        with patch.object(collector.api_client, 'fetch_current_weather', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.side_effect = NonRetryableAPIError(401, "Invalid API key")
+
+            result = await collector.fetch_weather_data(location)
+            assert result is None
+            assert mock_fetch.await_count == 1
+
     @pytest.mark.asyncio
     async def test_collect_for_multiple_locations(self):
         """Test collecting data for multiple locations"""
@@ -295,6 +354,86 @@ class TestWeatherDataCollector:
             assert len(results) == 2
             assert all(isinstance(r, WeatherData) for r in results)
 
+    @pytest.mark.asyncio
+    async def test_collect_for_locations_shares_timestamp(self):
+        """Test records collected in one batch share a timestamp"""
+        collector = WeatherDataCollector()
+        locations = [
+            Location(latitude=47.6062, longitude=-122.3321, city="Seattle", country="USA"),
+            Location(latitude=34.0522, longitude=-118.2437, city="Los Angeles", country="USA"),
+        ]
+
+        mock_response = {
+            "main": {"temp": 15.5, "humidity": 65, "pressure": 1013},
+            "wind": {"speed": 5.2, "deg": 180},
+            "clouds": {"all": 40},
+            "weather": [{"main": "Cloudy"}]
+        }
+
+        with patch.object(collector.api_client, 'fetch_current_weather', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = mock_response
+
+            results = await collector.collect_for_locations(locations)
+            assert len(results) == 2
+            assert results[0].timestamp == results[1].timestamp
+            assert results[0].precipitation == 0
+
+    @pytest.mark.asyncio
+    async def test_collect_for_locations_batches_city_ids(self):
+        """Test locations with city IDs are fetched in one group request"""
+        collector = WeatherDataCollector()
+        locations = [
+            Location(latitude=47.6062, longitude=-122.3321, city="Seattle", country="USA", city_id=5809844),
+            Location(latitude=34.0522, longitude=-118.2437, city="Los Angeles", country="USA", city_id=5368361),
+        ]
+
+        def city(city_id, temp):
+            return {
+                "id": city_id,
+                "main": {"temp": temp, "humidity": 65, "pressure": 1013},
+                "wind": {"speed": 5.2, "deg": 180},
+                "clouds": {"all": 40},
+                "weather": [{"main": "Cloudy"}]
+            }
+
+        group_response = {"list": [city(5368361, 22.0), city(5809844, 12.0)]}
+
+        with patch.object(collector.api_client, 'fetch_group_weather', new_callable=AsyncMock) as mock_group, \
+                patch.object(collector.api_client, 'fetch_current_weather', new_callable=AsyncMock) as mock_fetch:
+            mock_group.return_value = group_response
+
+            results = await collector.collect_for_locations(locations)
+            assert mock_group.await_count == 1
+            assert mock_fetch.await_count == 0
+            assert [r.location.city for r in results] == ["Seattle", "Los Angeles"]
+            assert [r.temperature for r in results] == [12.0, 22.0]
+
+    @pytest.mark.asyncio
+    async def test_collect_for_locations_falls_back_when_group_rejected(self):
+        """Test a rejected group request falls back to per-location fetches"""
+        collector = WeatherDataCollector()
+        locations = [
+            Location(latitude=47.6062, longitude=-122.3321, city="Seattle", country="USA", city_id=5809844),
+            Location(latitude=34.0522, longitude=-118.2437, city="Los Angeles", country="USA", city_id=1),
+        ]
+
+        mock_response = {
+            "main": {"temp": 15.5, "humidity": 65, "pressure": 1013},
+            "wind": {"speed": 5.2, "deg": 180},
+            "clouds": {"all": 40},
+            "weather": [{"main": "Cloudy"}]
+        }
+
+        with patch.object(collector.api_client, 'fetch_group_weather', new_callable=AsyncMock) as mock_group, \
+                patch.object(collector.api_client, 'fetch_current_weather', new_callable=AsyncMock) as mock_fetch:
+            mock_group.side_effect = NonRetryableAPIError(404, "city not found")
+            mock_fetch.return_value = mock_response
+
+            results = await collector.collect_for_locations(locations)
+            assert mock_group.await_count == 1
+            assert mock_fetch.await_count == 2
+            assert [r.location.city for r in results] == ["Seattle", "Los Angeles"]
+
     def test_parse_weather_data(self):
         """Test parsing raw API response to WeatherData"""
         collector = WeatherDataCollector()
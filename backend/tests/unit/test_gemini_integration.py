@@ -1,5 +1,7 @@
 """Unit tests for Gemini LLM integration"""
+import hashlib
 import pytest
+import time
 from datetime import datetime, date, timedelta
 from app.services.gemini_integration import (
     GeminiClient,
@@ -90,6 +92,14 @@ class TestPromptBuilder:
         assert isinstance(prompt, str)
         assert len(prompt) > 0
 
+    def test_build_forecast_summary_prompt_reused(self, sample_forecasts):
+        """Test identical forecasts reuse the cached prompt"""
+        builder = PromptBuilder()
+        first = builder.build_forecast_summary_prompt(sample_forecasts)
+        second = PromptBuilder().build_forecast_summary_prompt(list(sample_forecasts))
+        
+        assert second is first
+
     def test_build_weather_explanation_prompt(self, sample_weather_data, sample_forecasts):
         """Test building weather explanation prompt"""
         builder = PromptBuilder()
@@ -308,6 +318,27 @@ class TestGeminiClient:
         assert isinstance(client.request_queue, list)
         assert len(client.request_queue) == 0
 
+    def test_rate_limit_sliding_window(self):
+        """Test rate limiting only applies once the per-minute budget is used"""
+        client = GeminiClient()
+        now = time.monotonic()
+        
+        client._request_times.extend([now - 120] * client.max_requests_per_minute)
+        assert client._is_rate_limited() is False
+        
+        client._request_times.extend([now] * client.max_requests_per_minute)
+        assert client._is_rate_limited() is True
+
+    def test_cached_response_reused(self):
+        """Test an identical prompt is answered from the response cache"""
+        client = GeminiClient(api_key="test_key")
+        prompt = "Answer the following weather-related question"
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        client._cache_response(key, "Cached answer")
+        
+        assert client._call_gemini_api(prompt) == "Cached answer"
+        assert len(client._request_times) == 0
+
     def test_simulated_api_calls(self, sample_forecasts):
         """Test that simulated API calls work without real API key"""
         client = GeminiClient(api_key=None)
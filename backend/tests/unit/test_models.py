@@ -461,3 +461,11 @@ class TestChartData:
             datasets=[]
         )
         assert len(chart.labels) == 0
+
+    def test_fast_dump_matches_model_dump(self):
+        """Test fast_dump produces the same dict as model_dump"""
+        chart = ChartData(
+            labels=["2024-01-15"],
+            datasets=[{"label": "Temperature", "data": [15.5], "color": "#0066CC"}]
+        )
+        assert chart.fast_dump() == chart.model_dump()
@@ -72,6 +72,39 @@ class TestFeatureExtractor:
         features = extractor.extract_batch_features(weather_data_list)
         assert features.shape == (5, 10)
 
+    def test_extract_batch_features_soa_matches_objects(self):
+        """Test column-based extraction matches extraction from model objects"""
+        extractor = FeatureExtractor()
+        location = Location(
+            latitude=47.6062,
+            longitude=-122.3321,
+            city="Seattle",
+            country="United States"
+        )
+
+        weather_data_list = [
+            WeatherData(
+                location=location,
+                timestamp=datetime.now(),
+                temperature=15.5 + i,
+                humidity=65 - i,
+                pressure=1013,
+                wind_speed=5.2,
+                wind_direction=180,
+                precipitation=0.5 * i,
+                cloud_cover=40,
+                weather_condition="Cloudy"
+            )
+            for i in range(5)
+        ]
+
+        records = extractor.to_records(weather_data_list)
+        features = extractor.extract_batch_features_soa(records)
+        assert features.shape == (5, 10)
+        np.testing.assert_array_equal(
+            features[:, :7], extractor.extract_batch_features(weather_data_list)[:, :7]
+        )
+
     def test_normalize_features_with_fit(self):
         """Test normalizing features with fitting"""
         extractor = FeatureExtractor()
@@ -103,6 +136,22 @@ class TestFeatureExtractor:
         normalized = extractor.normalize_features(new_features, fit=False)
         assert normalized.shape == (1, 10)
 
+    def test_fast_transform_matches_scaler(self):
+        """Test the precomputed affine transform matches StandardScaler.transform"""
+        extractor = FeatureExtractor()
+        features = np.array([
+            [15.5, 65, 1013, 5.2, 180, 0, 40, 12, 15, 1],
+            [16.0, 70, 1012, 5.5, 185, 0.5, 45, 13, 15, 1],
+            [14.0, 60, 1015, 4.0, 170, 1.0, 30, 14, 16, 1],
+        ])
+        extractor.normalize_features(features, fit=True)
+
+        new_features = np.array([[15.0, 62, 1013.5, 5.0, 180, 0, 40, 12, 15, 1]])
+        np.testing.assert_allclose(
+            extractor.fast_transform(new_features),
+            extractor.scaler.transform(new_features)
+        )
+
 
 class TestWeatherPredictor:
     """Tests for WeatherPredictor"""
@@ -203,6 +252,53 @@ class TestWeatherPredictor:
         # Default forecasts should have low confidence
         assert all(f.confidence_score == 0.5 for f in forecasts)
 
+    def test_predict_many_keeps_location_order(self):
+        """Test forecasting several locations returns one list per location in order"""
+        predictor = WeatherPredictor()
+        locations = [
+            Location(latitude=47.6062, longitude=-122.3321, city="Seattle", country="United States"),
+            Location(latitude=34.0522, longitude=-118.2437, city="Los Angeles", country="United States"),
+            Location(latitude=40.7128, longitude=-74.0060, city="New York", country="United States"),
+        ]
+
+        results = predictor.predict_many(locations, days=3)
+        assert len(results) == 3
+        for location, forecasts in zip(locations, results):
+            assert len(forecasts) == 3
+            assert all(f.location == location for f in forecasts)
+
+    def test_predict_many_reproducible_with_seed(self):
+        """Test predict_many gives the same forecasts for the same seed regardless of threads"""
+        predictor = WeatherPredictor()
+        location = Location(latitude=47.6062, longitude=-122.3321, city="Seattle", country="United States")
+        weather_data_list = [
+            WeatherData(
+                location=location,
+                timestamp=datetime.now() - timedelta(days=i),
+                temperature=15.0 + i * 0.1,
+                humidity=65.0,
+                pressure=1013.0,
+                wind_speed=5.0,
+                wind_direction=180.0,
+                precipitation=0.5,
+                cloud_cover=40.0,
+                weather_condition="Cloudy"
+            )
+            for i in range(20)
+        ]
+        predictor.train(weather_data_list, np.linspace(14.0, 18.0, 20))
+        locations = [
+            location.model_copy(update={"latitude": 40.0 + i}) for i in range(4)
+        ]
+
+        predictor._rng = np.random.default_rng(7)
+        first = predictor.predict_many(locations, days=3)
+        predictor._rng = np.random.default_rng(7)
+        second = predictor.predict_many(locations, days=3)
+
+        assert [[f.predicted_temperature_high for f in forecasts] for forecasts in first] == \
+            [[f.predicted_temperature_high for f in forecasts] for forecasts in second]
+
     def test_predict_with_training(self):
         """Test prediction after training"""
         predictor = WeatherPredictor()
@@ -322,6 +418,15 @@ class TestWeatherPredictor:
         assert predictor._determine_weather_condition(15, 10, 10) == "Rainy"
         assert predictor._determine_weather_condition(15, 10, 2) == "Drizzle"
 
+    def test_determine_weather_conditions_batch(self):
+        """Test batch condition labels match the scalar rules"""
+        predictor = WeatherPredictor()
+        temps_high = np.array([35.0, 25.0, 15.0, -5.0, 15.0, 15.0])
+        precipitation = np.array([0.0, 0.0, 0.0, 10.0, 10.0, 2.0])
+
+        conditions = predictor._determine_weather_conditions(temps_high, precipitation)
+        assert conditions == ["Sunny", "Partly Cloudy", "Cloudy", "Snow", "Rainy", "Drizzle"]
+
     def test_get_model_info(self):
         """Test getting model information"""
         predictor = WeatherPredictor(model_type="random_forest")
@@ -368,3 +473,122 @@ class TestWeatherPredictor:
         predictor.update_model(new_data, new_targets)
 
         assert predictor.is_trained is True
+
+    def test_update_model_grows_existing_ensemble(self):
+        """Test an update keeps the fitted trees and adds new ones"""
+        predictor = WeatherPredictor()
+        location = Location(
+            latitude=47.6062,
+            longitude=-122.3321,
+            city="Seattle",
+            country="United States"
+        )
+        rng = np.random.default_rng(0)
+        weather_data_list = [
+            WeatherData(
+                location=location,
+                timestamp=datetime.now() - timedelta(days=i),
+                temperature=15.5 + rng.standard_normal(),
+                humidity=65 + rng.standard_normal() * 5,
+                pressure=1013 + rng.standard_normal(),
+                wind_speed=5.2 + rng.standard_normal(),
+                wind_direction=180 + rng.standard_normal() * 30,
+                precipitation=rng.random(),
+                cloud_cover=40 + rng.standard_normal() * 10,
+                weather_condition="Cloudy"
+            )
+            for i in range(25)
+        ]
+        targets = 16.0 + rng.standard_normal(25)
+
+        predictor.train(weather_data_list[:20], targets[:20])
+        first_tree = predictor.model.estimators_[0]
+        tree_count = len(predictor.model.estimators_)
+
+        predictor.update_model(weather_data_list[20:], targets[20:])
+        assert predictor.is_trained is True
+        assert len(predictor.model.estimators_) == tree_count + 20
+        assert predictor.model.estimators_[0] is first_tree
+
+    def test_update_model_refits_on_symmetric_drift(self):
+        """Test an update spread far on both sides of the fitted mean refits from scratch"""
+        predictor = WeatherPredictor()
+        location = Location(
+            latitude=47.6062,
+            longitude=-122.3321,
+            city="Seattle",
+            country="United States"
+        )
+        rng = np.random.default_rng(0)
+        weather_data_list = [
+            WeatherData(
+                location=location,
+                timestamp=datetime.now() - timedelta(days=i),
+                temperature=15.5 + rng.standard_normal(),
+                humidity=65 + rng.standard_normal() * 5,
+                pressure=1013 + rng.standard_normal(),
+                wind_speed=5.2 + rng.standard_normal(),
+                wind_direction=180 + rng.standard_normal() * 30,
+                precipitation=rng.random(),
+                cloud_cover=40 + rng.standard_normal() * 10,
+                weather_condition="Cloudy"
+            )
+            for i in range(20)
+        ]
+        predictor.train(weather_data_list, 16.0 + rng.standard_normal(20))
+        first_tree = predictor.model.estimators_[0]
+
+        # Pressure swings far above and below the fitted mean, averaging out to it
+        new_data = [
+            data.model_copy(update={"pressure": 1013 + (40 if i % 2 else -40)})
+            for i, data in enumerate(weather_data_list[:6])
+        ]
+        predictor.update_model(new_data, 16.0 + rng.standard_normal(6))
+
+        assert predictor.is_trained is True
+        assert predictor.model.estimators_[0] is not first_tree
+        assert len(predictor.model.estimators_) == predictor._ensemble_size(26)["n_estimators"]
+
+    def test_forest_size_scales_with_training_data(self):
+        """Test small training sets get a smaller, shallower forest"""
+        predictor = WeatherPredictor(model_type="random_forest")
+
+        assert predictor._ensemble_size(20) == {"n_estimators": 20, "max_depth": 6}
+        assert predictor._ensemble_size(100_000) == {"n_estimators": 100, "max_depth": 15}
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        """Test a saved predictor loads trained and able to forecast"""
+        predictor = WeatherPredictor()
+        location = Location(
+            latitude=47.6062,
+            longitude=-122.3321,
+            city="Seattle",
+            country="United States"
+        )
+        rng = np.random.default_rng(0)
+        weather_data_list = [
+            WeatherData(
+                location=location,
+                timestamp=datetime.now() - timedelta(days=i),
+                temperature=15.5 + rng.standard_normal(),
+                humidity=65 + rng.standard_normal() * 5,
+                pressure=1013 + rng.standard_normal(),
+                wind_speed=5.2 + rng.standard_normal(),
+                wind_direction=180 + rng.standard_normal() * 30,
+                precipitation=rng.random(),
+                cloud_cover=40 + rng.standard_normal() * 10,
+                weather_condition="Cloudy"
+            )
+            for i in range(20)
+        ]
+        predictor.train(weather_data_list, 16.0 + rng.standard_normal(20))
+
+        path = tmp_path / "predictor.joblib"
+        predictor.save(str(path))
+        loaded = WeatherPredictor.load(str(path))
+
+        assert loaded.is_trained is True
+        assert loaded.feature_extractor.is_fitted is True
+        forecasts = loaded.predict(location, days=3)
+        assert len(forecasts) == 3
+        assert all(f.confidence_score >= 0.5 for f in forecasts)
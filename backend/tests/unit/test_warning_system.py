@@ -1,4 +1,5 @@
 """Unit tests for weather warning system"""
+import uuid
 import pytest
 from datetime import datetime, timedelta
 from app.models import WeatherData, Forecast, Location, WeatherWarning
@@ -22,6 +23,13 @@ class TestSeverityClassifier:
         assert self.classifier.wind_thresholds[SeverityLevel.HIGH] == 20.0
         assert self.classifier.precipitation_thresholds[SeverityLevel.MODERATE] == 25.0
 
+    def test_thresholds_are_read_only(self):
+        """Test thresholds cannot be changed after the search bounds are derived"""
+        with pytest.raises(TypeError):
+            self.classifier.heat_thresholds[SeverityLevel.LOW] = 20.0
+        with pytest.raises(TypeError):
+            self.classifier.wind_thresholds[SeverityLevel.LOW] = 5.0
+
     def test_classify_temperature_severity_heat(self):
         """Test temperature severity classification for heat"""
         # No warning
@@ -53,6 +61,12 @@ class TestSeverityClassifier:
         # Severe cold warning
         assert self.classifier.classify_temperature_severity(-35.0) == SeverityLevel.SEVERE
 
+    def test_classify_temperature_severity_normal_range(self):
+        """Test temperatures between the cold and heat thresholds need no warning"""
+        for temperature in (0.1, 15.0, 29.9, float('nan')):
+            assert self.classifier.classify_temperature_severity(temperature) is None
+        assert list(self.classifier.classify_temperature_severity_batch([0.1, 15.0, float('nan')])) == [0, 0, 0]
+
     def test_classify_wind_severity(self):
         """Test wind severity classification"""
         # No warning
@@ -87,6 +101,49 @@ class TestSeverityClassifier:
         # Severe precipitation warning
         assert self.classifier.classify_precipitation_severity(120.0) == SeverityLevel.SEVERE
 
+    def test_batch_classification_matches_scalar(self):
+        """Test batch classifiers agree with the scalar classifiers"""
+        levels = [None, SeverityLevel.LOW, SeverityLevel.MODERATE, SeverityLevel.HIGH, SeverityLevel.SEVERE]
+        temperatures = [-25.0, -20.0, -12.0, -5.0, 0.0, 20.0, 30.0, 34.9, 35.0, 45.0]
+        winds = [0.0, 10.0, 15.0, 20.0, 25.5, 40.0]
+        precipitation = [0.0, 20.0, 45.0, 50.0, 99.9, 120.0]
+
+        temp_codes = self.classifier.classify_temperature_severity_batch(temperatures)
+        wind_codes = self.classifier.classify_wind_severity_batch(winds)
+        precip_codes = self.classifier.classify_precipitation_severity_batch(precipitation)
+
+        assert [levels[c] for c in temp_codes] == [
+            self.classifier.classify_temperature_severity(t) for t in temperatures
+        ]
+        assert [levels[c] for c in wind_codes] == [
+            self.classifier.classify_wind_severity(w) for w in winds
+        ]
+        assert [levels[c] for c in precip_codes] == [
+            self.classifier.classify_precipitation_severity(p) for p in precipitation
+        ]
+
+    def test_classify_batch_matches_individual_batches(self):
+        """Test combined batch classification matches per-field batches"""
+        temperatures = [-35.0, -5.0, 20.0, 33.0, 47.0]
+        winds = [5.0, 12.0, 18.0, 22.0, 30.0]
+        precipitation = [0.0, 12.0, 30.0, 60.0, 150.0]
+
+        temp_codes, wind_codes, precip_codes = self.classifier.classify_batch(
+            temperatures, winds, precipitation
+        )
+
+        assert list(temp_codes) == list(self.classifier.classify_temperature_severity_batch(temperatures))
+        assert list(wind_codes) == list(self.classifier.classify_wind_severity_batch(winds))
+        assert list(precip_codes) == list(self.classifier.classify_precipitation_severity_batch(precipitation))
+
+    def test_nan_wind_and_precipitation_need_no_warning(self):
+        """Test NaN wind speed or precipitation is not classified as severe"""
+        nan = float('nan')
+        assert self.classifier.classify_wind_severity(nan) is None
+        assert self.classifier.classify_precipitation_severity(nan) is None
+        assert list(self.classifier.classify_wind_severity_batch([nan, 30.0])) == [0, 4]
+        assert list(self.classifier.classify_precipitation_severity_batch([nan, 120.0])) == [0, 4]
+
     def test_classify_overall_severity(self):
         """Test overall severity classification"""
         location = Location(latitude=40.7128, longitude=-74.0060, city='New York', country='USA')
@@ -154,6 +211,28 @@ class TestSafetyRecommendations:
         assert len(severe_recommendations) > len(recommendations)
         assert any("air-conditioned" in rec.lower() for rec in severe_recommendations)
 
+    def test_recommendations_are_independent_lists(self):
+        """Test callers get lists they can modify without affecting later calls"""
+        first = self.safety.get_recommendations(WarningType.FLOOD, SeverityLevel.HIGH)
+        assert isinstance(first, list)
+        first.append("Extra advice")
+        second = self.safety.get_recommendations(WarningType.FLOOD, SeverityLevel.HIGH)
+        assert "Extra advice" not in second
+
+        fallback = self.safety.get_recommendations(WarningType.AIR_QUALITY, SeverityLevel.LOW)
+        assert isinstance(fallback, list)
+        assert len(fallback) > 0
+
+    def test_recurring_recommendations_share_one_string(self):
+        """Test identical recommendation text is a single shared string object"""
+        storm = self.safety.get_recommendations(WarningType.STORM, SeverityLevel.HIGH)
+        wind = self.safety.get_recommendations(WarningType.WIND, SeverityLevel.SEVERE)
+        fallback = self.safety.get_recommendations(WarningType.AIR_QUALITY, SeverityLevel.LOW)
+        text = "Have emergency supplies ready"
+        shared = [r for recs in (storm, wind, fallback) for r in recs if r == text]
+        assert len(shared) == 3
+        assert all(r is shared[0] for r in shared)
+
     def test_get_wind_recommendations(self):
         """Test wind warning recommendations"""
         recommendations = self.safety.get_recommendations(WarningType.WIND, SeverityLevel.HIGH)
@@ -186,6 +265,18 @@ class TestWarningGenerator:
         assert self.generator.severity_classifier is not None
         assert self.generator.safety_recommendations is not None
 
+    def test_generators_share_classifier_and_recommendations(self):
+        """Test generator instances reuse the module-level lookup tables"""
+        other = WarningGenerator()
+        assert other.severity_classifier is self.generator.severity_classifier
+        assert other.safety_recommendations is self.generator.safety_recommendations
+
+        # Shared state cannot be modified through one generator
+        with pytest.raises(TypeError):
+            other.safety_recommendations.recommendations[WarningType.HEAT][SeverityLevel.LOW] = ()
+        with pytest.raises(TypeError):
+            other.severity_classifier.precipitation_thresholds[SeverityLevel.LOW] = 1.0
+
     def test_analyze_current_conditions_heat_warning(self):
         """Test analysis of current conditions for heat warning"""
         hot_conditions = WeatherData(
@@ -307,6 +398,33 @@ class TestWarningGenerator:
         flood_warnings = [w for w in warnings if w.warning_type == WarningType.FLOOD.value]
         assert len(flood_warnings) >= 1
 
+    def test_analyze_forecasts_batch_matches_single(self):
+        """Test batch forecast analysis matches analyzing each forecast"""
+        forecasts = [
+            Forecast(
+                location=self.location,
+                forecast_date=datetime.now().date() + timedelta(days=i),
+                predicted_temperature_high=high,
+                predicted_temperature_low=high - 8.0,
+                precipitation_probability=prob,
+                weather_condition='Mixed',
+                confidence_score=0.80,
+                generated_at=datetime.now()
+            )
+            for i, (high, prob) in enumerate([(38.0, 0.9), (22.0, 0.1), (31.0, 0.5), (20.0, 0.95)])
+        ]
+
+        batch = self.generator.analyze_forecasts_batch(forecasts)
+        single = [w for f in forecasts for w in self.generator.analyze_forecast(f)]
+
+        assert [(w.warning_type, w.severity) for w in batch] == \
+            [(w.warning_type, w.severity) for w in single]
+        assert self.generator.analyze_forecasts_batch([]) == []
+
+        grouped = self.generator.analyze_forecasts(forecasts)
+        assert [[(w.warning_type, w.severity) for w in group] for group in grouped] == \
+            [[(w.warning_type, w.severity) for w in self.generator.analyze_forecast(f)] for f in forecasts]
+
     def test_classify_severity(self):
         """Test severity classification method"""
         conditions = WeatherData(
@@ -393,6 +511,27 @@ class TestWarningGenerator:
         assert warning.start_time <= warning.end_time
         assert warning.issued_at is not None
 
+    def test_analysis_pass_shares_issue_time(self):
+        """Test warnings from one pass share an issue time and get distinct UUIDs"""
+        conditions = WeatherData(
+            location=self.location,
+            timestamp=datetime.now(),
+            temperature=40.0,
+            humidity=60.0,
+            pressure=1013.0,
+            wind_speed=22.0,
+            wind_direction=180.0,
+            precipitation=60.0,
+            cloud_cover=90.0,
+            weather_condition='Stormy'
+        )
+
+        warnings = self.generator.analyze_current_conditions(conditions)
+        assert len(warnings) == 3
+        assert len({w.issued_at for w in warnings}) == 1
+        assert len({w.warning_id for w in warnings}) == 3
+        assert all(uuid.UUID(w.warning_id).version == 4 for w in warnings)
+
     def test_no_warnings_for_normal_conditions(self):
         """Test that no warnings are generated for normal conditions"""
         normal_conditions = WeatherData(